@@ -0,0 +1,44 @@
+"""Add bookings.updated_at and booking_tombstones for delta sync
+
+Revision ID: a9d3f17b6c42
+Revises: f4c6d9e2a871
+Create Date: 2026-10-19 22:08:51.377940
+
+``GET /bookings/changes`` reads bookings by ``(user_id, updated_at)`` and
+deletions from ``booking_tombstones``. The column default is constant for the
+``ALTER TABLE``, so PostgreSQL adds it without rewriting the partitions;
+existing rows all get the migration time and are sent once on a client's first
+sync. The index is created on the partitioned parent, which builds it on every
+partition.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d3f17b6c42'
+down_revision: Union[str, None] = 'f4c6d9e2a871'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('bookings', sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False))
+    op.create_index('ix_bookings_user_id_updated_at', 'bookings', ['user_id', 'updated_at'], unique=False)
+
+    op.create_table('booking_tombstones',
+    sa.Column('booking_id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('booking_id')
+    )
+    op.create_index('ix_booking_tombstones_user_id_deleted_at', 'booking_tombstones', ['user_id', 'deleted_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_booking_tombstones_user_id_deleted_at', table_name='booking_tombstones')
+    op.drop_table('booking_tombstones')
+    op.drop_index('ix_bookings_user_id_updated_at', table_name='bookings')
+    op.drop_column('bookings', 'updated_at')
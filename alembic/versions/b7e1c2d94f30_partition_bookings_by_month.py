@@ -0,0 +1,148 @@
+"""Partition bookings by month on start_time
+
+Revision ID: b7e1c2d94f30
+Revises: a54d75437c11
+Create Date: 2026-10-19 09:12:44.118302
+
+Turns ``bookings`` into a table range-partitioned by month on ``start_time``.
+Partitions are named ``bookings_pYYYY_MM``; a ``bookings_default`` partition
+catches rows beyond the pre-created horizon and
+``bookings_create_partitions()`` moves them into a proper partition once it
+exists. PostgreSQL requires the partition key in every unique constraint, so the
+primary key becomes ``(id, start_time)`` and ``reviews.booking_id`` can no longer
+be a foreign key; ``ReviewService`` already checks the booking exists.
+
+PostgreSQL only: the migration is a no-op on other dialects.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e1c2d94f30'
+down_revision: Union[str, None] = 'a54d75437c11'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 12
+
+CREATE_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION bookings_create_partitions(from_month date, months_ahead integer)
+RETURNS integer
+LANGUAGE plpgsql AS $$
+DECLARE
+    month_start date := date_trunc('month', from_month)::date;
+    last_month date := (date_trunc('month', now()) + make_interval(months => months_ahead))::date;
+    month_end date;
+    lower_bound timestamptz;
+    upper_bound timestamptz;
+    partition_name text;
+    created integer := 0;
+BEGIN
+    WHILE month_start <= last_month LOOP
+        month_end := (month_start + interval '1 month')::date;
+        partition_name := format('bookings_p%s', to_char(month_start, 'YYYY_MM'));
+        lower_bound := month_start::timestamp AT TIME ZONE 'UTC';
+        upper_bound := month_end::timestamp AT TIME ZONE 'UTC';
+
+        IF to_regclass(partition_name) IS NULL THEN
+            -- Rows for this month may already sit in the default partition;
+            -- move them across before attaching or ATTACH would fail.
+            EXECUTE format('CREATE TABLE %I (LIKE bookings INCLUDING DEFAULTS INCLUDING CONSTRAINTS)', partition_name);
+            EXECUTE format(
+                'WITH moved AS (DELETE FROM bookings_default WHERE start_time >= %L AND start_time < %L RETURNING *) '
+                'INSERT INTO %I SELECT * FROM moved',
+                lower_bound, upper_bound, partition_name
+            );
+            EXECUTE format(
+                'ALTER TABLE bookings ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                partition_name, lower_bound, upper_bound
+            );
+            created := created + 1;
+        END IF;
+
+        month_start := month_end;
+    END LOOP;
+    RETURN created;
+END $$
+"""
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_constraint('reviews_booking_id_fkey', 'reviews', type_='foreignkey')
+    op.rename_table('bookings', 'bookings_legacy')
+    op.execute('ALTER TABLE bookings_legacy RENAME CONSTRAINT bookings_pkey TO bookings_legacy_pkey')
+    op.drop_index('ix_bookings_end_time', table_name='bookings_legacy')
+    op.drop_index('ix_bookings_id', table_name='bookings_legacy')
+    op.drop_index('ix_bookings_start_time', table_name='bookings_legacy')
+
+    op.execute("""
+        CREATE TABLE bookings (
+            id UUID NOT NULL,
+            user_id UUID NOT NULL REFERENCES users (id),
+            service_id UUID NOT NULL REFERENCES services (id),
+            start_time TIMESTAMP WITH TIME ZONE NOT NULL,
+            end_time TIMESTAMP WITH TIME ZONE NOT NULL,
+            status bookingstatus NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+            CONSTRAINT bookings_pkey PRIMARY KEY (id, start_time)
+        ) PARTITION BY RANGE (start_time)
+    """)
+    op.execute('CREATE TABLE bookings_default PARTITION OF bookings DEFAULT')
+    op.create_index('ix_bookings_id', 'bookings', ['id'], unique=False)
+    op.create_index('ix_bookings_start_time', 'bookings', ['start_time'], unique=False)
+    op.create_index('ix_bookings_end_time', 'bookings', ['end_time'], unique=False)
+
+    op.execute(CREATE_PARTITIONS_FUNCTION)
+    op.execute(sa.text(
+        "SELECT bookings_create_partitions("
+        "COALESCE((SELECT min(start_time) FROM bookings_legacy), now())::date, :months_ahead)"
+    ).bindparams(months_ahead=MONTHS_AHEAD))
+
+    op.execute(
+        'INSERT INTO bookings (id, user_id, service_id, start_time, end_time, status, created_at) '
+        'SELECT id, user_id, service_id, start_time, end_time, status, created_at FROM bookings_legacy'
+    )
+    op.drop_table('bookings_legacy')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute('ALTER TABLE bookings RENAME TO bookings_partitioned')
+    op.execute('ALTER TABLE bookings_partitioned RENAME CONSTRAINT bookings_pkey TO bookings_partitioned_pkey')
+    op.drop_index('ix_bookings_id', table_name='bookings_partitioned')
+    op.drop_index('ix_bookings_start_time', table_name='bookings_partitioned')
+    op.drop_index('ix_bookings_end_time', table_name='bookings_partitioned')
+
+    op.create_table('bookings',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('service_id', sa.UUID(), nullable=False),
+    sa.Column('start_time', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('end_time', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('status', postgresql.ENUM('PENDING', 'CONFIRMED', 'CANCELLED', 'COMPLETED', name='bookingstatus', create_type=False), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['service_id'], ['services.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_bookings_end_time'), 'bookings', ['end_time'], unique=False)
+    op.create_index(op.f('ix_bookings_id'), 'bookings', ['id'], unique=False)
+    op.create_index(op.f('ix_bookings_start_time'), 'bookings', ['start_time'], unique=False)
+
+    # Archived partitions were detached and are not copied back
+    op.execute(
+        'INSERT INTO bookings (id, user_id, service_id, start_time, end_time, status, created_at) '
+        'SELECT id, user_id, service_id, start_time, end_time, status, created_at FROM bookings_partitioned'
+    )
+    op.execute('DROP TABLE bookings_partitioned CASCADE')
+    op.execute('DROP FUNCTION IF EXISTS bookings_create_partitions(date, integer)')
+    op.create_foreign_key('reviews_booking_id_fkey', 'reviews', 'bookings', ['booking_id'], ['id'])
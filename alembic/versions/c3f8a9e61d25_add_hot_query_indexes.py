@@ -0,0 +1,51 @@
+"""Add indexes for hot booking queries and drop redundant PK indexes
+
+Revision ID: c3f8a9e61d25
+Revises: b7e1c2d94f30
+Create Date: 2026-10-19 11:40:02.551873
+
+The ``ix_*_id`` indexes duplicate the primary key indexes. The new indexes
+match the predicates of ``BookingService._has_conflict`` (service_id, status,
+start_time, end_time), ``ServiceService.delete_service`` and the per-user
+``GET /bookings`` listing. ``reviews.booking_id`` is already covered by its
+unique constraint. Run ``python -m benchmarks.check_indexes`` to confirm the
+planner uses them.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f8a9e61d25'
+down_revision: Union[str, None] = 'b7e1c2d94f30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE_STATUSES = sa.text("status IN ('PENDING', 'CONFIRMED')")
+
+
+def upgrade() -> None:
+    op.drop_index('ix_services_id', table_name='services')
+    op.drop_index('ix_users_id', table_name='users')
+    op.drop_index('ix_bookings_id', table_name='bookings')
+    op.drop_index('ix_reviews_id', table_name='reviews')
+
+    op.create_index('ix_bookings_service_id_start_time', 'bookings', ['service_id', 'start_time'], unique=False)
+    op.create_index('ix_bookings_user_id_start_time', 'bookings', ['user_id', 'start_time'], unique=False)
+    op.create_index(
+        'ix_bookings_active_service_slot', 'bookings', ['service_id', 'start_time', 'end_time'], unique=False,
+        postgresql_where=ACTIVE_STATUSES, sqlite_where=ACTIVE_STATUSES
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_bookings_active_service_slot', table_name='bookings')
+    op.drop_index('ix_bookings_user_id_start_time', table_name='bookings')
+    op.drop_index('ix_bookings_service_id_start_time', table_name='bookings')
+
+    op.create_index('ix_reviews_id', 'reviews', ['id'], unique=False)
+    op.create_index('ix_bookings_id', 'bookings', ['id'], unique=False)
+    op.create_index('ix_users_id', 'users', ['id'], unique=False)
+    op.create_index('ix_services_id', 'services', ['id'], unique=False)
@@ -0,0 +1,57 @@
+"""Add booking_daily_stats summary table
+
+Revision ID: d5a2e7c40b18
+Revises: c3f8a9e61d25
+Create Date: 2026-10-19 16:05:37.402118
+
+Per service and UTC day counters behind ``/api/v1/admin/stats``, maintained
+by ``BookingStatsService`` as bookings change. On PostgreSQL the table is
+filled from existing bookings here; elsewhere run
+``python -m app.booking_stats rebuild`` once after upgrading.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a2e7c40b18'
+down_revision: Union[str, None] = 'c3f8a9e61d25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL = """
+INSERT INTO booking_daily_stats (day, service_id, bookings, cancelled, completed, booked_minutes, revenue)
+SELECT (b.start_time AT TIME ZONE 'UTC')::date,
+       b.service_id,
+       count(*),
+       count(*) FILTER (WHERE b.status = 'CANCELLED'),
+       count(*) FILTER (WHERE b.status = 'COMPLETED'),
+       coalesce(sum(extract(epoch FROM b.end_time - b.start_time) / 60)
+                FILTER (WHERE b.status <> 'CANCELLED'), 0)::integer,
+       coalesce(sum(s.price) FILTER (WHERE b.status = 'COMPLETED'), 0)
+FROM bookings b
+JOIN services s ON s.id = b.service_id
+GROUP BY 1, 2
+"""
+
+
+def upgrade() -> None:
+    op.create_table('booking_daily_stats',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('service_id', sa.UUID(), nullable=False),
+    sa.Column('bookings', sa.Integer(), nullable=False),
+    sa.Column('cancelled', sa.Integer(), nullable=False),
+    sa.Column('completed', sa.Integer(), nullable=False),
+    sa.Column('booked_minutes', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.ForeignKeyConstraint(['service_id'], ['services.id'], ),
+    sa.PrimaryKeyConstraint('day', 'service_id')
+    )
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    op.drop_table('booking_daily_stats')
@@ -0,0 +1,33 @@
+"""Add cache_generations for cross-worker cache invalidation
+
+Revision ID: e81f3b6c9a47
+Revises: d5a2e7c40b18
+Create Date: 2026-10-19 18:22:10.913554
+
+One counter per in-process cache, bumped by ``InvalidationBus.publish`` next
+to its ``pg_notify``. Workers compare generations periodically and after
+reconnecting, so caches converge even when a notification was missed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e81f3b6c9a47'
+down_revision: Union[str, None] = 'd5a2e7c40b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('cache_generations',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('generation', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('cache_generations')
@@ -0,0 +1,47 @@
+"""Add outbox_events for booking and review events
+
+Revision ID: f4c6d9e2a871
+Revises: e81f3b6c9a47
+Create Date: 2026-10-19 20:41:37.205118
+
+Events are inserted in the same transaction as the booking or review change
+and delivered afterwards by ``app.outbox_worker``. The partial index on
+``available_at`` covers only undelivered rows, so claiming a batch stays cheap
+however many delivered rows are waiting to be purged.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4c6d9e2a871'
+down_revision: Union[str, None] = 'e81f3b6c9a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('outbox_events',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('event_type', sa.String(length=50), nullable=False),
+    sa.Column('aggregate_id', sa.UUID(), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('available_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('delivered_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_outbox_events_pending', 'outbox_events', ['available_at'], unique=False,
+                    postgresql_where=sa.text('delivered_at IS NULL'))
+    op.create_index('ix_outbox_events_delivered_at', 'outbox_events', ['delivered_at'], unique=False,
+                    postgresql_where=sa.text('delivered_at IS NOT NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_events_delivered_at', table_name='outbox_events')
+    op.drop_index('ix_outbox_events_pending', table_name='outbox_events')
+    op.drop_table('outbox_events')
@@ -0,0 +1,52 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from uuid import UUID
+from datetime import date, datetime, timedelta, timezone
+from app.config.database import get_db
+from app.core.routing import SessionReleasingRoute
+from app.schemas.stats import DailyServiceStats, ServiceStats
+from app.services.stats_service import BookingStatsService
+from app.core.auth import require_admin
+from app.core.login_guard import get_login_guard
+from app.core.serialization import list_response
+from app.models.user import User
+
+router = APIRouter(prefix="/admin/stats", tags=["admin"], route_class=SessionReleasingRoute)
+
+DEFAULT_RANGE_DAYS = 30
+
+def _date_range(start: Optional[date], end: Optional[date]):
+    end = end or datetime.now(timezone.utc).date()
+    start = start or end - timedelta(days=DEFAULT_RANGE_DAYS - 1)
+    return start, end
+
+@router.get("/daily", response_model=List[DailyServiceStats])
+def get_daily_stats(
+    start: Optional[date] = Query(None, alias="from"),
+    end: Optional[date] = Query(None, alias="to"),
+    service_id: Optional[UUID] = None,
+    db: Session = Depends(get_db),
+    current_admin: User = Depends(require_admin)
+):
+    """Bookings, utilisation, revenue and cancellation rate per service per day (UTC), both ends inclusive."""
+    start, end = _date_range(start, end)
+    rows = BookingStatsService(db).daily(start, end, service_id)
+    return list_response(DailyServiceStats, rows)
+
+@router.get("/services", response_model=List[ServiceStats])
+def get_service_stats(
+    start: Optional[date] = Query(None, alias="from"),
+    end: Optional[date] = Query(None, alias="to"),
+    db: Session = Depends(get_db),
+    current_admin: User = Depends(require_admin)
+):
+    """The same metrics totalled per service over the range (last 30 days by default)."""
+    start, end = _date_range(start, end)
+    rows = BookingStatsService(db).by_service(start, end)
+    return list_response(ServiceStats, rows)
+
+@router.get("/login")
+def get_login_stats(current_admin: User = Depends(require_admin)):
+    """Login guard counters for the worker that serves the request."""
+    return get_login_guard().snapshot()
@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from app.config.database import get_db
+from app.core.routing import SessionReleasingRoute
 from app.schemas.auth import UserLogin, UserRegister, TokenResponse
 from app.schemas.user import UserResponse
 from app.services.auth_service import AuthService
 
-router = APIRouter(prefix="/auth", tags=["auth"])
+router = APIRouter(prefix="/auth", tags=["auth"], route_class=SessionReleasingRoute)
 
 @router.post("/register", response_model=UserResponse)
 def register(user_data: UserRegister, db: Session = Depends(get_db)):
@@ -13,9 +14,9 @@ def register(user_data: UserRegister, db: Session = Depends(get_db)):
     return auth_service.register_user(user_data)
 
 @router.post("/login", response_model=TokenResponse)
-def login(login_data: UserLogin, db: Session = Depends(get_db)):
+def login(login_data: UserLogin, request: Request, db: Session = Depends(get_db)):
     auth_service = AuthService(db)
-    user = auth_service.authenticate_user(login_data)
+    user = auth_service.authenticate_user(login_data, request.client.host if request.client else None)
     
     if not user:
         raise HTTPException(status_code=401, detail="Wrong email or password")
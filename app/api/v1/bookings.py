@@ -1,14 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Literal, Optional, Tuple
 from uuid import UUID
+from datetime import datetime
 from app.config.database import get_db
-from app.schemas.booking import BookingCreate, BookingUpdate, BookingResponse
-from app.services.booking_service import BookingService
+from app.core.routing import SessionReleasingRoute
+from app.schemas.booking import BookingCreate, BookingUpdate, BookingResponse, BookingWithRelations, BookingChanges
+from app.services.booking_service import BookingService, EXPORT_COLUMNS
+from app.services.sync_service import BookingSyncService
 from app.core.auth import get_current_active_user, require_admin
+from app.core.serialization import item_response, list_response, iter_ndjson, iter_csv
+from app.core.params import field_set, id_list, include_set
 from app.models.user import User, UserRole
+from app.services.statements import BOOKING_INCLUDES
 
-router = APIRouter(prefix="/bookings", tags=["bookings"])
+router = APIRouter(prefix="/bookings", tags=["bookings"], route_class=SessionReleasingRoute)
+
+booking_fields = field_set(BookingResponse)
+booking_includes = include_set(tuple(BOOKING_INCLUDES))
+
+def _response_shape(fields: Optional[Tuple[str, ...]], include: Tuple[str, ...]):
+    """Schema and field set to serialize with: included relations extend the booking fields."""
+    if not include:
+        return BookingResponse, fields
+    return BookingWithRelations, (fields or tuple(BookingResponse.model_fields)) + include
 
 @router.post("/", response_model=BookingResponse, status_code=status.HTTP_201_CREATED)
 def create_booking(
@@ -21,22 +37,70 @@ def create_booking(
 
 @router.get("/", response_model=List[BookingResponse])
 def get_bookings(
+    start_from: Optional[datetime] = Query(None, alias="from"),
+    start_to: Optional[datetime] = Query(None, alias="to"),
+    ids: Optional[List[UUID]] = Depends(id_list),
+    fields: Optional[Tuple[str, ...]] = Depends(booking_fields),
+    include: Tuple[str, ...] = Depends(booking_includes),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
+    """List bookings, or with ``ids`` fetch those bookings (``from``/``to`` are then ignored)."""
     booking_service = BookingService(db)
     user_filter = None if current_user.role == UserRole.ADMIN else current_user
-    return booking_service.get_bookings(user=user_filter)
+    if ids is not None:
+        bookings = booking_service.get_bookings_by_ids(ids, user_filter, fields, include)
+    else:
+        bookings = booking_service.get_bookings(
+            user=user_filter, start_from=start_from, start_to=start_to, fields=fields, include=include
+        )
+    schema, fields = _response_shape(fields, include)
+    return list_response(schema, bookings, fields)
+
+@router.get("/export")
+def export_bookings(
+    start: datetime = Query(..., alias="from"),
+    end: datetime = Query(..., alias="to"),
+    format: Literal["ndjson", "csv"] = "ndjson",
+    db: Session = Depends(get_db),
+    current_admin: User = Depends(require_admin)
+):
+    """Stream all bookings starting in [from, to) as NDJSON or CSV (admin only)."""
+    booking_service = BookingService(db)
+    rows = booking_service.stream_bookings(start, end)
+    
+    if format == "csv":
+        return StreamingResponse(
+            iter_csv(rows, EXPORT_COLUMNS),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="bookings.csv"'}
+        )
+    return StreamingResponse(iter_ndjson(rows), media_type="application/x-ndjson")
+
+@router.get("/changes", response_model=BookingChanges)
+def get_booking_changes(
+    since: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Your bookings changed or deleted since the ``since`` sync token (all of them without one)."""
+    sync_service = BookingSyncService(db)
+    return sync_service.changes(current_user, since, limit)
 
 @router.get("/{booking_id}", response_model=BookingResponse)
 def get_booking(
     booking_id: UUID,
+    fields: Optional[Tuple[str, ...]] = Depends(booking_fields),
+    include: Tuple[str, ...] = Depends(booking_includes),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     booking_service = BookingService(db)
     user_filter = None if current_user.role == UserRole.ADMIN else current_user
-    return booking_service.get_booking(booking_id, user_filter)
+    booking = booking_service.get_booking(booking_id, user_filter, fields, include)
+    schema, fields = _response_shape(fields, include)
+    return item_response(schema, booking, fields)
 
 @router.patch("/{booking_id}", response_model=BookingResponse)
 def update_booking(
@@ -1,12 +1,30 @@
 from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from app.config.database import get_db
+from app.core.routing import SessionReleasingRoute
+from app.core.heartbeat import Heartbeat, get_heartbeat
+from app.core.warmup import state as warm_up_state
 
-router = APIRouter(tags=["Health"])
+router = APIRouter(tags=["Health"], route_class=SessionReleasingRoute)
+
+@router.get("/live")
+def liveness():
+    """Process is up and serving; does no I/O."""
+    return {"status": "ok"}
+
+@router.get("/ready")
+def readiness(heartbeat: Heartbeat = Depends(get_heartbeat)):
+    """Served from the last background heartbeat; never checks out a connection."""
+    ready, details = heartbeat.readiness()
+    return JSONResponse(status_code=200 if ready else 503, content=details)
 
 @router.get("/health")
 def health_check(db: Session = Depends(get_db)):
+    if not warm_up_state.ready:
+        return JSONResponse(status_code=503, content={"status": "warming_up", "database": "unknown"})
+    
     try:
         db.execute(text("SELECT 1"))
         db_status = "ok"
@@ -4,12 +4,13 @@ from typing import List
 from uuid import UUID
 
 from app.config.database import get_db
+from app.core.routing import SessionReleasingRoute
 from app.schemas.review import ReviewCreate, ReviewUpdate, ReviewResponse
 from app.services.review_service import ReviewService
 from app.core.auth import get_current_active_user
 from app.models.user import User
 
-router = APIRouter(prefix="/reviews", tags=["reviews"])
+router = APIRouter(prefix="/reviews", tags=["reviews"], route_class=SessionReleasingRoute)
 
 @router.post("/", response_model=ReviewResponse, status_code=status.HTTP_201_CREATED)
 def create_review(
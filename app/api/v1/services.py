@@ -1,24 +1,38 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional, Tuple
 from uuid import UUID
 from app.config.database import get_db
+from app.core.routing import SessionReleasingRoute
 from app.schemas.service import ServiceCreate, ServiceUpdate, ServiceResponse
 from app.services.service_service import ServiceService
 from app.core.auth import require_admin
+from app.core.serialization import item_response, list_response
+from app.core.params import field_set, id_list
 from app.models.user import User
 
-router = APIRouter(prefix="/services", tags=["services"])
+router = APIRouter(prefix="/services", tags=["services"], route_class=SessionReleasingRoute)
 
 @router.get("/", response_model=List[ServiceResponse])
-def get_services(db: Session = Depends(get_db)):
+def get_services(
+    ids: Optional[List[UUID]] = Depends(id_list),
+    fields: Optional[Tuple[str, ...]] = Depends(field_set(ServiceResponse)),
+    db: Session = Depends(get_db)
+):
     service_service = ServiceService(db)
-    return service_service.get_services()
+    if ids is not None:
+        return list_response(ServiceResponse, service_service.get_services_by_ids(ids, fields), fields)
+    # The catalog is cached whole; a field set only trims the cached rows
+    return list_response(ServiceResponse, service_service.get_catalog(), fields)
 
 @router.get("/{service_id}", response_model=ServiceResponse)
-def get_service(service_id: UUID, db: Session = Depends(get_db)):
+def get_service(
+    service_id: UUID,
+    fields: Optional[Tuple[str, ...]] = Depends(field_set(ServiceResponse)),
+    db: Session = Depends(get_db)
+):
     service_service = ServiceService(db)
-    return service_service.get_service(service_id)
+    return item_response(ServiceResponse, service_service.get_service(service_id, fields), fields)
 
 @router.post("/", response_model=ServiceResponse)
 def create_service(
@@ -2,11 +2,12 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.config.database import get_db
+from app.core.routing import SessionReleasingRoute
 from app.schemas.user import UserResponse, UserUpdate
 from app.models.user import User
 from app.core.auth import get_current_active_user
 
-router = APIRouter(prefix="/users", tags=["users"])
+router = APIRouter(prefix="/users", tags=["users"], route_class=SessionReleasingRoute)
 
 @router.get("/me", response_model=UserResponse)
 def get_current_user_profile(
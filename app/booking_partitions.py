@@ -0,0 +1,44 @@
+"""Maintain the monthly partitions of the bookings table.
+
+    python -m app.booking_partitions list
+    python -m app.booking_partitions ensure [--months-ahead 12]
+    python -m app.booking_partitions archive [--older-than-months 24]
+
+``archive`` detaches old partitions and moves them to BOOKING_ARCHIVE_SCHEMA.
+"""
+import argparse
+
+from app.config.database import SessionLocal
+from app.services.partition_service import BookingPartitionService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain monthly bookings partitions.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="list current partitions")
+    ensure = commands.add_parser("ensure", help="create partitions ahead of time")
+    ensure.add_argument("--months-ahead", type=int, default=None)
+    archive = commands.add_parser("archive", help="detach old partitions into the archive schema")
+    archive.add_argument("--older-than-months", type=int, default=None)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        service = BookingPartitionService(db)
+        if not service.is_partitioned():
+            print("bookings is not partitioned (run `alembic upgrade head` on PostgreSQL)")
+            return
+        if args.command == "list":
+            for name in service.list_partitions():
+                print(name)
+        elif args.command == "ensure":
+            print(f"Created {service.ensure_partitions(args.months_ahead)} partition(s)")
+        else:
+            archived = service.archive_partitions(args.older_than_months)
+            print(f"Archived {len(archived)} partition(s): {', '.join(archived) or '-'}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Rebuild the daily booking summary behind ``/api/v1/admin/stats``.
+
+    python -m app.booking_stats rebuild                              # every day with live bookings
+    python -m app.booking_stats rebuild --from 2026-01-01 --to 2026-02-01
+
+The summary is normally kept up to date as bookings change; rebuild it after
+bulk loads that bypass ``BookingService`` or to repair drift. ``--to`` is
+exclusive.
+"""
+import argparse
+from datetime import date
+
+from app.config.database import SessionLocal
+from app.services.stats_service import BookingStatsService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain the daily booking summary.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    rebuild = commands.add_parser("rebuild", help="recompute summary rows from bookings")
+    rebuild.add_argument("--from", dest="start", type=date.fromisoformat, default=None)
+    rebuild.add_argument("--to", dest="end", type=date.fromisoformat, default=None)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        rows = BookingStatsService(db).rebuild(args.start, args.end)
+        print(f"Rebuilt {rows} summary row(s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
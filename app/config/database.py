@@ -1,15 +1,138 @@
-from sqlalchemy import create_engine
+from contextvars import ContextVar
+from typing import Iterable, List, Optional
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import make_url
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from app.config.settings import settings
 
-engine = create_engine(settings.database_url)
+DRIVERS = ("psycopg2", "psycopg")
+
+def database_url() -> str:
+    """``DATABASE_URL`` with the PostgreSQL driver chosen by ``DB_DRIVER``.
+
+    Also accepts the ``postgres://`` scheme some hosts (Render, Heroku) hand out.
+    """
+    url = make_url(settings.database_url.replace("postgres://", "postgresql://", 1))
+    if url.get_backend_name() == "postgresql" and settings.db_driver:
+        if settings.db_driver not in DRIVERS:
+            raise ValueError(f"DB_DRIVER must be one of {', '.join(DRIVERS)}")
+        url = url.set(drivername=f"postgresql+{settings.db_driver}")
+    return url.render_as_string(hide_password=False)
+
+def driver_name(bind) -> str:
+    """DBAPI driver of an engine or connection, e.g. ``psycopg2``, ``psycopg`` or ``pysqlite``."""
+    return bind.dialect.driver
+
+def _engine_options() -> dict:
+    options = {"query_cache_size": settings.db_query_cache_size}
+    url = make_url(database_url())
+    if url.get_backend_name() == "sqlite":
+        return options
+    options.update({
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout
+    })
+    if url.get_driver_name() == "psycopg":
+        # psycopg 3 prepares server-side after prepare_threshold executions; None
+        # turns that off (required behind PgBouncer in transaction mode).
+        # psycopg2 has no server-side prepared statements.
+        options["connect_args"] = {
+            "prepare_threshold": settings.db_prepare_threshold if settings.db_prepared_statements else None
+        }
+    return options
+
+class StatementCacheStats:
+    """Counts compiled-cache hits and misses for an engine's executions."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.hits = 0
+        self.misses = 0
+        event.listen(engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        cache_hit = getattr(context, "cache_hit", None)
+        if cache_hit == CACHE_HIT:
+            self.hits += 1
+        elif cache_hit == CACHE_MISS:
+            self.misses += 1
+
+    def snapshot(self) -> dict:
+        cache = getattr(self.engine, "_compiled_cache", None)
+        total = self.hits + self.misses
+        return {
+            "size": len(cache) if cache is not None else 0,
+            "capacity": getattr(cache, "capacity", 0),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else None,
+        }
+
+engine = create_engine(database_url(), **_engine_options())
+statement_cache_stats = StatementCacheStats(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+class LazySession:
+    """Proxy for a ``Session`` that is only created when first used.
+
+    ``release()`` ends the session's transaction and returns its connection to
+    the pool while keeping the objects the response reads loaded, so a request can give
+    its connection back before the response is serialized. Using the proxy again
+    afterwards simply starts a new transaction.
+    """
+
+    def __init__(self, factory=None):
+        self._factory = factory or SessionLocal
+        self._session: Optional[Session] = None
+
+    def __getattr__(self, name):
+        if self._session is None:
+            self._session = self._factory()
+        return getattr(self._session, name)
+
+    @property
+    def started(self) -> bool:
+        return self._session is not None
+
+    def release(self, keep: Iterable = ()) -> None:
+        """End the transaction and return the connection, reloading ``keep`` first.
+
+        ``keep`` is what the response will read; only those objects are refreshed
+        if a commit expired them. A session left inactive by a failed flush is
+        rolled back instead, so the endpoint's own error propagates.
+        """
+        session = self._session
+        if session is None:
+            return
+        try:
+            if not session.is_active:
+                session.rollback()
+                return
+            for obj in keep:
+                state = inspect(obj, raiseerr=False)
+                if state is not None and state.session is session and state.expired_attributes:
+                    session.refresh(obj)
+        finally:
+            session.close()
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+
+
+# Sessions handed out during the current request; see app.core.routing
+request_sessions: ContextVar[Optional[List[LazySession]]] = ContextVar("request_sessions", default=None)
+
 def get_db():
-    db = SessionLocal()
+    db = LazySession()
+    sessions = request_sessions.get()
+    if sessions is not None:
+        sessions.append(db)
     try:
         yield db
     finally:
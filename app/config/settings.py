@@ -1,4 +1,5 @@
 from pydantic_settings import BaseSettings
+from functools import lru_cache
 from typing import Optional, List
 import json
 
@@ -6,6 +7,15 @@ class Settings(BaseSettings):
     # Database
     database_url: str
     testing: bool = False
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+    db_max_connections: Optional[int] = None
+    db_reserved_connections: int = 10
+    db_driver: Optional[str] = None  # "psycopg2" (default) or "psycopg" (psycopg 3)
+    db_query_cache_size: int = 500
+    db_prepared_statements: bool = False
+    db_prepare_threshold: int = 5
     
     # JWT
     secret_key: str
@@ -31,6 +41,83 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = "INFO"
     
+    # Performance
+    fast_json_responses: bool = False
+    export_batch_size: int = 1000
+    catalog_cache_ttl_seconds: int = 30
+    multi_get_max_ids: int = 100  # ?ids= on GET /services and GET /bookings
+    sync_page_size: int = 500  # GET /bookings/changes
+    sync_settle_seconds: int = 30
+    sync_tombstone_retention_days: int = 90
+    cache_generation_check_seconds: float = 5.0  # fallback for missed invalidations
+    warm_up_enabled: bool = True
+    
+    # Health checks
+    heartbeat_interval_seconds: float = 2.0
+    ready_max_db_latency_ms: float = 500
+    ready_max_pool_overflow: float = 0.5  # share of DB_MAX_OVERFLOW in use
+    
+    # Server (python -m app.serve)
+    forwarded_allow_ips: Optional[str] = None  # proxies trusted for X-Forwarded-For; unset: client IPs unknown
+    web_concurrency: Optional[int] = None
+    server_loop: str = "auto"
+    server_http: str = "auto"
+    graceful_timeout: int = 30
+    max_requests: Optional[int] = None
+    
+    # Booking lifecycle worker
+    lifecycle_worker_enabled: bool = False
+    lifecycle_interval_seconds: int = 60
+    lifecycle_batch_size: int = 500
+    pending_expiry_grace_minutes: int = 0
+    
+    # Outbox dispatcher (booking and review events)
+    outbox_dispatcher_enabled: bool = False
+    outbox_webhook_urls: str = '[]'
+    outbox_batch_size: int = 100
+    outbox_concurrency: int = 16  # deliveries in flight per dispatcher
+    outbox_poll_interval_seconds: float = 1.0
+    outbox_delivery_timeout_seconds: float = 10.0
+    outbox_lease_seconds: int = 60
+    outbox_max_attempts: int = 10
+    outbox_backoff_base_seconds: float = 2.0
+    outbox_backoff_max_seconds: float = 900.0
+    outbox_retention_hours: int = 24
+    
+    # Booking partitions
+    booking_partition_months_ahead: int = 12
+    booking_archive_after_months: int = 24
+    booking_archive_schema: str = "archive"
+    booking_max_duration_hours: int = 24
+    
+    # Rate limiting: {"route class": [requests per second, burst]}
+    rate_limit_enabled: bool = True
+    rate_limit_budgets: str = '{"catalog": [20, 60], "writes": [1, 10], "default": [10, 30]}'
+    rate_limit_shared: bool = True  # share buckets across app.serve workers
+    rate_limit_slots: int = 65536
+    rate_limit_shards: int = 64
+    
+    # Login admission control
+    login_guard_enabled: bool = True
+    login_max_failures_per_email: float = 5
+    login_max_failures_per_ip: float = 20
+    login_failure_half_life_seconds: float = 300
+    login_guard_max_entries: int = 100_000
+    
+    # Admin stats
+    service_open_minutes_per_day: int = 480  # capacity behind utilisation
+    stats_max_range_days: int = 366
+    
+    # Response compression
+    compression_enabled: bool = True
+    compression_minimum_size: int = 1024
+    compression_offload_size: int = 65536
+    compression_flush_size: int = 16384
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4
+    compression_zstd_level: int = 3
+    compression_content_types: str = '["application/json", "application/x-ndjson", "text/csv", "text/plain"]'
+    
     # Security (for production)
     docs_url: Optional[str] = "/docs"
     redoc_url: Optional[str] = "/redoc"
@@ -43,6 +130,27 @@ class Settings(BaseSettings):
         except json.JSONDecodeError:
             return ["http://localhost:3000"]
     
+    @property
+    def compressible_content_types(self) -> List[str]:
+        """Parse compressible content types from JSON string"""
+        try:
+            return json.loads(self.compression_content_types)
+        except json.JSONDecodeError:
+            return ["application/json"]
+    
+    @property
+    def client_ip_trusted(self) -> bool:
+        """Whether ``scope["client"]`` is the real caller, i.e. the proxy setup was declared."""
+        return self.forwarded_allow_ips is not None
+
+    @property
+    def outbox_webhooks(self) -> List[str]:
+        """Parse outbox webhook URLs from JSON string"""
+        try:
+            return json.loads(self.outbox_webhook_urls)
+        except json.JSONDecodeError:
+            return []
+    
     @property
     def is_production(self) -> bool:
         return self.environment.lower() == "production"
@@ -50,4 +158,20 @@ class Settings(BaseSettings):
     class Config:
         env_file = ".env"
 
-settings = Settings()
\ No newline at end of file
+@lru_cache()
+def get_settings() -> Settings:
+    return Settings()
+
+class _LazySettings:
+    """Builds ``Settings`` (reading the environment and ``.env``) on first attribute access."""
+
+    def __getattr__(self, name):
+        return getattr(get_settings(), name)
+
+    def __setattr__(self, name, value):
+        setattr(get_settings(), name, value)
+
+    def __delattr__(self, name):
+        delattr(get_settings(), name)
+
+settings = _LazySettings()
\ No newline at end of file
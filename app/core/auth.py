@@ -5,6 +5,7 @@ from typing import Optional
 from app.config.database import get_db
 from app.core.security import verify_token
 from app.models.user import User, UserRole
+from app.services.statements import get_user_by_email
 
 security = HTTPBearer()
 
@@ -23,7 +24,7 @@ def get_current_user(
     if username is None:
         raise credentials_exception
     
-    user = db.query(User).filter(User.email == username).first()
+    user = get_user_by_email(db, username)
     if user is None:
         raise credentials_exception
     
@@ -54,5 +55,5 @@ def get_current_user_optional(
     if username is None:
         return None
     
-    user = db.query(User).filter(User.email == username).first()
+    user = get_user_by_email(db, username)
     return user
\ No newline at end of file
@@ -0,0 +1,217 @@
+import zlib
+from typing import Callable, Dict, Iterable, Optional
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:  # optional: pip install brotli
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:  # optional: pip install zstandard
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+
+class _Compressor:
+    """Incremental compressor with a common compress/flush interface."""
+
+    def __init__(self, encoding: str, level: int, flush_size: int = 16 * 1024):
+        self.encoding = encoding
+        self.flush_size = flush_size
+        self._unflushed = 0
+        if encoding == "br":
+            obj = brotli.Compressor(quality=level)
+            self._compress = obj.process
+            self._sync = obj.flush
+            self._finish = obj.finish
+        elif encoding == "zstd":
+            obj = zstandard.ZstdCompressor(level=level).compressobj()
+            self._compress = obj.compress
+            self._sync = lambda: obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+            self._finish = obj.flush
+        else:
+            # wbits=31 writes a gzip header and trailer
+            obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+            self._compress = obj.compress
+            self._sync = lambda: obj.flush(zlib.Z_SYNC_FLUSH)
+            self._finish = obj.flush
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a streamed chunk, flushing once ``flush_size`` input bytes are pending.
+
+        Every flush ends a block and costs ratio, so small chunks are left in
+        the compressor until enough has built up (or ``finish`` is called).
+        """
+        compressed = self._compress(data)
+        self._unflushed += len(data)
+        if self._unflushed >= self.flush_size:
+            self._unflushed = 0
+            compressed += self._sync()
+        return compressed
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+    def compress_all(self, data: bytes) -> bytes:
+        return self._compress(data) + self._finish()
+
+
+def available_encodings() -> Iterable[str]:
+    """Supported encodings in server preference order."""
+    encodings = []
+    if brotli is not None:
+        encodings.append("br")
+    if zstandard is not None:
+        encodings.append("zstd")
+    encodings.append("gzip")
+    return encodings
+
+
+def negotiate_encoding(accept_encoding: str, supported: Iterable[str]) -> Optional[str]:
+    """Pick the first server-preferred encoding the client accepts with q > 0."""
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            accepted[name] = q
+
+    for encoding in supported:
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+class CompressionMiddleware:
+    """Compress responses with brotli, zstd or gzip depending on Accept-Encoding.
+
+    Only responses whose content type is in ``content_types`` and whose body is at
+    least ``minimum_size`` bytes are compressed. Bodies larger than ``offload_size``
+    are compressed in a worker thread so the event loop is not blocked.
+    Streaming responses are compressed as they arrive, flushed to the client
+    every ``flush_size`` bytes of input and at the end of the body.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        offload_size: int = 64 * 1024,
+        flush_size: int = 16 * 1024,
+        content_types: Iterable[str] = ("application/json",),
+        levels: Optional[Dict[str, int]] = None,
+        encodings: Optional[Iterable[str]] = None,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.offload_size = offload_size
+        self.flush_size = flush_size
+        self.content_types = tuple(content_types)
+        self.levels = {"gzip": 6, "br": 4, "zstd": 3, **(levels or {})}
+        supported = list(available_encodings())
+        self.encodings = [e for e in (encodings or supported) if e in supported]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), self.encodings
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.initial_message: Message = {}
+        self.started = False
+        self.passthrough = False
+        self.compressor: Optional[_Compressor] = None
+
+    def _should_compress(self, headers: Headers) -> bool:
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return content_type in self.middleware.content_types
+
+    async def _run(self, func: Callable[[bytes], bytes], data: bytes) -> bytes:
+        if len(data) >= self.middleware.offload_size:
+            return await anyio.to_thread.run_sync(func, data)
+        return func(data)
+
+    def _mark_compressed(self, headers: MutableHeaders) -> None:
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # Hold the start message until the first body chunk decides the headers
+            self.initial_message = message
+            self.passthrough = not self._should_compress(Headers(raw=message["headers"]))
+            return
+
+        if message_type != "http.response.body":
+            await self._send(message)
+            return
+
+        if self.passthrough:
+            if not self.started:
+                self.started = True
+                await self._send(self.initial_message)
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            self.started = True
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+
+            if not more_body:
+                if len(body) < self.middleware.minimum_size:
+                    await self._send(self.initial_message)
+                    await self._send(message)
+                    return
+                compressor = _Compressor(self.encoding, self.middleware.levels[self.encoding])
+                compressed = await self._run(compressor.compress_all, body)
+                self._mark_compressed(headers)
+                headers["Content-Length"] = str(len(compressed))
+                await self._send(self.initial_message)
+                await self._send({**message, "body": compressed})
+                return
+
+            # Streaming response: length is unknown, compress as chunks arrive
+            self.compressor = _Compressor(
+                self.encoding, self.middleware.levels[self.encoding], self.middleware.flush_size
+            )
+            self._mark_compressed(headers)
+            del headers["Content-Length"]
+            await self._send(self.initial_message)
+
+        chunk = await self._run(self.compressor.compress, body)
+        if not more_body:
+            chunk += self.compressor.finish()
+        elif not chunk:
+            return  # still buffered in the compressor
+        await self._send({**message, "body": chunk})
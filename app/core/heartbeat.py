@@ -0,0 +1,115 @@
+"""Background database heartbeat behind ``/api/v1/ready``.
+
+Readiness probes must not compete with user traffic for pooled connections, so
+a single background task probes the database every ``HEARTBEAT_INTERVAL_SECONDS``
+and the endpoint only reads the last result. An instance reports not ready when
+warm-up has not finished, the probe failed or is stale, the probe's round trip
+exceeds ``READY_MAX_DB_LATENCY_MS``, or more than ``READY_MAX_POOL_OVERFLOW`` of
+the ``DB_MAX_OVERFLOW`` connections are in use. Connections held within
+``DB_POOL_SIZE`` are normal load; spilling into overflow means requests are
+outrunning the pool. A load balancer then stops routing to an overloaded
+instance instead of the orchestrator restarting it.
+"""
+import asyncio
+import logging
+import time
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import anyio
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+
+from app.config.settings import settings
+from app.core.warmup import state as warm_up_state
+
+logger = logging.getLogger(__name__)
+
+
+class Heartbeat:
+    def __init__(
+        self, engine, interval: float = None, max_latency_ms: float = None, max_pool_overflow: float = None,
+        statement_cache_stats=None
+    ):
+        self.engine = engine
+        self.statement_cache_stats = statement_cache_stats
+        self.interval = settings.heartbeat_interval_seconds if interval is None else interval
+        self.max_latency_ms = settings.ready_max_db_latency_ms if max_latency_ms is None else max_latency_ms
+        self.max_pool_overflow = settings.ready_max_pool_overflow if max_pool_overflow is None else max_pool_overflow
+        self.snapshot: Optional[dict] = None
+
+    def pool_usage(self) -> Optional[dict]:
+        pool = self.engine.pool
+        if not isinstance(pool, QueuePool):
+            return None
+        max_overflow = pool._max_overflow
+        capacity = pool.size() + max_overflow
+        checked_out = pool.checkedout()
+        overflow = max(pool.overflow(), 0)
+        return {
+            "size": pool.size(),
+            "checked_out": checked_out,
+            "overflow": overflow,
+            "usage": round(checked_out / capacity, 3) if capacity > 0 else 0.0,
+            "overflow_usage": round(overflow / max_overflow, 3) if max_overflow > 0 else 0.0,
+        }
+
+    def beat(self) -> dict:
+        """Probe the database once and store the result."""
+        pool = self.pool_usage()
+        snapshot = {"checked_at": time.monotonic(), "pool": pool, "database": "ok", "latency_ms": None}
+        if pool is not None and pool["usage"] >= 1:
+            # Checking out now would just queue behind user requests
+            snapshot["database"] = "pool_exhausted"
+        else:
+            started = time.perf_counter()
+            try:
+                with self.engine.connect() as connection:
+                    connection.execute(text("SELECT 1"))
+                snapshot["latency_ms"] = round((time.perf_counter() - started) * 1000, 2)
+            except Exception:
+                logger.warning("Heartbeat database probe failed", exc_info=True)
+                snapshot["database"] = "error"
+        self.snapshot = snapshot
+        return snapshot
+
+    def readiness(self) -> Tuple[bool, dict]:
+        """Readiness from the last heartbeat: ``(ready, details)``; never touches the database."""
+        if not warm_up_state.ready:
+            return False, {"status": "warming_up"}
+        snapshot = self.snapshot
+        if snapshot is None:
+            return False, {"status": "starting"}
+
+        age = time.monotonic() - snapshot["checked_at"]
+        details = {
+            "database": snapshot["database"],
+            "latency_ms": snapshot["latency_ms"],
+            "pool": snapshot["pool"],
+            "age_seconds": round(age, 1),
+        }
+        if self.statement_cache_stats is not None:
+            details["statement_cache"] = self.statement_cache_stats.snapshot()
+        if snapshot["database"] != "ok":
+            reason = snapshot["database"]
+        elif age > self.interval * 3:
+            reason = "stale"
+        elif snapshot["latency_ms"] > self.max_latency_ms:
+            reason = "slow_database"
+        elif snapshot["pool"] is not None and snapshot["pool"]["overflow_usage"] > self.max_pool_overflow:
+            reason = "pool_busy"
+        else:
+            return True, {"status": "ready", **details}
+        return False, {"status": "not_ready", "reason": reason, **details}
+
+    async def run(self) -> None:
+        while True:
+            await anyio.to_thread.run_sync(self.beat)
+            await asyncio.sleep(self.interval)
+
+
+@lru_cache(maxsize=None)
+def get_heartbeat() -> Heartbeat:
+    from app.config.database import engine, statement_cache_stats
+
+    return Heartbeat(engine, statement_cache_stats=statement_cache_stats)
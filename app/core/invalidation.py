@@ -0,0 +1,207 @@
+"""Cross-worker invalidation of in-process caches.
+
+Writers call ``publish(db, cache_name, key)`` inside their transaction. On
+PostgreSQL that issues ``pg_notify`` on ``CHANNEL``, which the server only
+delivers once the transaction commits, so no worker evicts before the new data
+is visible. Each worker keeps one dedicated ``LISTEN`` connection (started from
+the app lifespan) and evicts the key, or clears the cache when no key is given,
+from whichever cache was registered under that name. The publishing session
+also evicts locally right after its own commit.
+
+Notifications are lost while a listener is disconnected, so ``publish`` also
+bumps a per-cache counter in ``cache_generations``. Listeners compare those
+generations every ``CACHE_GENERATION_CHECK_SECONDS`` and after reconnecting,
+and clear any cache whose generation moved. On other databases (SQLite) the
+generation check is the only cross-process path.
+"""
+import json
+import logging
+import os
+import select
+import time
+from functools import lru_cache
+from typing import Dict, Hashable, Optional
+
+import anyio
+from sqlalchemy import event, select as sql_select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.models.cache_generation import CacheGeneration
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "bookit_invalidate"
+
+# Session.info key for evictions to run locally once the session commits
+_PENDING = "pending_invalidations"
+
+
+class InvalidationBus:
+    def __init__(self, engine, check_interval: float = None):
+        self.engine = engine
+        self.check_interval = check_interval or settings.cache_generation_check_seconds
+        self.caches: Dict[str, object] = {}
+        self.generations: Dict[str, int] = {}
+        self.stats = dict.fromkeys(("notifications", "evictions", "generation_resets", "reconnects"), 0)
+        self._raw = None
+        self._connection = None
+        self._next_check = 0.0
+        self._stopping = False
+
+    def register(self, name: str, cache) -> None:
+        """Register a cache (anything with ``invalidate(key)`` and ``clear()``) under ``name``."""
+        self.caches[name] = cache
+
+    # Publishing
+
+    def publish(self, db: Session, name: str, key: Optional[Hashable] = None) -> None:
+        """Invalidate ``key`` (or the whole cache) everywhere once ``db`` commits."""
+        table = CacheGeneration.__table__
+        dialect = db.get_bind().dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert(table).values(name=name, generation=1)
+        generation = db.execute(stmt.on_conflict_do_update(
+            index_elements=[table.c.name], set_={"generation": table.c.generation + 1}
+        ).returning(table.c.generation)).scalar_one()
+        if dialect == "postgresql":
+            payload = json.dumps({"cache": name, "key": key, "pid": os.getpid()})
+            db.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": CHANNEL, "payload": payload})
+        db.info.setdefault(_PENDING, []).append((self, name, key, generation))
+
+    def _committed(self, name: str, key: Optional[Hashable], generation: int) -> None:
+        self.evict(name, key)
+        # Our own bump need not clear the cache again at the next generation check
+        if self.generations.get(name) == generation - 1:
+            self.generations[name] = generation
+
+    def evict(self, name: str, key: Optional[Hashable] = None) -> None:
+        cache = self.caches.get(name)
+        if cache is None:
+            return
+        if key is None:
+            cache.clear()
+        else:
+            cache.invalidate(key)
+        self.stats["evictions"] += 1
+
+    # Listening
+
+    def poll(self, timeout: float) -> int:
+        """Wait up to ``timeout`` seconds for notifications and apply them; returns how many arrived."""
+        received = 0
+        if self.engine.dialect.name == "postgresql":
+            try:
+                if self._connection is None:
+                    self._connect()
+                received = self._receive(timeout)
+            except Exception:
+                if self._stopping:
+                    return received
+                logger.warning("Cache invalidation listener lost its connection", exc_info=True)
+                self._disconnect()
+                time.sleep(min(timeout, 1.0))
+        else:
+            time.sleep(timeout)
+        if time.monotonic() >= self._next_check:
+            self.check_generations()
+        return received
+
+    def check_generations(self) -> None:
+        """Clear every registered cache whose generation changed since the last check."""
+        self._next_check = time.monotonic() + self.check_interval
+        try:
+            with self.engine.connect() as connection:
+                current = dict(connection.execute(
+                    sql_select(CacheGeneration.name, CacheGeneration.generation)
+                ).all())
+        except Exception:
+            logger.warning("Cache generation check failed", exc_info=True)
+            return
+        for name, generation in current.items():
+            seen = self.generations.get(name)
+            if seen is not None and seen != generation:
+                self.evict(name)
+                self.stats["generation_resets"] += 1
+        self.generations.update(current)
+
+    def _connect(self) -> None:
+        raw = self.engine.raw_connection()
+        connection = raw.driver_connection
+        raw.detach()  # long-lived and in autocommit; keep it out of the pool
+        self._raw = raw
+        connection.autocommit = True
+        cursor = connection.cursor()
+        cursor.execute(f"LISTEN {CHANNEL}")
+        cursor.close()
+        self._connection = connection
+        if self.stats["reconnects"] or self.generations:
+            # Anything published while disconnected was missed
+            for name in self.caches:
+                self.evict(name)
+        self.stats["reconnects"] += 1
+        self.check_generations()
+
+    def _disconnect(self) -> None:
+        if self._raw is not None:
+            try:
+                self._raw.close()
+            except Exception:
+                pass
+        self._raw = self._connection = None
+
+    def _receive(self, timeout: float) -> int:
+        connection = self._connection
+        readable, _, _ = select.select([connection.fileno()], [], [], timeout)
+        if not readable:
+            return 0
+        payloads = []
+        if hasattr(connection, "pgconn"):  # psycopg 3
+            pgconn = connection.pgconn
+            pgconn.consume_input()
+            while (notify := pgconn.notifies()) is not None:
+                payloads.append(notify.extra.decode())
+        else:  # psycopg2
+            connection.poll()
+            while connection.notifies:
+                payloads.append(connection.notifies.pop(0).payload)
+        for payload in payloads:
+            self._dispatch(payload)
+        return len(payloads)
+
+    def _dispatch(self, payload: str) -> None:
+        self.stats["notifications"] += 1
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed cache invalidation %r", payload)
+            return
+        self.evict(message.get("cache"), message.get("key"))
+
+    async def run(self) -> None:
+        try:
+            while True:
+                await anyio.to_thread.run_sync(self.poll, 1.0)
+        finally:
+            # A poll may still be running in its thread; it stops once the connection is closed
+            self._stopping = True
+            self._disconnect()
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_after_commit(session: Session) -> None:
+    for bus, name, key, generation in session.info.pop(_PENDING, ()):
+        bus._committed(name, key, generation)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING, None)
+
+
+@lru_cache(maxsize=None)
+def get_invalidation_bus() -> InvalidationBus:
+    from app.config.database import engine
+
+    return InvalidationBus(engine)
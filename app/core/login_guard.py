@@ -0,0 +1,126 @@
+"""Admission control for ``/auth/login``.
+
+Every login attempt costs a bcrypt verify (tens of milliseconds of CPU), so a
+credential-stuffing burst would otherwise starve the rest of the API. The guard
+keeps a failure score per email and per client IP that halves every
+``LOGIN_FAILURE_HALF_LIFE_SECONDS``. While one more failure would take a score
+past ``LOGIN_MAX_FAILURES_PER_EMAIL`` or ``LOGIN_MAX_FAILURES_PER_IP``, attempts
+are answered ``429`` before any database lookup or bcrypt work. Scores are kept
+per worker. The per-IP score only applies once ``FORWARDED_ALLOW_IPS`` makes
+client addresses trustworthy.
+"""
+import math
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from app.config.settings import settings
+
+
+class DecayingCounter:
+    """Scores per key that halve every ``half_life`` seconds, keeping at most ``max_entries`` keys."""
+
+    def __init__(self, half_life: float, max_entries: int):
+        self.half_life = half_life
+        self.max_entries = max_entries
+        self._scores: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    def get(self, key: str, now: float) -> float:
+        entry = self._scores.get(key)
+        if entry is None:
+            return 0.0
+        score, updated = entry
+        return score * 0.5 ** ((now - updated) / self.half_life)
+
+    def add(self, key: str, now: float, amount: float = 1.0) -> float:
+        score = self.get(key, now) + amount
+        self._scores[key] = (score, now)
+        self._scores.move_to_end(key)
+        while len(self._scores) > self.max_entries:
+            self._scores.popitem(last=False)
+        return score
+
+    def reset(self, key: str) -> None:
+        self._scores.pop(key, None)
+
+    def seconds_until_at_most(self, key: str, threshold: float, now: float) -> float:
+        """Time until the score decays to ``threshold``; 0 if it already has."""
+        score = self.get(key, now)
+        if score <= threshold:
+            return 0.0
+        # score * 0.5 ** (t / half_life) == threshold
+        return self.half_life * math.log2(score / threshold)
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+
+class LoginGuard:
+    def __init__(
+        self, max_email_failures: float = None, max_ip_failures: float = None,
+        half_life: float = None, max_entries: int = None
+    ):
+        half_life = half_life or settings.login_failure_half_life_seconds
+        max_entries = max_entries or settings.login_guard_max_entries
+        self.max_email_failures = max_email_failures or settings.login_max_failures_per_email
+        self.max_ip_failures = max_ip_failures or settings.login_max_failures_per_ip
+        self.emails = DecayingCounter(half_life, max_entries)
+        self.ips = DecayingCounter(half_life, max_entries)
+        self._lock = threading.Lock()
+        self.counters: Dict[str, int] = dict.fromkeys(
+            ("attempts", "rejected", "failures", "successes", "dummy_verifies"), 0
+        )
+
+    def retry_after(self, email: str, ip: Optional[str], now: float = None) -> int:
+        """Seconds the caller must wait before trying again, or 0 if the attempt may proceed."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self.counters["attempts"] += 1
+            wait = self.emails.seconds_until_at_most(email.lower(), _threshold(self.max_email_failures), now)
+            if ip is not None:
+                wait = max(wait, self.ips.seconds_until_at_most(ip, _threshold(self.max_ip_failures), now))
+            if wait:
+                # The database lookup and the bcrypt verify were both skipped
+                self.counters["rejected"] += 1
+        return math.ceil(wait)
+
+    def record_failure(self, email: str, ip: Optional[str], unknown_user: bool = False, now: float = None) -> None:
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self.counters["failures"] += 1
+            self.counters["dummy_verifies"] += unknown_user
+            self.emails.add(email.lower(), now)
+            if ip is not None:
+                self.ips.add(ip, now)
+
+    def record_success(self, email: str) -> None:
+        with self._lock:
+            self.counters["successes"] += 1
+            self.emails.reset(email.lower())
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                **self.counters,
+                "bcrypt_avoided": self.counters["rejected"],
+                "tracked_emails": len(self.emails),
+                "tracked_ips": len(self.ips),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self.emails = DecayingCounter(self.emails.half_life, self.emails.max_entries)
+            self.ips = DecayingCounter(self.ips.half_life, self.ips.max_entries)
+            self.counters = dict.fromkeys(self.counters, 0)
+
+
+def _threshold(limit: float) -> float:
+    # Blocked while another failure would exceed the limit
+    return max(limit - 1, 0.5)
+
+
+@lru_cache(maxsize=None)
+def get_login_guard() -> LoginGuard:
+    return LoginGuard()
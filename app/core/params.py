@@ -0,0 +1,70 @@
+"""Query parameters shared by several endpoints."""
+from typing import Callable, List, Optional, Sequence, Tuple, Type
+from uuid import UUID
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel
+
+from app.config.settings import settings
+
+
+def id_list(
+    ids: Optional[str] = Query(None, description="Comma-separated ids to fetch in one request")
+) -> Optional[List[UUID]]:
+    """Parse ``?ids=a,b,c`` into distinct UUIDs in request order; None when absent."""
+    if ids is None:
+        return None
+    parsed = []
+    for value in ids.split(","):
+        value = value.strip()
+        if not value:
+            continue
+        try:
+            parsed.append(UUID(value))
+        except ValueError:
+            raise HTTPException(status_code=422, detail=f"Invalid id: {value!r}")
+    parsed = list(dict.fromkeys(parsed))
+    if not parsed:
+        raise HTTPException(status_code=422, detail="'ids' must list at least one id")
+    if len(parsed) > settings.multi_get_max_ids:
+        raise HTTPException(status_code=422, detail=f"At most {settings.multi_get_max_ids} ids per request")
+    return parsed
+
+
+def field_set(schema: Type[BaseModel]) -> Callable[..., Optional[Tuple[str, ...]]]:
+    """Dependency parsing ``?fields=a,b`` against ``schema``'s fields.
+
+    Returns the requested fields plus ``id`` in the schema's declaration order, so
+    equal sets share one cached serializer, or None when absent.
+    """
+    names = tuple(schema.model_fields)
+
+    def parse(
+        fields: Optional[str] = Query(None, description=f"Comma-separated subset of: {', '.join(names)}")
+    ) -> Optional[Tuple[str, ...]]:
+        if fields is None:
+            return None
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = requested - set(names)
+        if unknown:
+            raise HTTPException(status_code=422, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+        requested.add("id")
+        return tuple(name for name in names if name in requested)
+
+    return parse
+
+
+def include_set(relations: Sequence[str]) -> Callable[..., Tuple[str, ...]]:
+    """Dependency parsing ``?include=a,b`` into known ``relations``, in their declared order."""
+    def parse(
+        include: Optional[str] = Query(None, description=f"Comma-separated relations to embed: {', '.join(relations)}")
+    ) -> Tuple[str, ...]:
+        if include is None:
+            return ()
+        requested = {name.strip() for name in include.split(",") if name.strip()}
+        unknown = requested - set(relations)
+        if unknown:
+            raise HTTPException(status_code=422, detail=f"Unknown relations: {', '.join(sorted(unknown))}")
+        return tuple(name for name in relations if name in requested)
+
+    return parse
@@ -0,0 +1,189 @@
+"""Per-client rate limiting with token buckets.
+
+Requests are keyed by the bearer token's subject, falling back to the client IP
+(only once ``FORWARDED_ALLOW_IPS`` declares how clients reach us; otherwise
+anonymous requests all appear to come from the proxy and are not limited),
+and by route class, so cheap catalog reads and booking writes have separate
+budgets (``RATE_LIMIT_BUDGETS``: requests per second and burst size). Each
+bucket refills continuously; a request takes one token or is answered ``429``
+with ``Retry-After``. Every limited response carries ``RateLimit-Limit``,
+``RateLimit-Remaining`` and ``RateLimit-Reset`` (seconds until the bucket is
+full again).
+
+Buckets live in a fixed table of slots split into lock-sharded ranges, so
+concurrent requests only contend when they hash to the same shard. With
+``shared=True`` the table is an anonymous shared mmap and the locks are process
+locks; both are created at import, before ``python -m app.serve`` forks its
+workers, so every worker enforces the same limits. A slot holds one key at a
+time: a colliding key takes it over with a full bucket, which only ever errs on
+the side of allowing a request.
+
+A shard lock is only held for a table read and write, so ``take`` waits at most
+``lock_timeout`` for it and otherwise lets the request through. That bounds how
+long the event loop can block, and keeps a shard usable (unlimited, with a
+warning) if a worker is killed while holding its process lock.
+"""
+import hashlib
+import json
+import logging
+import math
+import mmap
+import multiprocessing
+import struct
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.security import verify_token
+from app.config.settings import settings
+
+# (methods or None for any, path prefix, route class); first match wins
+DEFAULT_RULES: Sequence[Tuple[Optional[frozenset], str, Optional[str]]] = (
+    (None, "/api/v1/health", None),
+    (None, "/api/v1/live", None),
+    (None, "/api/v1/ready", None),
+    (frozenset({"GET", "HEAD"}), "/api/v1/services", "catalog"),
+    (frozenset({"POST", "PATCH", "PUT", "DELETE"}), "/api/v1/bookings", "writes"),
+    (frozenset({"POST", "PATCH", "PUT", "DELETE"}), "/api/v1/reviews", "writes"),
+    (None, "/api/v1/", "default"),
+)
+
+logger = logging.getLogger(__name__)
+
+_SLOT = struct.Struct("<Qdd")  # key hash, tokens, last refill (monotonic seconds)
+
+
+class TokenBucketStore:
+    """Fixed-size table of token buckets guarded by ``shards`` locks."""
+
+    def __init__(self, slots: int = 65536, shards: int = 64, shared: bool = False, lock_timeout: float = 0.005):
+        self.slots = slots
+        self.shards = shards
+        self.lock_timeout = lock_timeout
+        self.lock_timeouts = 0
+        size = slots * _SLOT.size
+        if shared:
+            # Anonymous MAP_SHARED memory and semaphores survive fork, so all
+            # workers of one server see the same buckets
+            self._buffer = mmap.mmap(-1, size)
+            self._locks = [multiprocessing.Lock() for _ in range(shards)]
+        else:
+            self._buffer = bytearray(size)
+            self._locks = [threading.Lock() for _ in range(shards)]
+
+    @staticmethod
+    def key_hash(key: str) -> int:
+        # Stable across processes, unlike hash(); 0 marks an empty slot
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little") or 1
+
+    def take(self, key: str, rate: float, burst: int, now: Optional[float] = None) -> Tuple[bool, float]:
+        """Take one token from ``key``'s bucket; returns ``(allowed, tokens left)``.
+
+        If the shard lock is not free within ``lock_timeout`` the request is
+        allowed and reported as ``(True, burst)``.
+        """
+        now = time.monotonic() if now is None else now
+        key_hash = self.key_hash(key)
+        slot = key_hash % self.slots
+        offset = slot * _SLOT.size
+        lock = self._locks[slot % self.shards]
+        if not lock.acquire(timeout=self.lock_timeout):
+            self.lock_timeouts += 1
+            if self.lock_timeouts == 1:
+                logger.warning("Rate limit shard %d stayed locked; letting its requests through unlimited", slot % self.shards)
+            return True, float(burst)
+        try:
+            stored_hash, tokens, updated = _SLOT.unpack_from(self._buffer, offset)
+            if stored_hash != key_hash:
+                tokens, updated = float(burst), now
+            tokens = min(float(burst), tokens + max(now - updated, 0.0) * rate)
+            allowed = tokens >= 1.0
+            if allowed:
+                tokens -= 1.0
+            _SLOT.pack_into(self._buffer, offset, key_hash, tokens, now)
+        finally:
+            lock.release()
+        return allowed, tokens
+
+
+def parse_budgets(raw: str) -> Dict[str, Tuple[float, int]]:
+    """``{"class": [per_second, burst]}`` JSON into ``{class: (rate, burst)}``."""
+    return {name: (float(rate), int(burst)) for name, (rate, burst) in json.loads(raw).items()}
+
+
+@lru_cache(maxsize=4096)
+def _token_subject(token: str) -> Optional[str]:
+    return verify_token(token)
+
+
+def client_identity(scope: Scope) -> Optional[str]:
+    """Token subject for authenticated requests, otherwise the client address if trusted."""
+    authorization = Headers(scope=scope).get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        subject = _token_subject(token)
+        if subject is not None:
+            return f"sub:{subject}"
+    client = scope.get("client")
+    if client is None or not settings.client_ip_trusted:
+        return None
+    return f"ip:{client[0]}"
+
+
+class RateLimitMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        budgets: Dict[str, Tuple[float, int]],
+        store: Optional[TokenBucketStore] = None,
+        rules: Sequence[Tuple[Optional[frozenset], str, Optional[str]]] = DEFAULT_RULES,
+    ) -> None:
+        self.app = app
+        self.budgets = budgets
+        self.store = store or TokenBucketStore()
+        self.rules = rules
+
+    def route_class(self, method: str, path: str) -> Optional[str]:
+        for methods, prefix, name in self.rules:
+            if path.startswith(prefix) and (methods is None or method in methods):
+                return name if name in self.budgets else None
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        name = self.route_class(scope["method"], scope["path"])
+        if name is None:
+            await self.app(scope, receive, send)
+            return
+
+        identity = client_identity(scope)
+        if identity is None:
+            await self.app(scope, receive, send)
+            return
+
+        rate, burst = self.budgets[name]
+        allowed, tokens = self.store.take(f"{name}:{identity}", rate, burst)
+        headers = {
+            "RateLimit-Limit": str(burst),
+            "RateLimit-Remaining": str(int(tokens)),
+            "RateLimit-Reset": str(math.ceil((burst - tokens) / rate)),
+        }
+        if not allowed:
+            headers["Retry-After"] = str(math.ceil((1.0 - tokens) / rate))
+            response = JSONResponse({"detail": "Rate limit exceeded"}, status_code=429, headers=headers)
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).update(headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
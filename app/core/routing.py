@@ -0,0 +1,72 @@
+import asyncio
+import functools
+from typing import Any, Callable, Sequence
+
+from fastapi.routing import APIRoute
+from starlette.concurrency import run_in_threadpool
+
+from app.config.database import request_sessions
+
+
+def _release_sessions(result: Any = None) -> None:
+    keep = _response_objects(result)
+    for session in request_sessions.get() or ():
+        session.release(keep)
+
+
+def _response_objects(result: Any) -> Sequence:
+    # What the endpoint returned is all the response will serialize
+    if isinstance(result, (list, tuple)):
+        return result
+    return () if result is None else (result,)
+
+
+class SessionReleasingRoute(APIRoute):
+    """Route that returns the request's database connections to the pool as soon
+    as the endpoint returns, before FastAPI validates and serializes the response.
+
+    FastAPI only runs ``yield`` dependency teardown after the response has been
+    sent, which would otherwise keep a connection checked out for the whole of
+    serialization and transfer.
+    """
+
+    def get_route_handler(self) -> Callable:
+        call = self.dependant.call
+        if call is not None and not getattr(call, "_releases_sessions", False):
+            self.dependant.call = self._wrap_endpoint(call)
+        handler = super().get_route_handler()
+
+        @functools.wraps(handler)
+        async def route_handler(request):
+            token = request_sessions.set([])
+            try:
+                return await handler(request)
+            finally:
+                request_sessions.reset(token)
+
+        return route_handler
+
+    @staticmethod
+    def _wrap_endpoint(call: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(call):
+            @functools.wraps(call)
+            async def endpoint(*args, **kwargs):
+                result = None
+                try:
+                    result = await call(*args, **kwargs)
+                    return result
+                finally:
+                    # refresh()/close() do blocking I/O
+                    await run_in_threadpool(_release_sessions, result)
+        else:
+            @functools.wraps(call)
+            def endpoint(*args, **kwargs):
+                result = None
+                try:
+                    result = call(*args, **kwargs)
+                    return result
+                finally:
+                    _release_sessions(result)
+
+        endpoint._releases_sessions = True
+        return endpoint
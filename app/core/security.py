@@ -1,22 +1,37 @@
-from passlib.context import CryptContext
-from jose import JWTError, jwt
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 from app.config.settings import settings
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# passlib and jose (with its cryptography backend) are imported on first use,
+# keeping them off the startup path of the app and CLI tools.
+
+# bcrypt hash of "warm-up" at the default cost; verifying against it costs the
+# same as a real check (warm-up, logins for unknown emails)
+DUMMY_PASSWORD_HASH = "$2b$12$EjoU6xH/9sCXTqSBEdNnPeK7qmd4.RKW3Jcl3qgt8e4Yzv9UnoNn."
+
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    """Password hashing context."""
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def __getattr__(name: str):
+    if name == "pwd_context":
+        return get_pwd_context()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create a JWT access token."""
+    from jose import jwt
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
@@ -29,6 +44,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
 
 def create_refresh_token(data: dict):
     """Create a JWT refresh token."""
+    from jose import jwt
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(days=settings.refresh_token_expire_days)
     to_encode.update({"exp": expire})
@@ -37,6 +53,7 @@ def create_refresh_token(data: dict):
 
 def verify_token(token: str) -> Optional[str]:
     """Verify JWT token and return username if valid."""
+    from jose import JWTError, jwt
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
         username: str = payload.get("sub")
@@ -0,0 +1,137 @@
+import csv
+import enum
+import io
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Type
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+
+from app.config.settings import settings
+
+# Match Pydantic's JSON output: "Z" suffix for UTC, enums by value, UUIDs as strings
+ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+
+def _default(value: Any) -> Any:
+    """Fallback for types orjson does not handle natively (e.g. Decimal)."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+@lru_cache(maxsize=None)
+def get_list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """Return a cached TypeAdapter for ``List[schema]``."""
+    return TypeAdapter(List[schema])
+
+
+@lru_cache(maxsize=None)
+def get_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """Return a cached TypeAdapter for a single ``schema``."""
+    return TypeAdapter(schema)
+
+
+@lru_cache(maxsize=256)
+def partial_schema(schema: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """``schema`` trimmed to ``fields``, built once per field set.
+
+    Returning the same class for the same field set means its adapters (and their
+    compiled serializers) are cached by ``get_adapter``/``get_list_adapter`` too.
+    """
+    return create_model(
+        f"{schema.__name__}[{','.join(fields)}]",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in fields}
+    )
+
+
+def fields_response(schema: Type[BaseModel], content: Any, fields: Tuple[str, ...]) -> Response:
+    """Serialize one row, or a list of rows, with only ``fields`` of ``schema``.
+
+    The response bypasses the endpoint's ``response_model``, which would reject the
+    missing fields.
+    """
+    model = partial_schema(schema, fields)
+    adapter = get_list_adapter(model) if isinstance(content, list) else get_adapter(model)
+    validated = adapter.validate_python(content, from_attributes=True)
+    return Response(content=adapter.dump_json(validated), media_type="application/json")
+
+
+def dump_rows(schema: Type[BaseModel], rows: Iterable[Any]) -> list:
+    """Validate ORM rows once against ``schema`` and dump them to plain Python objects.
+
+    UUIDs, datetimes and enums are left as Python objects so orjson can encode
+    them natively; no intermediate JSON-mode conversion is done.
+    """
+    adapter = get_list_adapter(schema)
+    validated = adapter.validate_python(list(rows), from_attributes=True)
+    return adapter.dump_python(validated, mode="python")
+
+
+def list_response(schema: Type[BaseModel], rows: Iterable[Any], fields: Optional[Tuple[str, ...]] = None):
+    """Serialize a list endpoint result.
+
+    With ``fields`` (a sparse fieldset), only those fields are serialized; see
+    ``fields_response``. With ``FAST_JSON_RESPONSES`` enabled, rows are validated
+    once and returned as an ``ORJSONResponse`` so FastAPI skips its own
+    response_model validation and stdlib encoding. Otherwise the rows are returned
+    unchanged for the default pipeline.
+    """
+    if fields:
+        return fields_response(schema, list(rows), fields)
+    if not settings.fast_json_responses:
+        return rows
+    return ORJSONResponse(content=dump_rows(schema, rows))
+
+
+def item_response(schema: Type[BaseModel], row: Any, fields: Optional[Tuple[str, ...]] = None):
+    """Serialize a detail endpoint result, trimmed to ``fields`` when given."""
+    if fields:
+        return fields_response(schema, row, fields)
+    return row
+
+
+def iter_ndjson(rows: Iterable[Mapping[str, Any]]) -> Iterator[bytes]:
+    """Encode mappings as newline-delimited JSON, one line per row."""
+    for row in rows:
+        yield orjson.dumps(dict(row), default=_default, option=ORJSON_OPTIONS) + b"\n"
+
+
+def iter_csv(
+    rows: Iterable[Mapping[str, Any]], columns: Sequence[str], chunk_rows: int = 500
+) -> Iterator[bytes]:
+    """Encode mappings as CSV. The header is yielded before the first row is fetched."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield buffer.getvalue().encode()
+    buffer.seek(0)
+    buffer.truncate()
+
+    pending = 0
+    for row in rows:
+        writer.writerow(
+            [value.value if isinstance(value, enum.Enum) else value for value in (row[c] for c in columns)]
+        )
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if pending:
+        yield buffer.getvalue().encode()
@@ -0,0 +1,118 @@
+"""Startup warm-up.
+
+Pays the one-off costs of the first requests (mapper configuration, pydantic
+adapters, the bcrypt backend, opening database connections, loading the service
+catalog) before the instance reports ready on ``/api/v1/health``.
+"""
+import logging
+import time
+from typing import Dict
+
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+
+from app.config.settings import settings
+from app.core.security import DUMMY_PASSWORD_HASH
+
+logger = logging.getLogger(__name__)
+
+
+class WarmUpState:
+    def __init__(self):
+        self.ready = False
+        self.process_warmed = False  # inherited by workers forked after warm_up_process
+        self.timings: Dict[str, float] = {}
+
+
+state = WarmUpState()
+
+
+def configure_models() -> None:
+    from sqlalchemy.orm import configure_mappers
+    import app.models  # noqa: F401  registers every mapper
+
+    configure_mappers()
+
+
+def build_serializers(app) -> None:
+    from app.core.serialization import get_list_adapter
+    from app.schemas.booking import BookingResponse
+    from app.schemas.review import ReviewResponse
+    from app.schemas.service import ServiceResponse
+
+    for schema in (ServiceResponse, BookingResponse, ReviewResponse):
+        get_list_adapter(schema)
+    app.openapi()
+
+
+def load_password_hasher() -> None:
+    from app.core.security import verify_password
+
+    verify_password("warm-up", DUMMY_PASSWORD_HASH)
+
+
+def prefill_pool(engine) -> int:
+    """Open up to ``DB_POOL_SIZE`` connections at once so they sit idle in the pool."""
+    size = settings.db_pool_size if isinstance(engine.pool, QueuePool) else 1
+    connections = []
+    try:
+        for _ in range(size):
+            connection = engine.connect()
+            connections.append(connection)
+            connection.execute(text("SELECT 1"))
+    finally:
+        for connection in connections:
+            connection.close()
+    return len(connections)
+
+
+def prime_catalog(session_factory) -> int:
+    from app.services.service_service import ServiceService
+
+    db = session_factory()
+    try:
+        return len(ServiceService(db).get_catalog())
+    finally:
+        db.close()
+
+
+def warm_up_process(app) -> None:
+    """Warm-up steps that need no database; safe to run in a pre-fork master."""
+    warmed = [
+        _step("configure_mappers", configure_models),
+        _step("build_serializers", build_serializers, app),
+        _step("password_hasher", load_password_hasher),
+    ]
+    state.process_warmed = all(warmed)
+
+
+def warm_up(app, engine=None, session_factory=None) -> Dict[str, float]:
+    """Run every warm-up step, then mark the instance ready.
+
+    A failing database step is logged rather than raised: readiness then falls
+    back to the health check's own database probe. Workers forked from a master
+    that already ran ``warm_up_process`` skip those steps.
+    """
+    from app.config.database import engine as default_engine, SessionLocal
+
+    engine = engine or default_engine
+    session_factory = session_factory or SessionLocal
+    if not state.process_warmed:
+        warm_up_process(app)
+    _step("prefill_pool", prefill_pool, engine)
+    _step("prime_catalog", prime_catalog, session_factory)
+    state.ready = True
+    logger.info("Warm-up finished: %s", state.timings)
+    return state.timings
+
+
+def _step(name: str, fn, *args) -> bool:
+    started = time.perf_counter()
+    try:
+        fn(*args)
+        return True
+    except Exception:
+        logger.exception("Warm-up step %s failed", name)
+        return False
+    finally:
+        state.timings[name] = round(time.perf_counter() - started, 4)
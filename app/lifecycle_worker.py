@@ -0,0 +1,72 @@
+"""Background worker that completes and expires past bookings.
+
+Runs inside the API process when ``LIFECYCLE_WORKER_ENABLED=true`` (see the
+lifespan in ``app.main``), or standalone:
+
+    python -m app.lifecycle_worker            # loop forever
+    python -m app.lifecycle_worker --once     # single pass, e.g. from cron
+"""
+import argparse
+import asyncio
+import logging
+import time
+from typing import Dict
+
+import anyio
+
+from app.config.database import SessionLocal
+from app.config.settings import settings
+from app.services.lifecycle_service import BookingLifecycleService
+from app.services.partition_service import BookingPartitionService
+from app.services.sync_service import BookingSyncService
+
+logger = logging.getLogger(__name__)
+
+
+def run_lifecycle_pass(batch_size: int = None) -> Dict[str, int]:
+    """Run one pass of booking transitions in a fresh session.
+
+    Also keeps monthly bookings partitions created ahead of time when the table is
+    partitioned, and drops deletion tombstones past their retention.
+    """
+    db = SessionLocal()
+    try:
+        totals = BookingLifecycleService(db).run(batch_size or settings.lifecycle_batch_size)
+        totals["partitions_created"] = BookingPartitionService(db).ensure_partitions()
+        totals["tombstones_purged"] = BookingSyncService(db).purge_tombstones()
+    finally:
+        db.close()
+    if any(totals.values()):
+        logger.info("Booking lifecycle pass: %s", totals)
+    return totals
+
+
+async def lifecycle_loop(interval: float = None) -> None:
+    """Run lifecycle passes forever in a worker thread, every ``interval`` seconds."""
+    interval = interval or settings.lifecycle_interval_seconds
+    while True:
+        try:
+            await anyio.to_thread.run_sync(run_lifecycle_pass)
+        except Exception:
+            logger.exception("Booking lifecycle pass failed")
+        await asyncio.sleep(interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Complete and expire past bookings.")
+    parser.add_argument("--once", action="store_true", help="run a single pass and exit")
+    parser.add_argument("--interval", type=float, default=settings.lifecycle_interval_seconds)
+    parser.add_argument("--batch-size", type=int, default=settings.lifecycle_batch_size)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=settings.log_level)
+    while True:
+        totals = run_lifecycle_pass(args.batch_size)
+        if args.once:
+            print(totals)
+            return
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
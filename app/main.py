@@ -1,9 +1,55 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+import anyio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config.settings import settings
-from app.api.v1 import auth, users, services, bookings, reviews, health
+from app.core.compression import CompressionMiddleware
+from app.core.ratelimit import RateLimitMiddleware, TokenBucketStore, parse_budgets
+from app.core import warmup
+from app.core.heartbeat import get_heartbeat
+from app.core.invalidation import get_invalidation_bus
+from app.api.v1 import auth, users, services, bookings, reviews, health, admin
 
-app = FastAPI(title="BookIt API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    background_tasks = []
+    # Warm up in the background so /api/v1/health can answer "not ready" meanwhile
+    if settings.warm_up_enabled and not settings.testing:
+        background_tasks.append(asyncio.create_task(anyio.to_thread.run_sync(warmup.warm_up, app)))
+    else:
+        warmup.state.ready = True
+    if not settings.testing:
+        background_tasks.append(asyncio.create_task(get_heartbeat().run()))
+        background_tasks.append(asyncio.create_task(get_invalidation_bus().run()))
+    if settings.lifecycle_worker_enabled:
+        from app.lifecycle_worker import lifecycle_loop
+        background_tasks.append(asyncio.create_task(lifecycle_loop()))
+    if settings.outbox_dispatcher_enabled:
+        from app.outbox_worker import outbox_loop
+        background_tasks.append(asyncio.create_task(outbox_loop()))
+    
+    yield
+    
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+app = FastAPI(title="BookIt API", lifespan=lifespan)
+
+# Rate limiting (inside CORS so 429s still carry CORS headers). The store is
+# created here, at import, so app.serve's forked workers share it.
+if settings.rate_limit_enabled and not settings.testing:
+    app.add_middleware(
+        RateLimitMiddleware,
+        budgets=parse_budgets(settings.rate_limit_budgets),
+        store=TokenBucketStore(
+            slots=settings.rate_limit_slots,
+            shards=settings.rate_limit_shards,
+            shared=settings.rate_limit_shared,
+        ),
+    )
 
 # CORS
 app.add_middleware(
@@ -14,6 +60,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compression
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        offload_size=settings.compression_offload_size,
+        flush_size=settings.compression_flush_size,
+        content_types=settings.compressible_content_types,
+        levels={
+            "gzip": settings.compression_gzip_level,
+            "br": settings.compression_brotli_quality,
+            "zstd": settings.compression_zstd_level,
+        },
+    )
+
 # API routes
 app.include_router(health.router, prefix="/api/v1")
 app.include_router(auth.router, prefix="/api/v1")
@@ -21,6 +82,7 @@ app.include_router(users.router, prefix="/api/v1")
 app.include_router(services.router, prefix="/api/v1")
 app.include_router(bookings.router, prefix="/api/v1")
 app.include_router(reviews.router, prefix="/api/v1")
+app.include_router(admin.router, prefix="/api/v1")
 
 @app.get("/")
 def root():
@@ -2,5 +2,9 @@ from app.models.user import User, UserRole
 from app.models.service import Service
 from app.models.booking import Booking, BookingStatus
 from app.models.review import Review
+from app.models.booking_stats import BookingDailyStats
+from app.models.booking_tombstone import BookingTombstone
+from app.models.cache_generation import CacheGeneration
+from app.models.outbox import OutboxEvent
 
-__all__ = ["User", "UserRole", "Service", "Booking", "BookingStatus", "Review"]
\ No newline at end of file
+__all__ = ["User", "UserRole", "Service", "Booking", "BookingStatus", "Review", "BookingDailyStats", "BookingTombstone", "CacheGeneration", "OutboxEvent"]
\ No newline at end of file
@@ -1,10 +1,11 @@
-from sqlalchemy import Column, ForeignKey, DateTime, Enum
+from sqlalchemy import Column, ForeignKey, DateTime, Enum, Index, PrimaryKeyConstraint, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.config.database import Base
+from app.utils.ids import uuid7
+from datetime import datetime, timezone
 import enum
-import uuid
 
 class BookingStatus(enum.Enum):
     PENDING = "pending"
@@ -12,17 +13,45 @@ class BookingStatus(enum.Enum):
     CANCELLED = "cancelled"
     COMPLETED = "completed"
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
 class Booking(Base):
     __tablename__ = "bookings"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    # Minted by uuid7() on insert only; the API never accepts a client-supplied id
+    id = Column(UUID(as_uuid=True), nullable=False, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     service_id = Column(UUID(as_uuid=True), ForeignKey("services.id"), nullable=False)
-    start_time = Column(DateTime(timezone=True), nullable=False, index=True)
+    start_time = Column(DateTime(timezone=True), nullable=False, index=True)  # partition key
     end_time = Column(DateTime(timezone=True), nullable=False, index=True)
     status = Column(Enum(BookingStatus), default=BookingStatus.PENDING, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Set on every ORM and Core update; drives GET /bookings/changes
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow, onupdate=_utcnow, server_default=func.now())
+
+    __table_args__ = (
+        # PostgreSQL needs the partition key in the primary key (b7e1c2d94f30),
+        # so id alone is unique only because nothing but uuid7() assigns it
+        PrimaryKeyConstraint('id', 'start_time', name='bookings_pkey'),
+        Index('ix_bookings_service_id_start_time', 'service_id', 'start_time'),
+        Index('ix_bookings_user_id_start_time', 'user_id', 'start_time'),
+        Index('ix_bookings_user_id_updated_at', 'user_id', 'updated_at'),
+        Index(
+            'ix_bookings_active_service_slot', 'service_id', 'start_time', 'end_time',
+            postgresql_where=text("status IN ('PENDING', 'CONFIRMED')"),
+            sqlite_where=text("status IN ('PENDING', 'CONFIRMED')")
+        ),
+    )
+
+    # Rows are still identified by id alone
+    __mapper_args__ = {"primary_key": [id]}
 
     user = relationship("User", back_populates="bookings")
     service = relationship("Service", back_populates="bookings")
-    review = relationship("Review", back_populates="booking", uselist=False)
\ No newline at end of file
+    # No foreign key (partitioned parent); BookingService.delete_booking removes the review,
+    # and passive_deletes stops the ORM from nulling reviews.booking_id on its own
+    review = relationship(
+        "Review", primaryjoin="Booking.id == foreign(Review.booking_id)",
+        back_populates="booking", uselist=False, passive_deletes="all"
+    )
\ No newline at end of file
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Date, ForeignKey, Integer, Numeric
+from sqlalchemy.dialects.postgresql import UUID
+from app.config.database import Base
+
+class BookingDailyStats(Base):
+    """Per service and day (UTC, by start_time) booking counters.
+
+    Maintained by ``BookingStatsService`` in the same transaction as the booking
+    change; ``python -m app.booking_stats rebuild`` recomputes it from bookings.
+    """
+    __tablename__ = "booking_daily_stats"
+
+    day = Column(Date, primary_key=True)
+    service_id = Column(UUID(as_uuid=True), ForeignKey("services.id"), primary_key=True)
+    bookings = Column(Integer, nullable=False, default=0)
+    cancelled = Column(Integer, nullable=False, default=0)
+    completed = Column(Integer, nullable=False, default=0)
+    booked_minutes = Column(Integer, nullable=False, default=0)  # excludes cancelled bookings
+    revenue = Column(Numeric(12, 2), nullable=False, default=0)  # Service.price x completed
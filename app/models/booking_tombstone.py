@@ -0,0 +1,16 @@
+from sqlalchemy import Column, DateTime, Index
+from sqlalchemy.dialects.postgresql import UUID
+from app.config.database import Base
+from app.models.booking import _utcnow
+
+class BookingTombstone(Base):
+    """Record of a deleted booking, so ``GET /bookings/changes`` can report the deletion."""
+    __tablename__ = "booking_tombstones"
+
+    booking_id = Column(UUID(as_uuid=True), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), nullable=False)
+    deleted_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow)
+
+    __table_args__ = (
+        Index('ix_booking_tombstones_user_id_deleted_at', 'user_id', 'deleted_at'),
+    )
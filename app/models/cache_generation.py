@@ -0,0 +1,9 @@
+from sqlalchemy import BigInteger, Column, String
+from app.config.database import Base
+
+class CacheGeneration(Base):
+    """Invalidation counter per in-process cache; see ``app.core.invalidation``."""
+    __tablename__ = "cache_generations"
+
+    name = Column(String(100), primary_key=True)
+    generation = Column(BigInteger, nullable=False, default=0)
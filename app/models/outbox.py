@@ -0,0 +1,32 @@
+from sqlalchemy import Column, DateTime, Index, Integer, JSON, String, Text, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.config.database import Base
+from app.utils.ids import uuid7
+
+class OutboxEvent(Base):
+    """Booking or review event awaiting delivery; see ``app.services.outbox_service``."""
+    __tablename__ = "outbox_events"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    event_type = Column(String(50), nullable=False)
+    aggregate_id = Column(UUID(as_uuid=True), nullable=False)
+    payload = Column(JSON, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    available_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    delivered_at = Column(DateTime(timezone=True))
+    last_error = Column(Text)
+
+    __table_args__ = (
+        Index(
+            'ix_outbox_events_pending', 'available_at',
+            postgresql_where=text("delivered_at IS NULL"),
+            sqlite_where=text("delivered_at IS NULL")
+        ),
+        Index(
+            'ix_outbox_events_delivered_at', 'delivered_at',
+            postgresql_where=text("delivered_at IS NOT NULL"),
+            sqlite_where=text("delivered_at IS NOT NULL")
+        ),
+    )
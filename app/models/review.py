@@ -1,15 +1,16 @@
-from sqlalchemy import Column, Integer, ForeignKey, Text, DateTime, CheckConstraint
+from sqlalchemy import Column, Integer, Text, DateTime, CheckConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.config.database import Base
-import uuid
+from app.utils.ids import uuid7
 
 class Review(Base):
     __tablename__ = "reviews"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    booking_id = Column(UUID(as_uuid=True), ForeignKey("bookings.id"), nullable=False, unique=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    # Not a foreign key: bookings is partitioned and its primary key is (id, start_time)
+    booking_id = Column(UUID(as_uuid=True), nullable=False, unique=True)
     rating = Column(Integer, nullable=False)
     comment = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -18,4 +19,4 @@ class Review(Base):
         CheckConstraint('rating >= 1 AND rating <= 5', name='rating_range'),
     )
 
-    booking = relationship("Booking", back_populates="review")
\ No newline at end of file
+    booking = relationship("Booking", primaryjoin="foreign(Review.booking_id) == Booking.id", back_populates="review")
\ No newline at end of file
@@ -3,12 +3,12 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.config.database import Base
-import uuid
+from app.utils.ids import uuid7
 
 class Service(Base):
     __tablename__ = "services"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     title = Column(String(200), nullable=False, index=True)
     description = Column(Text)
     price = Column(Numeric(10, 2), nullable=False)
@@ -0,0 +1,185 @@
+"""Dispatcher that delivers outbox events to webhooks and internal consumers.
+
+Runs inside the API process when ``OUTBOX_DISPATCHER_ENABLED=true`` (see the
+lifespan in ``app.main``), or standalone:
+
+    python -m app.outbox_worker            # loop forever
+    python -m app.outbox_worker --once     # deliver one batch, e.g. from cron
+
+Each batch is claimed with ``FOR UPDATE SKIP LOCKED`` (``OutboxService.claim``),
+then every event goes to every consumer concurrently, with at most
+``OUTBOX_CONCURRENCY`` deliveries in flight. An event counts as delivered once
+all consumers accepted it; otherwise the whole event is retried with exponential
+backoff, up to ``OUTBOX_MAX_ATTEMPTS`` attempts. Webhooks receive
+``{"id", "type", "created_at", "data"}`` as JSON and must answer 2xx.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Sequence
+
+import anyio
+import httpx
+
+from app.config.database import SessionLocal
+from app.config.settings import settings
+from app.services.outbox_service import OutboxService
+
+logger = logging.getLogger(__name__)
+
+Consumer = Callable[[dict], Awaitable[None]]
+
+
+def event_body(event: dict) -> dict:
+    return {
+        "id": str(event["id"]),
+        "type": event["event_type"],
+        "created_at": event["created_at"].isoformat() if event["created_at"] else None,
+        "data": event["payload"],
+    }
+
+
+def webhook_consumer(url: str, client: httpx.AsyncClient) -> Consumer:
+    """POST events to ``url``; any non-2xx answer or transport error fails the delivery."""
+    async def deliver(event: dict) -> None:
+        response = await client.post(url, json=event_body(event), headers={
+            "X-Event-Id": str(event["id"]),
+            "X-Event-Type": event["event_type"],
+        })
+        response.raise_for_status()
+
+    deliver.__qualname__ = f"webhook {url}"
+    return deliver
+
+
+class OutboxDispatcher:
+    def __init__(
+        self,
+        consumers: Iterable[Consumer] = (),
+        webhook_urls: Optional[Sequence[str]] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        session_factory=SessionLocal,
+        batch_size: int = None,
+        concurrency: int = None,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size or settings.outbox_batch_size
+        self.concurrency = concurrency or settings.outbox_concurrency
+        self.timeout = settings.outbox_delivery_timeout_seconds
+        self.client = client or httpx.AsyncClient(timeout=self.timeout)
+        self.consumers: List[Consumer] = list(consumers)
+        urls = settings.outbox_webhooks if webhook_urls is None else webhook_urls
+        self.consumers += [webhook_consumer(url, self.client) for url in urls]
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._next_purge = 0.0
+
+    def subscribe(self, consumer: Consumer) -> None:
+        """Add an internal consumer: an async callable taking the event dict."""
+        self.consumers.append(consumer)
+
+    async def dispatch_batch(self) -> Dict[str, int]:
+        """Claim, deliver and settle one batch; returns counts."""
+        events = await anyio.to_thread.run_sync(self._claim)
+        if not events:
+            return {"claimed": 0, "delivered": 0, "failed": 0}
+
+        errors = await asyncio.gather(*(self._deliver(event) for event in events))
+        delivered = [event["id"] for event, error in zip(events, errors) if error is None]
+        failed = [(event["id"], event["attempts"], error) for event, error in zip(events, errors) if error]
+        for event_id, attempts, error in failed:
+            if attempts >= settings.outbox_max_attempts:
+                logger.error("Giving up on outbox event %s after %d attempts: %s", event_id, attempts, error)
+        await anyio.to_thread.run_sync(self._settle, delivered, failed)
+        return {"claimed": len(events), "delivered": len(delivered), "failed": len(failed)}
+
+    async def _deliver(self, event: dict) -> Optional[str]:
+        """Hand ``event`` to every consumer; returns the failures, or None if all succeeded."""
+        errors = []
+
+        async def call(consumer: Consumer) -> None:
+            async with self._slots:
+                try:
+                    await asyncio.wait_for(consumer(event), self.timeout)
+                except Exception as exc:
+                    errors.append(f"{consumer.__qualname__}: {exc!r}")
+
+        await asyncio.gather(*(call(consumer) for consumer in self.consumers))
+        if errors:
+            logger.warning("Outbox event %s (%s) failed: %s", event["id"], event["event_type"], errors)
+        return "; ".join(errors) or None
+
+    def _claim(self) -> List[dict]:
+        db = self.session_factory()
+        try:
+            return OutboxService(db).claim(self.batch_size)
+        finally:
+            db.close()
+
+    def _settle(self, delivered, failed) -> None:
+        db = self.session_factory()
+        try:
+            OutboxService(db).settle(delivered, failed)
+        finally:
+            db.close()
+
+    def _purge(self) -> int:
+        db = self.session_factory()
+        try:
+            before = datetime.now(timezone.utc) - timedelta(hours=settings.outbox_retention_hours)
+            return OutboxService(db).purge_delivered(before)
+        finally:
+            db.close()
+
+    async def run(self, interval: float = None) -> None:
+        """Dispatch forever; full batches are followed immediately by the next one."""
+        interval = interval or settings.outbox_poll_interval_seconds
+        if not self.consumers:
+            logger.warning("Outbox dispatcher has no consumers; events will be marked delivered")
+        try:
+            while True:
+                claimed = 0
+                try:
+                    claimed = (await self.dispatch_batch())["claimed"]
+                    if time.monotonic() >= self._next_purge:
+                        self._next_purge = time.monotonic() + 60
+                        await anyio.to_thread.run_sync(self._purge)
+                except Exception:
+                    logger.exception("Outbox dispatch failed")
+                if claimed < self.batch_size:
+                    await asyncio.sleep(interval)
+        finally:
+            await self.client.aclose()
+
+
+async def outbox_loop() -> None:
+    await OutboxDispatcher().run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Deliver outbox events to webhooks.")
+    parser.add_argument("--once", action="store_true", help="deliver a single batch and exit")
+    parser.add_argument("--interval", type=float, default=settings.outbox_poll_interval_seconds)
+    parser.add_argument("--batch-size", type=int, default=settings.outbox_batch_size)
+    parser.add_argument("--concurrency", type=int, default=settings.outbox_concurrency)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=settings.log_level)
+
+    async def dispatch():
+        dispatcher = OutboxDispatcher(batch_size=args.batch_size, concurrency=args.concurrency)
+        if not args.once:
+            await dispatcher.run(args.interval)
+            return
+        try:
+            print(json.dumps(await dispatcher.dispatch_batch()))
+        finally:
+            await dispatcher.client.aclose()
+
+    asyncio.run(dispatch())
+
+
+if __name__ == "__main__":
+    main()
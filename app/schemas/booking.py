@@ -1,8 +1,10 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
 from app.models.booking import BookingStatus
+from app.schemas.review import ReviewResponse
+from app.schemas.service import ServiceResponse
 
 class BookingBase(BaseModel):
     service_id: UUID
@@ -22,5 +24,18 @@ class BookingResponse(BookingBase):
     user_id: UUID
     status: BookingStatus
     created_at: datetime
+    updated_at: Optional[datetime] = None
     class Config:
         from_attributes = True
+
+class BookingWithRelations(BookingResponse):
+    """Booking with the relations named in ``?include=`` embedded."""
+    service: Optional[ServiceResponse] = None
+    review: Optional[ReviewResponse] = None
+
+class BookingChanges(BaseModel):
+    """One page of ``GET /bookings/changes``; pass ``next_token`` as ``since`` next time."""
+    changed: List[BookingResponse]
+    deleted: List[UUID]
+    next_token: str
+    has_more: bool
@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+from datetime import date
+from uuid import UUID
+
+class StatsCounters(BaseModel):
+    bookings: int
+    cancelled: int
+    completed: int
+    booked_minutes: int
+    revenue: float
+    cancellation_rate: float
+    utilisation: float
+
+class DailyServiceStats(StatsCounters):
+    day: date
+    service_id: UUID
+
+class ServiceStats(StatsCounters):
+    service_id: UUID
+    title: str
@@ -0,0 +1,349 @@
+"""Bulk synthetic data generator and seeder.
+
+    python -m app.seed --admin                                   # just the admin user
+    python -m app.seed --users 1000000 --services 5000 --bookings 10000000 --workers 8
+
+Rows are generated in chunks by a pool of worker processes. Every id and value is
+derived from ``--seed``, the entity kind and the row index, so a run is fully
+reproducible and workers never need to coordinate. On PostgreSQL each worker
+writes its own chunk with ``COPY FROM STDIN`` (binary format with psycopg 3, CSV
+with psycopg2); on other databases (SQLite) the parent inserts the generated
+chunks with batched executemany.
+
+Seeded users are ``user<N>@bookit.example`` and share one password whose bcrypt
+hash is computed once up front.
+"""
+import argparse
+import csv
+import io
+import os
+import random
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from functools import partial
+from typing import Dict, Iterator, List, Tuple
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.config.database import database_url, driver_name
+from app.config.settings import settings
+from app.utils.ids import uuid7_from_parts
+from app.core.security import get_password_hash
+from app.models.booking import Booking, BookingStatus
+from app.models.review import Review
+from app.models.service import Service
+from app.models.user import User, UserRole
+from app.services.partition_service import BookingPartitionService
+from app.services.stats_service import BookingStatsService
+
+SEED_PASSWORD = "seed-password"
+SLOT_MINUTES = 60
+SLOTS_PER_DAY = 8
+REVIEW_RATE = 0.3
+SEED_EPOCH_MS = 1_577_836_800_000  # 2020-01-01, timestamp of seeded id 0
+
+USER_COLUMNS = ("id", "name", "email", "password_hash", "role", "created_at")
+SERVICE_COLUMNS = ("id", "title", "description", "price", "duration_minutes", "is_active", "created_at")
+BOOKING_COLUMNS = ("id", "user_id", "service_id", "start_time", "end_time", "status", "created_at")
+REVIEW_COLUMNS = ("id", "booking_id", "rating", "comment", "created_at")
+
+# PostgreSQL types for binary COPY, matching the *_COLUMNS above. Enums travel as
+# their text label, which is also their binary wire format.
+COPY_TYPES = {
+    "users": ("uuid", "text", "text", "text", "text", "timestamptz"),
+    "services": ("uuid", "text", "text", "numeric", "int4", "bool", "timestamptz"),
+    "bookings": ("uuid", "uuid", "uuid", "timestamptz", "timestamptz", "text", "timestamptz"),
+    "reviews": ("uuid", "uuid", "int4", "text", "timestamptz"),
+}
+
+
+def user_email(index: int) -> str:
+    return f"user{index}@bookit.example"
+
+
+def entity_id(seed: int, kind: str, index: int) -> uuid.UUID:
+    """Deterministic id for row ``index`` of ``kind``; lets bookings reference users without a lookup.
+
+    Laid out as a UUIDv7 whose timestamp grows with ``index``, so seeded tables get
+    the same append-only primary-key order as rows created by the app.
+    """
+    digest = uuid.uuid5(uuid.NAMESPACE_OID, f"bookit:{seed}:{kind}:{index}").int
+    return uuid7_from_parts(SEED_EPOCH_MS + index, digest >> 64, digest)
+
+
+def _rng(seed: int, kind: str, start: int) -> random.Random:
+    return random.Random(f"{seed}:{kind}:{start}")
+
+
+def generate_users(seed: int, start: int, stop: int, ctx: dict) -> Dict[str, List[tuple]]:
+    created_at = ctx["now"]
+    rows = [
+        (entity_id(seed, "user", i), f"User {i}", user_email(i), ctx["password_hash"], UserRole.USER, created_at)
+        for i in range(start, stop)
+    ]
+    return {"users": rows}
+
+
+def generate_services(seed: int, start: int, stop: int, ctx: dict) -> Dict[str, List[tuple]]:
+    rng = _rng(seed, "service", start)
+    rows = [
+        (
+            entity_id(seed, "service", i), f"Service {i}", f"Seeded service {i}",
+            rng.randrange(1000, 20000) / 100, SLOT_MINUTES, True, ctx["now"]
+        )
+        for i in range(start, stop)
+    ]
+    return {"services": rows}
+
+
+def generate_bookings(seed: int, start: int, stop: int, ctx: dict) -> Dict[str, List[tuple]]:
+    """Hourly slots assigned round-robin to services, so no two bookings of a service overlap."""
+    rng = _rng(seed, "booking", start)
+    now, first_day = ctx["now"], ctx["first_day"]
+    services, users = ctx["services"], ctx["users"]
+    bookings, reviews = [], []
+    for i in range(start, stop):
+        slot = i // services
+        start_time = first_day + timedelta(days=slot // SLOTS_PER_DAY, hours=9 + slot % SLOTS_PER_DAY)
+        end_time = start_time + timedelta(minutes=SLOT_MINUTES)
+        if end_time < now:
+            status = rng.choices([BookingStatus.COMPLETED, BookingStatus.CANCELLED], weights=[9, 1])[0]
+        else:
+            status = rng.choices(
+                [BookingStatus.PENDING, BookingStatus.CONFIRMED, BookingStatus.CANCELLED], weights=[3, 6, 1]
+            )[0]
+        booking_id = entity_id(seed, "booking", i)
+        bookings.append((
+            booking_id, entity_id(seed, "user", rng.randrange(users)), entity_id(seed, "service", i % services),
+            start_time, end_time, status, start_time - timedelta(days=rng.randrange(1, 30))
+        ))
+        if status == BookingStatus.COMPLETED and rng.random() < REVIEW_RATE:
+            reviews.append((entity_id(seed, "review", i), booking_id, rng.randint(1, 5), None, end_time))
+    return {"bookings": bookings, "reviews": reviews}
+
+
+GENERATORS = {"users": generate_users, "services": generate_services, "bookings": generate_bookings}
+TABLES = {
+    "users": (User.__table__, USER_COLUMNS),
+    "services": (Service.__table__, SERVICE_COLUMNS),
+    "bookings": (Booking.__table__, BOOKING_COLUMNS),
+    "reviews": (Review.__table__, REVIEW_COLUMNS),
+}
+
+
+def _csv_value(value):
+    if value is None:
+        return None
+    if isinstance(value, (UserRole, BookingStatus)):
+        return value.name
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def copy_chunk(connection, table: str, rows: List[tuple]) -> None:
+    """Write rows with COPY FROM STDIN (PostgreSQL)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_csv_value(value) for value in row])
+    buffer.seek(0)
+    columns = ",".join(TABLES[table][1])
+    with connection.connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+
+def _binary_value(value):
+    if isinstance(value, (UserRole, BookingStatus)):
+        return value.name
+    if isinstance(value, float):
+        return Decimal(str(value))
+    return value
+
+
+def copy_chunk_binary(connection, table: str, rows: List[tuple]) -> None:
+    """Write rows with binary COPY FROM STDIN (psycopg 3); skips text formatting and parsing."""
+    columns = ",".join(TABLES[table][1])
+    with connection.connection.cursor() as cursor:
+        with cursor.copy(f"COPY {table} ({columns}) FROM STDIN (FORMAT BINARY)") as copy:
+            copy.set_types(COPY_TYPES[table])
+            for row in rows:
+                copy.write_row([_binary_value(value) for value in row])
+
+
+def insert_chunk(connection, table: str, rows: List[tuple]) -> None:
+    """Write rows with a batched executemany (insertmanyvalues where supported)."""
+    sa_table, columns = TABLES[table]
+    if rows:
+        connection.execute(sa_table.insert(), [dict(zip(columns, row)) for row in rows])
+
+
+_worker_engine = None
+
+
+def _generate(task: Tuple[str, int, int], seed: int, ctx: dict) -> Dict[str, List[tuple]]:
+    kind, start, stop = task
+    return GENERATORS[kind](seed, start, stop, ctx)
+
+
+def _postgres_worker(task: Tuple[str, int, int], seed: int, ctx: dict) -> Dict[str, int]:
+    """Generate one chunk and COPY it on this worker's own connection."""
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = create_engine(database_url(), poolclass=NullPool)
+    chunk = _generate(task, seed, ctx)
+    write = copy_chunk_binary if driver_name(_worker_engine) == "psycopg" else copy_chunk
+    with _worker_engine.begin() as connection:
+        for table, rows in chunk.items():
+            write(connection, table, rows)
+    return {table: len(rows) for table, rows in chunk.items()}
+
+
+def _bounded_map(pool, fn, tasks: list, window: int) -> Iterator:
+    """Like ``pool.map`` but keeps at most ``window`` chunks in flight to bound memory."""
+    pending = deque()
+    for task in tasks:
+        pending.append(pool.submit(fn, task))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _add_counts(report: dict, counts: Dict[str, int]) -> None:
+    for table, count in counts.items():
+        report[table] = report.get(table, 0) + count
+
+
+def _chunks(total: int, size: int) -> List[Tuple[int, int]]:
+    return [(start, min(start + size, total)) for start in range(0, total, size)]
+
+
+def seed_data(
+    engine, users: int, services: int, bookings: int,
+    seed: int = 42, workers: int = None, chunk_size: int = 100_000,
+    anchor: date = None, password: str = SEED_PASSWORD
+) -> dict:
+    """Generate and load the requested volumes; returns row counts and timings."""
+    if bookings and (not users or not services):
+        raise ValueError("Bookings need at least one user and one service")
+    workers = workers or os.cpu_count() or 1
+    anchor = anchor or datetime.now(timezone.utc).date()
+    days_needed = bookings // max(services, 1) // SLOTS_PER_DAY + 1
+    first_day = datetime.combine(anchor - timedelta(days=days_needed // 2), datetime.min.time(), tzinfo=timezone.utc)
+    ctx = {
+        "now": datetime.combine(anchor, datetime.min.time(), tzinfo=timezone.utc),
+        "first_day": first_day,
+        "users": users,
+        "services": services,
+        "password_hash": get_password_hash(password),
+    }
+    use_copy = engine.dialect.name == "postgresql"
+    report = {}
+
+    if use_copy:
+        with Session(engine) as db:
+            if bookings and BookingPartitionService(db).is_partitioned():
+                db.execute(
+                    text("SELECT bookings_create_partitions(CAST(:first_day AS date), :months)"),
+                    {"first_day": first_day, "months": settings.booking_partition_months_ahead}
+                )
+                db.commit()
+
+    # Bookings (and their reviews) reference users and services, so load those first
+    phases = [
+        ("users_services", [("users", users), ("services", services)]),
+        ("bookings_reviews", [("bookings", bookings)]),
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for phase, kinds in phases:
+            started = time.perf_counter()
+            tasks = [(kind, start, stop) for kind, total in kinds for start, stop in _chunks(total, chunk_size)]
+            if use_copy:
+                worker = partial(_postgres_worker, seed=seed, ctx=ctx)
+                for counts in _bounded_map(pool, worker, tasks, window=workers * 2):
+                    _add_counts(report, counts)
+            else:
+                worker = partial(_generate, seed=seed, ctx=ctx)
+                for chunk in _bounded_map(pool, worker, tasks, window=workers * 2):
+                    with engine.begin() as connection:
+                        for table, rows in chunk.items():
+                            insert_chunk(connection, table, rows)
+                    _add_counts(report, {table: len(rows) for table, rows in chunk.items()})
+            report[f"{phase}_seconds"] = round(time.perf_counter() - started, 2)
+
+    if bookings:
+        # COPY and bulk inserts bypass BookingService, so build the summary in one pass
+        started = time.perf_counter()
+        with Session(engine) as db:
+            report["booking_daily_stats"] = BookingStatsService(db).rebuild()
+        report["stats_seconds"] = round(time.perf_counter() - started, 2)
+
+    if use_copy:
+        with engine.begin() as connection:
+            connection.execute(text(
+                "ANALYZE users; ANALYZE services; ANALYZE bookings; ANALYZE reviews; ANALYZE booking_daily_stats"
+            ))
+    return report
+
+
+def create_admin_user(db: Session) -> bool:
+    """Create the admin from ADMIN_* settings; returns False if it already exists."""
+    existing_admin = db.query(User).filter(
+        User.email == settings.admin_email,
+        User.role == UserRole.ADMIN
+    ).first()
+    if existing_admin:
+        return False
+
+    db.add(User(
+        name=settings.admin_name,
+        email=settings.admin_email,
+        password_hash=get_password_hash(settings.admin_password),
+        role=UserRole.ADMIN
+    ))
+    db.commit()
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate and load synthetic BookIt data.")
+    parser.add_argument("--users", type=int, default=0)
+    parser.add_argument("--services", type=int, default=0)
+    parser.add_argument("--bookings", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=None, help="generator processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    parser.add_argument("--anchor", type=date.fromisoformat, default=None,
+                        help="date bookings are centred on (default: today); fix it for reproducible runs")
+    parser.add_argument("--password", default=SEED_PASSWORD, help="password for all seeded users")
+    parser.add_argument("--admin", action="store_true", help="also create the admin from ADMIN_* settings")
+    args = parser.parse_args()
+
+    from app.config.database import engine, SessionLocal
+
+    if args.admin:
+        db = SessionLocal()
+        try:
+            created = create_admin_user(db)
+        finally:
+            db.close()
+        print(f"Admin {settings.admin_email}: {'created' if created else 'already exists'}")
+
+    if args.users or args.services or args.bookings:
+        report = seed_data(
+            engine, args.users, args.services, args.bookings,
+            seed=args.seed, workers=args.workers, chunk_size=args.chunk_size,
+            anchor=args.anchor, password=args.password
+        )
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""Production server: a pre-forking uvicorn supervisor.
+
+    python -m app.serve                        # workers sized automatically
+    python -m app.serve --workers 4 --loop uvloop --http httptools
+
+The app is imported and warmed once in the master process, then forked into
+worker processes that share the listening socket. The worker count defaults to
+the available CPUs, capped so that ``workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW)``
+stays within PostgreSQL's ``max_connections`` minus ``DB_RESERVED_CONNECTIONS``.
+
+Signals (master):
+    SIGTERM / SIGINT   drain: workers stop accepting, finish in-flight requests
+                       for up to GRACEFUL_TIMEOUT seconds, then exit
+    SIGHUP             rolling restart: replace workers one at a time
+Because the app is preloaded, picking up new code needs a master restart.
+"""
+import argparse
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict, Optional
+
+import uvicorn
+
+from app.config.settings import settings
+
+logger = logging.getLogger("app.serve")
+
+
+def available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - not available on macOS/Windows
+        return os.cpu_count() or 1
+
+
+def connections_per_worker() -> int:
+    return settings.db_pool_size + settings.db_max_overflow
+
+
+def database_max_connections(engine) -> Optional[int]:
+    """``DB_MAX_CONNECTIONS`` if set, else ask PostgreSQL; None for other databases."""
+    if settings.db_max_connections is not None:
+        return settings.db_max_connections
+    if engine.dialect.name != "postgresql":
+        return None
+    from sqlalchemy import text
+    try:
+        with engine.connect() as connection:
+            return int(connection.execute(text("SHOW max_connections")).scalar())
+    except Exception:
+        logger.warning("Could not read max_connections; worker count not capped by the DB budget")
+        return None
+
+
+def plan_workers(requested: Optional[int], cpus: int, max_connections: Optional[int]) -> int:
+    """Number of workers to run: requested (or one per CPU), capped by the DB connection budget."""
+    workers = requested or cpus
+    if max_connections is not None:
+        budget = max(1, (max_connections - settings.db_reserved_connections) // connections_per_worker())
+        if workers > budget:
+            logger.warning(
+                "Capping workers at %d: %d x %d pooled connections must fit in max_connections=%d "
+                "(minus %d reserved)",
+                budget, workers, connections_per_worker(), max_connections, settings.db_reserved_connections
+            )
+            workers = budget
+    return max(1, workers)
+
+
+class Supervisor:
+    def __init__(self, app, config_kwargs: dict, sock: socket.socket, workers: int, graceful_timeout: int):
+        self.app = app
+        self.config_kwargs = config_kwargs
+        self.sock = sock
+        self.target_workers = workers
+        self.graceful_timeout = graceful_timeout
+        self.children: Dict[int, float] = {}
+        self.stopping = False
+        self.restart_requested = False
+
+    def spawn(self) -> int:
+        pid = os.fork()
+        if pid == 0:
+            self._run_worker()
+        self.children[pid] = time.monotonic()
+        return pid
+
+    def _run_worker(self) -> None:
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        from app.config.database import engine
+        # Never reuse connections inherited from the master
+        engine.dispose(close=False)
+        config = uvicorn.Config(self.app, **self.config_kwargs)
+        try:
+            uvicorn.Server(config).run(sockets=[self.sock])
+        finally:
+            os._exit(0)
+
+    def _handle_stop(self, signum, frame) -> None:
+        self.stopping = True
+
+    def _handle_hup(self, signum, frame) -> None:
+        self.restart_requested = True
+
+    def _reap(self) -> None:
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self.children.clear()
+                return
+            if pid == 0:
+                return
+            self.children.pop(pid, None)
+            if not self.stopping:
+                logger.info("Worker %d exited (status %d); respawning", pid, status)
+
+    def _stop_worker(self, pid: int) -> None:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return
+        deadline = time.monotonic() + self.graceful_timeout
+        while time.monotonic() < deadline:
+            try:
+                done, _ = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if done:
+                break
+            time.sleep(0.1)
+        else:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        self.children.pop(pid, None)
+
+    def _rolling_restart(self) -> None:
+        logger.info("Rolling restart of %d workers", len(self.children))
+        for pid in list(self.children):
+            self.spawn()
+            self._stop_worker(pid)
+
+    def _shutdown(self) -> None:
+        logger.info("Draining %d workers", len(self.children))
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        deadline = time.monotonic() + self.graceful_timeout
+        while self.children and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.1)
+        for pid in list(self.children):
+            logger.warning("Worker %d did not drain in time; killing", pid)
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        self.children.clear()
+
+    def run(self) -> None:
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        signal.signal(signal.SIGHUP, self._handle_hup)
+        for _ in range(self.target_workers):
+            self.spawn()
+        logger.info("Master %d serving with %d workers", os.getpid(), self.target_workers)
+
+        while not self.stopping:
+            self._reap()
+            if self.restart_requested:
+                self.restart_requested = False
+                self._rolling_restart()
+            while not self.stopping and len(self.children) < self.target_workers:
+                self.spawn()
+            time.sleep(0.5)
+        self._shutdown()
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the BookIt API with pre-forked uvicorn workers.")
+    parser.add_argument("--host", default=os.environ.get("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 8000)))
+    parser.add_argument("--workers", type=int, default=settings.web_concurrency,
+                        help="default: one per CPU, capped by the DB connection budget")
+    parser.add_argument("--loop", choices=["auto", "asyncio", "uvloop"], default=settings.server_loop)
+    parser.add_argument("--http", choices=["auto", "h11", "httptools"], default=settings.server_http)
+    parser.add_argument("--graceful-timeout", type=int, default=settings.graceful_timeout)
+    parser.add_argument("--max-requests", type=int, default=settings.max_requests,
+                        help="recycle a worker after this many requests")
+    parser.add_argument("--no-preload", action="store_true", help="skip warming the app before fork")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=settings.log_level, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    from app.config.database import engine
+    from app.main import app
+
+    workers = plan_workers(args.workers, available_cpus(), database_max_connections(engine))
+    if not args.no_preload:
+        # Done once here instead of in every worker after fork
+        from app.core.warmup import warm_up_process
+        warm_up_process(app)
+    # Connections opened in the master must not be shared with forked workers
+    engine.dispose()
+
+    sock = bind_socket(args.host, args.port)
+    logger.info("Listening on %s:%d", args.host, args.port)
+    config_kwargs = {
+        "loop": args.loop,
+        "http": args.http,
+        "lifespan": "on",
+        "timeout_graceful_shutdown": args.graceful_timeout,
+        "limit_max_requests": args.max_requests,
+        "proxy_headers": True,
+        # None keeps uvicorn's default of trusting only 127.0.0.1
+        "forwarded_allow_ips": settings.forwarded_allow_ips,
+        "log_level": settings.log_level.lower(),
+    }
+    Supervisor(app, config_kwargs, sock, workers, args.graceful_timeout).run()
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,5 +2,7 @@ from app.services.auth_service import AuthService
 from app.services.service_service import ServiceService
 from app.services.booking_service import BookingService
 from app.services.review_service import ReviewService
+from app.services.lifecycle_service import BookingLifecycleService
+from app.services.partition_service import BookingPartitionService
 
-__all__ = ["AuthService", "ServiceService", "BookingService", "ReviewService"]
\ No newline at end of file
+__all__ = ["AuthService", "ServiceService", "BookingService", "ReviewService", "BookingLifecycleService", "BookingPartitionService"]
\ No newline at end of file
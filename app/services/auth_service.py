@@ -5,8 +5,12 @@ from typing import Optional
 
 from app.models.user import User, UserRole
 from app.schemas.auth import UserLogin, UserRegister, TokenResponse
-from app.core.security import verify_password, get_password_hash, create_access_token, create_refresh_token, verify_token
+from app.core.security import (
+    DUMMY_PASSWORD_HASH, verify_password, get_password_hash, create_access_token, create_refresh_token, verify_token
+)
+from app.core.login_guard import get_login_guard
 from app.config.settings import settings
+from app.services.statements import get_user_by_email
 
 class AuthService:
     def __init__(self, db: Session):
@@ -14,7 +18,7 @@ class AuthService:
 
     def register_user(self, user_data: UserRegister) -> User:
         # Check if user exists
-        existing_user = self.db.query(User).filter(User.email == user_data.email).first()
+        existing_user = get_user_by_email(self.db, user_data.email)
         if existing_user:
             raise HTTPException(status_code=400, detail="Email already registered")
         
@@ -32,14 +36,35 @@ class AuthService:
         
         return user
 
-    def authenticate_user(self, login_data: UserLogin) -> Optional[User]:
-        user = self.db.query(User).filter(User.email == login_data.email).first()
+    def authenticate_user(self, login_data: UserLogin, client_ip: Optional[str] = None) -> Optional[User]:
+        guard = get_login_guard() if settings.login_guard_enabled else None
+        if not settings.client_ip_trusted:
+            # Behind an undeclared proxy every caller shares its address; one IP score would lock out everyone
+            client_ip = None
+        if guard:
+            retry_after = guard.retry_after(login_data.email, client_ip)
+            if retry_after:
+                raise HTTPException(
+                    status_code=429,
+                    detail="Too many failed login attempts",
+                    headers={"Retry-After": str(retry_after)}
+                )
+        
+        user = get_user_by_email(self.db, login_data.email)
         if not user:
+            # Same bcrypt cost as a real check, so response time does not reveal the email is unknown
+            verify_password(login_data.password, DUMMY_PASSWORD_HASH)
+            if guard:
+                guard.record_failure(login_data.email, client_ip, unknown_user=True)
             return None
         
         if not verify_password(login_data.password, user.password_hash):
+            if guard:
+                guard.record_failure(login_data.email, client_ip)
             return None
         
+        if guard:
+            guard.record_success(login_data.email)
         return user
 
     def create_tokens(self, user: User) -> TokenResponse:
@@ -60,7 +85,7 @@ class AuthService:
         if username is None:
             raise HTTPException(status_code=401, detail="Invalid refresh token")
         
-        user = self.db.query(User).filter(User.email == username).first()
+        user = get_user_by_email(self.db, username)
         if user is None:
             raise HTTPException(status_code=401, detail="User not found")
         
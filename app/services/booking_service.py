@@ -1,56 +1,133 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence
 from uuid import UUID
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from app.models.booking import Booking, BookingStatus
-from app.models.service import Service
+from app.models.booking_tombstone import BookingTombstone
 from app.models.user import User
 from app.schemas.booking import BookingCreate, BookingUpdate
+from app.config.settings import settings
+from app.services.statements import BOOKING_CONFLICT, SERVICE_WITH_CONFLICT, get_booking_by_id, get_bookings_by_ids, load_booking_includes, load_fields
+from app.services.stats_service import BookingFacts, BookingStatsService
+from app.services.outbox_service import OutboxService, booking_payload, review_payload
+from app.utils.ids import uuid7
+
+EXPORT_COLUMNS = ("id", "user_id", "service_id", "start_time", "end_time", "status", "created_at")
 
 class BookingService:
     def __init__(self, db: Session):
         self.db = db
+        self.stats = BookingStatsService(db)
+        self.outbox = OutboxService(db)
 
-    def get_booking(self, booking_id: UUID, user: Optional[User] = None) -> Booking:
-        query = self.db.query(Booking).filter(Booking.id == booking_id)
-        
+    def get_booking(
+        self, booking_id: UUID, user: Optional[User] = None,
+        fields: Optional[Sequence[str]] = None, include: Sequence[str] = ()
+    ) -> Booking:
+        owner_id = None
         if user:
             from app.models.user import UserRole
             if user.role != UserRole.ADMIN:
-                query = query.filter(Booking.user_id == user.id)
+                owner_id = user.id
         
-        booking = query.first()
+        booking = get_booking_by_id(self.db, booking_id, owner_id, self._load_options(fields, include))
         if not booking:
             raise HTTPException(status_code=404, detail="Booking not found")
         
         return booking
 
-    def get_bookings(self, user: Optional[User] = None) -> List[Booking]:
-        query = self.db.query(Booking)
+    def get_bookings_by_ids(
+        self, ids: List[UUID], user: Optional[User] = None,
+        fields: Optional[Sequence[str]] = None, include: Sequence[str] = ()
+    ) -> List[Booking]:
+        """Bookings with the given ids in one query, filtered by owner exactly like ``get_booking``.
+
+        Ids that do not exist or belong to someone else are skipped rather than
+        reported, so the response does not reveal other users' bookings.
+        """
+        owner_id = None
+        if user:
+            from app.models.user import UserRole
+            if user.role != UserRole.ADMIN:
+                owner_id = user.id
+        
+        found = {booking.id: booking for booking in get_bookings_by_ids(self.db, ids, owner_id, self._load_options(fields, include))}
+        return [found[booking_id] for booking_id in ids if booking_id in found]
+
+    def get_bookings(
+        self,
+        user: Optional[User] = None,
+        start_from: Optional[datetime] = None,
+        start_to: Optional[datetime] = None,
+        fields: Optional[Sequence[str]] = None,
+        include: Sequence[str] = ()
+    ) -> List[Booking]:
+        query = self.db.query(Booking).options(*self._load_options(fields, include))
         
         if user:
             from app.models.user import UserRole
             if user.role != UserRole.ADMIN:
                 query = query.filter(Booking.user_id == user.id)
         
+        # Bounds on start_time let PostgreSQL prune monthly partitions
+        if start_from is not None:
+            query = query.filter(Booking.start_time >= self._normalize_datetime(start_from))
+        if start_to is not None:
+            query = query.filter(Booking.start_time < self._normalize_datetime(start_to))
+        
         return query.all()
 
+    def stream_bookings(self, start: datetime, end: datetime) -> Iterator[dict]:
+        """Return an iterator over bookings starting in [start, end) as column mappings.
+
+        Selects Core columns only (no ORM identity map) and fetches them through a
+        server-side cursor in batches of ``settings.export_batch_size``. The rows
+        are read while the response streams, after the request's session has
+        been released, so the iterator uses a session of its own and closes it
+        when exhausted or closed.
+        """
+        start = self._normalize_datetime(start)
+        end = self._normalize_datetime(end)
+        if start >= end:
+            raise HTTPException(status_code=422, detail="'from' must be before 'to'")
+
+        table = Booking.__table__
+        stmt = select(*(table.c[name] for name in EXPORT_COLUMNS)).where(
+            table.c.start_time >= start,
+            table.c.start_time < end
+        ).order_by(table.c.start_time)
+
+        return self._iter_rows(self.db.get_bind(), stmt)
+
+    @staticmethod
+    def _iter_rows(bind, stmt) -> Iterator[dict]:
+        with Session(bind) as session:
+            result = session.execute(
+                stmt, execution_options={"yield_per": settings.export_batch_size}
+            )
+            try:
+                for row in result.mappings():
+                    yield row
+            finally:
+                result.close()
+
     def create_booking(self, booking_data: BookingCreate, user: User) -> Booking:
-        # Check service exists
-        service = self.db.query(Service).filter(
-            Service.id == booking_data.service_id,
-            Service.is_active == True
-        ).first()
-        
-        if not service:
-            raise HTTPException(status_code=404, detail="Service not found")
-        
         # Normalize datetimes to UTC for consistent comparisons
         start_time = self._normalize_datetime(booking_data.start_time)
         end_time = self._normalize_datetime(booking_data.end_time)
         now_utc = datetime.now(timezone.utc)
 
+        # Service lookup and conflict check share one round trip
+        row = self.db.execute(
+            SERVICE_WITH_CONFLICT, self._conflict_params(booking_data.service_id, start_time, end_time)
+        ).first()
+        
+        if not row:
+            raise HTTPException(status_code=404, detail="Service not found")
+        service, conflict = row
+
         # Basic validation
         if start_time >= end_time:
             raise HTTPException(status_code=422, detail="Start time must be before end time")
@@ -65,12 +142,16 @@ class BookingService:
         if abs(actual_duration - expected_duration) > 5:
             raise HTTPException(status_code=422, detail=f"Booking duration must be {expected_duration} minutes")
         
+        if end_time - start_time > self.max_duration():
+            raise HTTPException(status_code=422, detail=f"Booking cannot be longer than {settings.booking_max_duration_hours} hours")
+        
         # Check for conflicts
-        if self._has_conflict(booking_data.service_id, start_time, end_time):
+        if conflict:
             raise HTTPException(status_code=409, detail="Booking conflicts with existing reservation")
         
-        # Create booking
+        # Create booking (id assigned up front so the event can carry it)
         booking = Booking(
+            id=uuid7(),
             user_id=user.id,
             service_id=booking_data.service_id,
             start_time=start_time,
@@ -79,6 +160,8 @@ class BookingService:
         )
         
         self.db.add(booking)
+        self.stats.record(None, BookingFacts.of(booking))
+        self.outbox.add("booking.created", booking.id, booking_payload(booking))
         self.db.commit()
         self.db.refresh(booking)
         
@@ -92,11 +175,17 @@ class BookingService:
             raise HTTPException(status_code=403, detail="Not authorized")
         
         update_data = booking_update.model_dump(exclude_unset=True)
+        before = BookingFacts.of(booking)
         
         # Apply updates
         for field, value in update_data.items():
             setattr(booking, field, value)
         
+        after = BookingFacts.of(booking)
+        self.stats.record(before, after)
+        # Status changes get their own event type, e.g. booking.cancelled
+        event_type = f"booking.{after.status.value}" if after.status != before.status else "booking.updated"
+        self.outbox.add(event_type, booking.id, booking_payload(booking))
         self.db.commit()
         self.db.refresh(booking)
         
@@ -109,21 +198,48 @@ class BookingService:
         if booking.user_id != user.id and user.role != UserRole.ADMIN:
             raise HTTPException(status_code=403, detail="Not authorized")
         
+        self.stats.record(BookingFacts.of(booking), None)
+        self.outbox.add("booking.deleted", booking.id, booking_payload(booking))
+        # reviews.booking_id has no foreign key to cascade from (see Booking.review)
+        if booking.review is not None:
+            self.outbox.add("review.deleted", booking.review.id, review_payload(booking.review))
+            self.db.delete(booking.review)
+        self.db.add(BookingTombstone(booking_id=booking.id, user_id=booking.user_id))
         self.db.delete(booking)
         self.db.commit()
         
         return True
 
     def _has_conflict(self, service_id: UUID, start_time: datetime, end_time: datetime) -> bool:
-        existing = self.db.query(Booking).filter(
-            Booking.service_id == service_id,
-            Booking.status.in_([BookingStatus.PENDING, BookingStatus.CONFIRMED]),
-            Booking.start_time < end_time,
-            Booking.end_time > start_time
+        # An overlapping booking cannot start more than max_duration() before this one,
+        # so the start_time lower bound is redundant logically but lets the planner
+        # prune to the one or two monthly partitions around the requested slot.
+        existing = self.db.execute(
+            BOOKING_CONFLICT, self._conflict_params(service_id, start_time, end_time)
         ).first()
         
         return existing is not None
 
+    def _conflict_params(self, service_id: UUID, start_time: datetime, end_time: datetime) -> dict:
+        return {
+            "service_id": service_id,
+            "start_time": start_time,
+            "end_time": end_time,
+            "window_start": start_time - self.max_duration()
+        }
+
+    @staticmethod
+    def _load_options(fields: Optional[Sequence[str]], include: Sequence[str]) -> tuple:
+        """Column selection for ``fields`` plus one eager load per included relation."""
+        if fields and "service" in include and "service_id" not in fields:
+            # The service is loaded through Booking.service_id
+            fields = (*fields, "service_id")
+        return load_fields(Booking, fields) + load_booking_includes(include)
+
+    @staticmethod
+    def max_duration() -> timedelta:
+        return timedelta(hours=settings.booking_max_duration_hours)
+
     @staticmethod
     def _normalize_datetime(dt: datetime) -> datetime:
         if dt.tzinfo is None:
@@ -0,0 +1,77 @@
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from app.models.booking import Booking, BookingStatus
+from app.config.settings import settings
+from app.services.stats_service import BookingStatsService
+from app.services.outbox_service import OutboxService, booking_payload
+
+class BookingLifecycleService:
+    """Moves bookings whose slot has passed out of the active statuses.
+
+    Each batch is a single ``UPDATE ... WHERE id IN (SELECT ... LIMIT n FOR UPDATE
+    SKIP LOCKED)`` committed on its own, so several workers can run in parallel
+    without blocking on (or double-processing) the same rows. The daily summary
+    and the outbox events are written from the ``RETURNING`` rows in the same
+    transaction.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def complete_past_bookings(self, batch_size: int, now: Optional[datetime] = None) -> int:
+        """CONFIRMED bookings whose end_time has passed become COMPLETED."""
+        now = now or datetime.now(timezone.utc)
+        return self._transition(
+            BookingStatus.CONFIRMED,
+            BookingStatus.COMPLETED,
+            Booking.end_time <= now,
+            batch_size
+        )
+
+    def expire_pending_bookings(self, batch_size: int, now: Optional[datetime] = None) -> int:
+        """PENDING bookings never confirmed before their start_time become CANCELLED."""
+        now = now or datetime.now(timezone.utc)
+        cutoff = now - timedelta(minutes=settings.pending_expiry_grace_minutes)
+        return self._transition(
+            BookingStatus.PENDING,
+            BookingStatus.CANCELLED,
+            Booking.start_time <= cutoff,
+            batch_size
+        )
+
+    def run(self, batch_size: int, max_batches: int = 100) -> Dict[str, int]:
+        """Process batches until nothing is left or ``max_batches`` is reached per transition."""
+        totals = {"completed": 0, "expired": 0}
+        for key, step in (("completed", self.complete_past_bookings), ("expired", self.expire_pending_bookings)):
+            for _ in range(max_batches):
+                count = step(batch_size)
+                totals[key] += count
+                if count < batch_size:
+                    break
+        return totals
+
+    def _transition(self, from_status: BookingStatus, to_status: BookingStatus, due, batch_size: int) -> int:
+        candidates = (
+            select(Booking.id)
+            .where(Booking.status == from_status, due)
+            .order_by(Booking.start_time)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        result = self.db.execute(
+            update(Booking)
+            .where(Booking.id.in_(candidates), Booking.status == from_status)
+            .values(status=to_status)
+            .returning(Booking.id, Booking.user_id, Booking.service_id, Booking.start_time, Booking.end_time, Booking.status)
+            .execution_options(synchronize_session=False)
+        )
+        rows = result.all()
+        BookingStatsService(self.db).record_transitions(
+            [(row.service_id, row.start_time, row.end_time) for row in rows], from_status, to_status
+        )
+        OutboxService(self.db).add_many(f"booking.{to_status.value}", [booking_payload(row) for row in rows])
+        self.db.commit()
+        return len(rows)
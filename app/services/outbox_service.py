@@ -0,0 +1,131 @@
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+import random
+
+from app.models.booking import Booking
+from app.models.outbox import OutboxEvent
+from app.models.review import Review
+from app.config.settings import settings
+
+CLAIMED_COLUMNS = (
+    OutboxEvent.id, OutboxEvent.event_type, OutboxEvent.aggregate_id,
+    OutboxEvent.payload, OutboxEvent.created_at, OutboxEvent.attempts,
+)
+
+def booking_payload(booking: Booking) -> dict:
+    """JSON-safe event data from a booking or a ``RETURNING`` row with the same columns."""
+    return {
+        "id": str(booking.id),
+        "user_id": str(booking.user_id),
+        "service_id": str(booking.service_id),
+        "start_time": booking.start_time.isoformat(),
+        "end_time": booking.end_time.isoformat(),
+        "status": getattr(booking.status, "value", booking.status),
+    }
+
+def review_payload(review: Review) -> dict:
+    return {
+        "id": str(review.id),
+        "booking_id": str(review.booking_id),
+        "rating": review.rating,
+        "comment": review.comment,
+    }
+
+
+class OutboxService:
+    """Transactional outbox for booking and review events.
+
+    Writers add events in their own transaction, so an event exists exactly when
+    the change it describes committed, and requests never wait on consumers.
+    ``app.outbox_worker`` delivers them afterwards: ``claim`` leases a batch with
+    ``FOR UPDATE SKIP LOCKED`` (so dispatchers in several processes never take
+    the same rows) and pushes ``available_at`` past the lease, so rows held by a
+    dispatcher that died are retried once the lease runs out. Delivery is at least
+    once; consumers deduplicate on the event id.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def add(self, event_type: str, aggregate_id: UUID, payload: dict) -> OutboxEvent:
+        """Queue an event; it is written when the caller's transaction commits."""
+        event = OutboxEvent(event_type=event_type, aggregate_id=aggregate_id, payload=payload)
+        self.db.add(event)
+        return event
+
+    def add_many(self, event_type: str, payloads: Sequence[dict]) -> None:
+        """Queue one event per payload with a single multi-row insert."""
+        if payloads:
+            self.db.execute(insert(OutboxEvent), [
+                {"event_type": event_type, "aggregate_id": UUID(payload["id"]), "payload": payload}
+                for payload in payloads
+            ])
+
+    def claim(self, batch_size: int, now: Optional[datetime] = None) -> List[dict]:
+        """Lease up to ``batch_size`` due events and commit; returns them oldest first."""
+        now = now or datetime.now(timezone.utc)
+        candidates = (
+            select(OutboxEvent.id)
+            .where(
+                OutboxEvent.delivered_at.is_(None),
+                OutboxEvent.available_at <= now,
+                OutboxEvent.attempts < settings.outbox_max_attempts,
+            )
+            .order_by(OutboxEvent.available_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        result = self.db.execute(
+            update(OutboxEvent)
+            .where(OutboxEvent.id.in_(candidates), OutboxEvent.delivered_at.is_(None))
+            .values(
+                attempts=OutboxEvent.attempts + 1,
+                available_at=now + timedelta(seconds=settings.outbox_lease_seconds),
+            )
+            .returning(*CLAIMED_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        events = [dict(row) for row in result.mappings()]
+        self.db.commit()
+        # UUIDv7 ids sort in creation order
+        return sorted(events, key=lambda event: event["id"])
+
+    def settle(self, delivered: Iterable[UUID], failed: Iterable[Tuple[UUID, int, str]],
+               now: Optional[datetime] = None) -> None:
+        """Mark events delivered, and reschedule ``(id, attempts, error)`` failures with backoff."""
+        now = now or datetime.now(timezone.utc)
+        delivered = list(delivered)
+        if delivered:
+            self.db.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id.in_(delivered))
+                .values(delivered_at=now, last_error=None)
+                .execution_options(synchronize_session=False)
+            )
+        failures = [
+            {"id": event_id, "available_at": now + retry_delay(attempts), "last_error": error[:1000]}
+            for event_id, attempts, error in failed
+        ]
+        if failures:
+            # Bulk UPDATE by primary key: one executemany round trip
+            self.db.execute(update(OutboxEvent), failures)
+        self.db.commit()
+
+    def purge_delivered(self, before: datetime) -> int:
+        """Delete events delivered before ``before``; returns how many."""
+        result = self.db.execute(
+            delete(OutboxEvent)
+            .where(OutboxEvent.delivered_at < before)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff after the ``attempts``-th failure, with jitter so retries spread out."""
+    delay = min(settings.outbox_backoff_base_seconds * 2 ** (attempts - 1), settings.outbox_backoff_max_seconds)
+    return timedelta(seconds=delay * random.uniform(0.5, 1.0))
@@ -0,0 +1,91 @@
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from datetime import date, datetime, timezone
+from typing import List
+
+from app.config.settings import settings
+
+# pg_advisory_xact_lock key serializing partition maintenance across workers
+PARTITION_LOCK_KEY = 0x626B7061  # "bkpa"
+
+class BookingPartitionService:
+    """Maintains the monthly ``bookings`` partitions (see migration b7e1c2d94f30).
+
+    All methods are no-ops unless the database is PostgreSQL and ``bookings``
+    is actually partitioned.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def is_partitioned(self) -> bool:
+        if self.db.get_bind().dialect.name != "postgresql":
+            return False
+        return self.db.execute(text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = to_regclass('bookings'))"
+        )).scalar()
+
+    def list_partitions(self) -> List[str]:
+        if not self.is_partitioned():
+            return []
+        rows = self.db.execute(text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass('bookings') "
+            "ORDER BY child.relname"
+        )).scalars()
+        return list(rows)
+
+    def ensure_partitions(self, months_ahead: int = None) -> int:
+        """Create monthly partitions from the current month up to ``months_ahead`` months out."""
+        if not self.is_partitioned():
+            return 0
+        months_ahead = settings.booking_partition_months_ahead if months_ahead is None else months_ahead
+        # Every worker's lifecycle pass gets here; without the lock two of them can race on
+        # CREATE TABLE for the same month. Held until the commit below.
+        self.db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY})
+        created = self.db.execute(
+            text("SELECT bookings_create_partitions(CAST(now() AS date), :months_ahead)"),
+            {"months_ahead": months_ahead}
+        ).scalar()
+        self.db.commit()
+        return created
+
+    def archive_partitions(self, older_than_months: int = None) -> List[str]:
+        """Detach partitions entirely older than the cutoff and move them to the archive schema.
+
+        Archived bookings are no longer visible through the API.
+        """
+        if not self.is_partitioned():
+            return []
+        older_than_months = settings.booking_archive_after_months if older_than_months is None else older_than_months
+        cutoff = self._months_before(datetime.now(timezone.utc).date(), older_than_months)
+        schema = settings.booking_archive_schema
+
+        archived = []
+        self.db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY})
+        self.db.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{schema}"'))
+        for name in self.list_partitions():
+            month = self._partition_month(name)
+            if month is None or self._months_before(month, -1) > cutoff:
+                continue
+            self.db.execute(text(f'ALTER TABLE bookings DETACH PARTITION "{name}"'))
+            self.db.execute(text(f'ALTER TABLE "{name}" SET SCHEMA "{schema}"'))
+            archived.append(name)
+        self.db.commit()
+        return archived
+
+    @staticmethod
+    def _partition_month(name: str):
+        # bookings_pYYYY_MM
+        try:
+            year, month = name[len("bookings_p"):].split("_")
+            return date(int(year), int(month), 1)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _months_before(day: date, months: int) -> date:
+        index = day.year * 12 + day.month - 1 - months
+        return date(index // 12, index % 12 + 1, 1)
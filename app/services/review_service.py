@@ -7,10 +7,14 @@ from app.models.review import Review
 from app.models.booking import Booking, BookingStatus
 from app.models.user import User
 from app.schemas.review import ReviewCreate, ReviewUpdate
+from app.services.statements import BOOKING_WITH_REVIEW
+from app.services.outbox_service import OutboxService, review_payload
+from app.utils.ids import uuid7
 
 class ReviewService:
     def __init__(self, db: Session):
         self.db = db
+        self.outbox = OutboxService(db)
 
     def get_review(self, review_id: UUID, user: Optional[User] = None) -> Review:
         query = self.db.query(Review).filter(Review.id == review_id)
@@ -29,41 +33,40 @@ class ReviewService:
         return review
 
     def get_service_reviews(self, service_id: UUID) -> List[Review]:
-        reviews = self.db.query(Review).join(Booking).filter(
+        reviews = self.db.query(Review).join(Review.booking).filter(
             Booking.service_id == service_id
         ).all()
         
         return reviews
 
     def create_review(self, review_data: ReviewCreate, user: User) -> Review:
-        booking = self.db.query(Booking).filter(
-            Booking.id == review_data.booking_id,
-            Booking.user_id == user.id
+        # Booking lookup and duplicate-review check share one round trip
+        row = self.db.execute(
+            BOOKING_WITH_REVIEW, {"booking_id": review_data.booking_id, "user_id": user.id}
         ).first()
         
-        if not booking:
+        if not row:
             raise HTTPException(status_code=404, detail="Booking not found")
+        booking, reviewed = row
         
         if booking.status != BookingStatus.COMPLETED:
             raise HTTPException(status_code=422, detail="Can only review completed bookings")
         
-        existing_review = self.db.query(Review).filter(
-            Review.booking_id == review_data.booking_id
-        ).first()
-        
-        if existing_review:
+        if reviewed:
             raise HTTPException(status_code=409, detail="Review already exists for this booking")
         
         if not (1 <= review_data.rating <= 5):
             raise HTTPException(status_code=422, detail="Rating must be between 1 and 5")
         
         review = Review(
+            id=uuid7(),
             booking_id=review_data.booking_id,
             rating=review_data.rating,
             comment=review_data.comment
         )
         
         self.db.add(review)
+        self.outbox.add("review.created", review.id, review_payload(review))
         self.db.commit()
         self.db.refresh(review)
         
@@ -90,6 +93,7 @@ class ReviewService:
         for field, value in update_data.items():
             setattr(review, field, value)
         
+        self.outbox.add("review.updated", review.id, review_payload(review))
         self.db.commit()
         self.db.refresh(review)
         
@@ -107,13 +111,14 @@ class ReviewService:
         if not (is_owner or is_admin):
             raise HTTPException(status_code=403, detail="Not authorized")
         
+        self.outbox.add("review.deleted", review.id, review_payload(review))
         self.db.delete(review)
         self.db.commit()
         
         return True
 
     def get_user_reviews(self, user: User) -> List[Review]:
-        reviews = self.db.query(Review).join(Booking).filter(
+        reviews = self.db.query(Review).join(Review.booking).filter(
             Booking.user_id == user.id
         ).all()
         
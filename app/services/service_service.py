@@ -1,21 +1,37 @@
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from uuid import UUID
 
+from app.config.settings import settings
+from app.core.cache import TTLCache
+from app.core.invalidation import get_invalidation_bus
+from app.core.serialization import dump_rows
 from app.models.service import Service
-from app.schemas.service import ServiceCreate, ServiceUpdate
+from app.schemas.service import ServiceCreate, ServiceUpdate, ServiceResponse
+from app.services.statements import get_service_by_id, get_services_by_ids, load_fields
+
+CATALOG_KEY = "services"
+
+# Serialized default listing shared by all requests in this process
+catalog_cache = TTLCache("catalog", ttl=settings.catalog_cache_ttl_seconds)
+get_invalidation_bus().register(catalog_cache.name, catalog_cache)
 
 class ServiceService:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_service(self, service_id: UUID) -> Service:
-        service = self.db.query(Service).filter(Service.id == service_id).first()
+    def get_service(self, service_id: UUID, fields: Optional[Sequence[str]] = None) -> Service:
+        service = get_service_by_id(self.db, service_id, options=load_fields(Service, fields))
         if not service:
             raise HTTPException(status_code=404, detail="Service not found")
         return service
 
+    def get_services_by_ids(self, ids: List[UUID], fields: Optional[Sequence[str]] = None) -> List[Service]:
+        """Services with the given ids in one query, in the order asked; unknown ids are skipped."""
+        found = {service.id: service for service in get_services_by_ids(self.db, ids, load_fields(Service, fields))}
+        return [found[service_id] for service_id in ids if service_id in found]
+
     def get_services(
         self, 
         skip: int = 0, 
@@ -44,6 +60,12 @@ class ServiceService:
         
         return query.offset(skip).limit(limit).all()
 
+    def get_catalog(self) -> List[dict]:
+        """Default service listing as plain dicts, served from the catalog cache."""
+        return catalog_cache.get_or_load(
+            CATALOG_KEY, lambda: dump_rows(ServiceResponse, self.get_services())
+        )
+
     def create_service(self, service_data: ServiceCreate) -> Service:
         if service_data.price <= 0:
             raise HTTPException(status_code=422, detail="Price must be greater than 0")
@@ -51,8 +73,11 @@ class ServiceService:
         if service_data.duration_minutes <= 0:
             raise HTTPException(status_code=422, detail="Duration must be greater than 0")
         
+        self._check_bookable_duration(service_data.duration_minutes)
+        
         service = Service(**service_data.model_dump())
         self.db.add(service)
+        self._invalidate_catalog()
         self.db.commit()
         self.db.refresh(service)
         
@@ -69,14 +94,27 @@ class ServiceService:
         if 'duration_minutes' in update_data and update_data['duration_minutes'] <= 0:
             raise HTTPException(status_code=422, detail="Duration must be greater than 0")
         
+        if 'duration_minutes' in update_data:
+            self._check_bookable_duration(update_data['duration_minutes'])
+        
         for field, value in update_data.items():
             setattr(service, field, value)
         
+        self._invalidate_catalog()
         self.db.commit()
         self.db.refresh(service)
         
         return service
 
+    @staticmethod
+    def _check_bookable_duration(duration_minutes: int) -> None:
+        # Bookings are capped at BOOKING_MAX_DURATION_HOURS (it bounds the conflict check's partition window)
+        if duration_minutes > settings.booking_max_duration_hours * 60:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Duration cannot be longer than {settings.booking_max_duration_hours} hours"
+            )
+
     def delete_service(self, service_id: UUID) -> bool:
         service = self.get_service(service_id)
         
@@ -90,16 +128,21 @@ class ServiceService:
             raise HTTPException(status_code=422, detail="Cannot delete service with active bookings")
         
         service.is_active = False
+        self._invalidate_catalog()
         self.db.commit()
         
         return True
 
+    def _invalidate_catalog(self) -> None:
+        # Every worker drops its cached listing once this transaction commits
+        get_invalidation_bus().publish(self.db, catalog_cache.name, CATALOG_KEY)
+
     def get_service_reviews(self, service_id: UUID) -> List:
         """Get all reviews for a service."""
         from app.models.review import Review
         from app.models.booking import Booking
         
-        reviews = self.db.query(Review).join(Booking).filter(
+        reviews = self.db.query(Review).join(Review.booking).filter(
             Booking.service_id == service_id
         ).all()
         
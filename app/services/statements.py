@@ -0,0 +1,139 @@
+"""Prebuilt statements for the hottest queries.
+
+Each statement is built once at import with bound parameters instead of through
+``db.query(...)`` on every call. That skips statement construction, and because
+SQLAlchemy memoizes a statement's cache key on the object, every execution goes
+straight to the engine's compiled cache (``DB_QUERY_CACHE_SIZE``).
+
+Write paths that need several independent lookups fold them into one statement
+with ``EXISTS`` columns, so each check costs no extra round trip.
+
+Sparse fieldsets (``?fields=``) add ``load_only`` for the requested columns,
+so unrequested columns (e.g. ``Service.description``) are never read, and
+``?include=`` adds a ``selectinload`` per embedded relation.
+
+Multi-get lookups bind the whole id list as one array, ``id = ANY(:ids)``, on
+PostgreSQL, so a single statement text serves any number of ids. Other
+databases get an expanding ``IN``.
+"""
+from typing import List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session, load_only, selectinload
+
+from app.models.booking import Booking, BookingStatus
+from app.models.review import Review
+from app.models.service import Service
+from app.models.user import User
+
+USER_BY_EMAIL = select(User).where(User.email == bindparam("email")).limit(1)
+
+SERVICE_BY_ID = select(Service).where(Service.id == bindparam("service_id"))
+
+ACTIVE_SERVICE_BY_ID = SERVICE_BY_ID.where(Service.is_active == True)
+
+BOOKING_BY_ID = select(Booking).where(Booking.id == bindparam("booking_id")).limit(1)
+
+BOOKING_BY_ID_AND_OWNER = BOOKING_BY_ID.where(Booking.user_id == bindparam("user_id"))
+
+
+def _by_ids(column) -> dict:
+    """Select ``column``'s entity by a list of ids bound as ``ids``, per dialect."""
+    return {
+        "postgresql": select(column.class_).where(column == any_(bindparam("ids", type_=ARRAY(column.type)))),
+        "default": select(column.class_).where(column.in_(bindparam("ids", expanding=True))),
+    }
+
+SERVICES_BY_IDS = _by_ids(Service.id)
+
+BOOKINGS_BY_IDS = _by_ids(Booking.id)
+
+BOOKINGS_BY_IDS_AND_OWNER = {
+    dialect: stmt.where(Booking.user_id == bindparam("user_id")) for dialect, stmt in BOOKINGS_BY_IDS.items()
+}
+
+# See BookingService._has_conflict for why window_start is bound separately
+BOOKING_CONFLICT = select(Booking.id).where(
+    Booking.service_id == bindparam("service_id"),
+    Booking.status.in_([BookingStatus.PENDING, BookingStatus.CONFIRMED]),
+    Booking.start_time < bindparam("end_time"),
+    Booking.start_time > bindparam("window_start"),
+    Booking.end_time > bindparam("start_time")
+).limit(1)
+
+# Active service plus whether the requested slot is taken (BookingService.create_booking)
+SERVICE_WITH_CONFLICT = select(
+    Service, BOOKING_CONFLICT.exists().label("conflict")
+).where(Service.id == bindparam("service_id"), Service.is_active == True)
+
+# Owned booking plus whether it already has a review (ReviewService.create_review)
+BOOKING_WITH_REVIEW = select(
+    Booking, select(Review.id).where(Review.booking_id == Booking.id).exists().label("reviewed")
+).where(Booking.id == bindparam("booking_id"), Booking.user_id == bindparam("user_id")).limit(1)
+
+
+# Related rows embedded by ``?include=``; each costs one extra query per request, never per row
+BOOKING_INCLUDES = {
+    "service": selectinload(Booking.service),
+    "review": selectinload(Booking.review),
+}
+
+
+def load_fields(entity, fields: Optional[Sequence[str]] = None) -> tuple:
+    """Loader options that read only the columns behind ``fields``; none when all are wanted."""
+    if not fields:
+        return ()
+    columns = entity.__table__.columns
+    return (load_only(*(getattr(entity, name) for name in fields if name in columns)),)
+
+
+def load_booking_includes(include: Sequence[str] = ()) -> tuple:
+    """Eager-load options for the relations named in ``include``."""
+    return tuple(BOOKING_INCLUDES[name] for name in include)
+
+
+def _with_options(stmt, options: Sequence):
+    # Unchanged without options, keeping the prebuilt statement and its memoized cache key
+    return stmt.options(*options) if options else stmt
+
+
+def get_user_by_email(db: Session, email: str) -> Optional[User]:
+    return db.execute(USER_BY_EMAIL, {"email": email}).scalars().first()
+
+
+def get_service_by_id(
+    db: Session, service_id: UUID, active_only: bool = False, options: Sequence = ()
+) -> Optional[Service]:
+    stmt = ACTIVE_SERVICE_BY_ID if active_only else SERVICE_BY_ID
+    return db.execute(_with_options(stmt, options), {"service_id": service_id}).scalars().first()
+
+
+def get_booking_by_id(
+    db: Session, booking_id: UUID, user_id: Optional[UUID] = None, options: Sequence = ()
+) -> Optional[Booking]:
+    if user_id is None:
+        return db.execute(_with_options(BOOKING_BY_ID, options), {"booking_id": booking_id}).scalars().first()
+    return db.execute(
+        _with_options(BOOKING_BY_ID_AND_OWNER, options), {"booking_id": booking_id, "user_id": user_id}
+    ).scalars().first()
+
+
+def _for_dialect(db: Session, statements: dict):
+    return statements.get(db.get_bind().dialect.name, statements["default"])
+
+
+def get_services_by_ids(db: Session, ids: Sequence[UUID], options: Sequence = ()) -> List[Service]:
+    stmt = _with_options(_for_dialect(db, SERVICES_BY_IDS), options)
+    return db.execute(stmt, {"ids": list(ids)}).scalars().all()
+
+
+def get_bookings_by_ids(
+    db: Session, ids: Sequence[UUID], user_id: Optional[UUID] = None, options: Sequence = ()
+) -> List[Booking]:
+    if user_id is None:
+        stmt = _with_options(_for_dialect(db, BOOKINGS_BY_IDS), options)
+        return db.execute(stmt, {"ids": list(ids)}).scalars().all()
+    stmt = _with_options(_for_dialect(db, BOOKINGS_BY_IDS_AND_OWNER), options)
+    return db.execute(stmt, {"ids": list(ids), "user_id": user_id}).scalars().all()
@@ -0,0 +1,207 @@
+from sqlalchemy import Date, case, cast, delete, func, literal, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from app.models.booking import Booking, BookingStatus
+from app.models.booking_stats import BookingDailyStats
+from app.models.service import Service
+from app.config.settings import settings
+
+COUNTERS = ("bookings", "cancelled", "completed", "booked_minutes", "revenue")
+
+class BookingFacts(NamedTuple):
+    """The parts of a booking the daily summary depends on."""
+    service_id: UUID
+    start_time: datetime
+    end_time: datetime
+    status: BookingStatus
+
+    @classmethod
+    def of(cls, booking: Booking) -> "BookingFacts":
+        return cls(booking.service_id, booking.start_time, booking.end_time, booking.status)
+
+    @property
+    def day(self) -> date:
+        start = self.start_time
+        if start.tzinfo is not None:
+            start = start.astimezone(timezone.utc)
+        return start.date()
+
+    @property
+    def minutes(self) -> int:
+        return round((self.end_time - self.start_time).total_seconds() / 60)
+
+
+class BookingStatsService:
+    """Daily per-service booking summary behind ``/api/v1/admin/stats``.
+
+    Every booking change adds its delta to the ``(day, service_id)`` row with an
+    upsert in the caller's transaction, so the summary commits or rolls back with
+    the booking and dashboard reads cost O(days x services) however many bookings
+    there are. Revenue is counted at the service's current price, both when a
+    delta is applied and in ``rebuild``. After a price change the two can
+    disagree for bookings that completed earlier, until the next rebuild.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def record(self, before: Optional[BookingFacts], after: Optional[BookingFacts]) -> None:
+        """Apply one booking change: ``before`` is None on create, ``after`` is None on delete."""
+        deltas = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+        for facts, sign in ((before, -1), (after, 1)):
+            if facts is not None:
+                self._add(deltas[(facts.day, facts.service_id)], facts, sign)
+        self._apply(deltas)
+
+    def record_transitions(self, rows: Iterable[Tuple[UUID, datetime, datetime]],
+                           from_status: BookingStatus, to_status: BookingStatus) -> None:
+        """Apply a bulk status change of ``(service_id, start_time, end_time)`` rows."""
+        deltas = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+        for service_id, start_time, end_time in rows:
+            before = BookingFacts(service_id, start_time, end_time, from_status)
+            delta = deltas[(before.day, service_id)]
+            self._add(delta, before, -1)
+            self._add(delta, before._replace(status=to_status), 1)
+        self._apply(deltas)
+
+    @staticmethod
+    def _add(delta: dict, facts: BookingFacts, sign: int) -> None:
+        cancelled = facts.status == BookingStatus.CANCELLED
+        delta["bookings"] += sign
+        delta["cancelled"] += sign * cancelled
+        delta["completed"] += sign * (facts.status == BookingStatus.COMPLETED)
+        delta["booked_minutes"] += 0 if cancelled else sign * facts.minutes
+
+    def _apply(self, deltas: Dict[Tuple[date, UUID], dict]) -> None:
+        deltas = {key: delta for key, delta in deltas.items() if any(delta.values())}
+        if not deltas:
+            return
+        completed_services = {service_id for (_, service_id), delta in deltas.items() if delta["completed"]}
+        if completed_services:
+            prices = dict(self.db.execute(
+                select(Service.id, Service.price).where(Service.id.in_(completed_services))
+            ).all())
+            for (_, service_id), delta in deltas.items():
+                delta["revenue"] = delta["completed"] * Decimal(prices.get(service_id) or 0)
+
+        table = BookingDailyStats.__table__
+        insert = postgresql.insert if self.db.get_bind().dialect.name == "postgresql" else sqlite.insert
+        # Sorted so concurrent transactions lock summary rows in the same order
+        for (day, service_id), delta in sorted(deltas.items(), key=lambda item: (item[0][0], str(item[0][1]))):
+            stmt = insert(table).values(day=day, service_id=service_id, **delta)
+            self.db.execute(stmt.on_conflict_do_update(
+                index_elements=[table.c.day, table.c.service_id],
+                set_={name: table.c[name] + stmt.excluded[name] for name in COUNTERS}
+            ))
+
+    def rebuild(self, start: Optional[date] = None, end: Optional[date] = None) -> int:
+        """Recompute the summary for days in [start, end) from bookings; returns rows written.
+
+        Without bounds the range spans the live bookings, so days whose partitions
+        were archived keep their summary rows.
+        """
+        day, minutes = self._day_and_minutes()
+        if start is None or end is None:
+            first, last = self.db.execute(select(func.min(day), func.max(day))).one()
+            if first is None:
+                return 0
+            start = start or _as_date(first)
+            end = end or _as_date(last) + timedelta(days=1)
+
+        if self.db.get_bind().dialect.name == "postgresql":
+            # Hold off booking writes so no delta lands between the delete and the insert
+            self.db.execute(text("LOCK TABLE bookings IN SHARE MODE"))
+
+        table = BookingDailyStats.__table__
+        self.db.execute(delete(table).where(table.c.day >= start, table.c.day < end))
+        completed = Booking.status == BookingStatus.COMPLETED
+        cancelled = Booking.status == BookingStatus.CANCELLED
+        summary = (
+            select(
+                day.label("day"),
+                Booking.service_id,
+                func.count(),
+                func.sum(case((cancelled, 1), else_=0)),
+                func.sum(case((completed, 1), else_=0)),
+                func.coalesce(func.sum(case((cancelled, literal(0)), else_=minutes)), 0),
+                func.coalesce(func.sum(case((completed, Service.price), else_=0)), 0),
+            )
+            .join(Service, Service.id == Booking.service_id)
+            .where(Booking.start_time >= _day_start(start), Booking.start_time < _day_start(end))
+            .group_by(day, Booking.service_id)
+        )
+        # Counted from RETURNING: psycopg 3 reports rowcount -1 for INSERT ... SELECT
+        written = len(self.db.execute(
+            table.insert().from_select(["day", "service_id", *COUNTERS], summary).returning(table.c.day)
+        ).all())
+        self.db.commit()
+        return written
+
+    def _day_and_minutes(self):
+        if self.db.get_bind().dialect.name == "postgresql":
+            day = cast(func.timezone("UTC", Booking.start_time), Date)
+            minutes = cast(func.extract("epoch", Booking.end_time - Booking.start_time) / 60, postgresql.INTEGER)
+        else:
+            day = func.date(Booking.start_time)
+            minutes = cast(func.round((func.julianday(Booking.end_time) - func.julianday(Booking.start_time)) * 1440), sqlite.INTEGER)
+        return day, minutes
+
+    def daily(self, start: date, end: date, service_id: Optional[UUID] = None) -> List[dict]:
+        """Summary rows for days in [start, end], optionally for one service."""
+        self._check_range(start, end)
+        stmt = (
+            select(BookingDailyStats)
+            .where(BookingDailyStats.day >= start, BookingDailyStats.day <= end)
+            .order_by(BookingDailyStats.day, BookingDailyStats.service_id)
+        )
+        if service_id is not None:
+            stmt = stmt.where(BookingDailyStats.service_id == service_id)
+        return [
+            _with_rates({"day": row.day, "service_id": row.service_id, **{name: getattr(row, name) for name in COUNTERS}}, days=1)
+            for row in self.db.execute(stmt).scalars()
+        ]
+
+    def by_service(self, start: date, end: date) -> List[dict]:
+        """Totals per service over [start, end]."""
+        self._check_range(start, end)
+        stats = BookingDailyStats
+        stmt = (
+            select(stats.service_id, Service.title, *(func.sum(getattr(stats, name)).label(name) for name in COUNTERS))
+            .join(Service, Service.id == stats.service_id)
+            .where(stats.day >= start, stats.day <= end)
+            .group_by(stats.service_id, Service.title)
+            .order_by(Service.title)
+        )
+        days = (end - start).days + 1
+        return [_with_rates(dict(row), days=days) for row in self.db.execute(stmt).mappings()]
+
+    @staticmethod
+    def _check_range(start: date, end: date) -> None:
+        if start > end:
+            raise HTTPException(status_code=422, detail="'from' must not be after 'to'")
+        if (end - start).days >= settings.stats_max_range_days:
+            raise HTTPException(status_code=422, detail=f"Range cannot exceed {settings.stats_max_range_days} days")
+
+
+def _with_rates(row: dict, days: int) -> dict:
+    bookings = row["bookings"] or 0
+    capacity = days * settings.service_open_minutes_per_day
+    row["revenue"] = Decimal(row["revenue"] or 0)
+    row["cancellation_rate"] = round(row["cancelled"] / bookings, 4) if bookings else 0.0
+    row["utilisation"] = round(row["booked_minutes"] / capacity, 4) if capacity else 0.0
+    return row
+
+
+def _as_date(value) -> date:
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, datetime.min.time(), tzinfo=timezone.utc)
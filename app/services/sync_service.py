@@ -0,0 +1,120 @@
+from sqlalchemy import and_, delete, or_, select
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from datetime import datetime, timedelta, timezone
+from typing import List, NamedTuple, Optional
+from uuid import UUID
+import base64
+import binascii
+
+from app.models.booking import Booking
+from app.models.booking_tombstone import BookingTombstone
+from app.models.user import User
+from app.config.settings import settings
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+NO_ID = UUID(int=0)
+
+class SyncToken(NamedTuple):
+    changed_at: datetime  # position of the last change sent
+    last_id: UUID
+    horizon: datetime  # oldest deletion time the client still needs tombstones from
+
+def encode_token(token: SyncToken) -> str:
+    raw = ":".join([str(_micros(token.changed_at)), token.last_id.hex, str(_micros(token.horizon))])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_token(token: str) -> SyncToken:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        changed_at, last_id, horizon = raw.split(":")
+        return SyncToken(_from_micros(changed_at), UUID(hex=last_id), _from_micros(horizon))
+    except (binascii.Error, UnicodeDecodeError, ValueError, OverflowError):
+        raise HTTPException(status_code=422, detail="Invalid sync token")
+
+
+class BookingSyncService:
+    """Delta sync of a user's bookings behind ``GET /bookings/changes``.
+
+    Changes are bookings whose ``updated_at`` moved and tombstones left by
+    ``BookingService.delete_booking``, merged in ``(changed_at, id)`` order and
+    paged with an opaque token holding the last position. Timestamps are taken
+    before commit, so a slow transaction can commit a change older than rows
+    already returned. Once a client has caught up, its token is therefore held
+    back ``SYNC_SETTLE_SECONDS``: recent changes are sent again on the next sync
+    (clients upsert by id) instead of being missed.
+
+    Expiry follows the token's horizon, not its position: a page token deep in
+    old rows is still good, but a client that last caught up longer ago than
+    ``SYNC_TOMBSTONE_RETENTION_DAYS`` may have missed purged tombstones.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def changes(self, user: User, token: Optional[str] = None, limit: Optional[int] = None,
+                now: Optional[datetime] = None) -> dict:
+        """Bookings of ``user`` changed or deleted after ``token`` (everything without one)."""
+        limit = limit or settings.sync_page_size
+        now = now or datetime.now(timezone.utc)
+        since = decode_token(token) if token else None
+        if since and since.horizon < now - timedelta(days=settings.sync_tombstone_retention_days):
+            raise HTTPException(status_code=410, detail="Sync token expired; fetch GET /bookings again")
+
+        bookings = self._page(
+            select(Booking), Booking.updated_at, Booking.id, Booking.user_id == user.id, since, limit
+        )
+        tombstones = self._page(
+            select(BookingTombstone), BookingTombstone.deleted_at, BookingTombstone.booking_id,
+            BookingTombstone.user_id == user.id, since, limit
+        )
+        entries = sorted(
+            [(_utc(booking.updated_at), booking.id, booking) for booking in bookings]
+            + [(_utc(tombstone.deleted_at), tombstone.booking_id, None) for tombstone in tombstones],
+            key=lambda entry: entry[:2]
+        )
+        has_more = len(entries) > limit
+        entries = entries[:limit]
+
+        settled = now - timedelta(seconds=settings.sync_settle_seconds)
+        if has_more:
+            # A full sync only needs tombstones for rows it has been sent, all read after it started
+            horizon = since.horizon if since else settled
+            cursor = SyncToken(*entries[-1][:2], min(horizon, settled))
+        else:
+            cursor = SyncToken(settled, NO_ID, settled)
+        return {
+            "changed": [booking for _, _, booking in entries if booking is not None],
+            "deleted": [booking_id for _, booking_id, booking in entries if booking is None],
+            "next_token": encode_token(cursor),
+            "has_more": has_more,
+        }
+
+    def _page(self, stmt, changed_at, id_column, owned, since: Optional[SyncToken], limit: int) -> List:
+        stmt = stmt.where(owned)
+        if since is not None:
+            # The plain >= bound is what lets (user_id, changed_at) indexes narrow the scan
+            stmt = stmt.where(and_(
+                changed_at >= since.changed_at,
+                or_(changed_at > since.changed_at, id_column > since.last_id)
+            ))
+        return self.db.execute(stmt.order_by(changed_at, id_column).limit(limit + 1)).scalars().all()
+
+    def purge_tombstones(self, now: Optional[datetime] = None) -> int:
+        """Delete tombstones older than ``SYNC_TOMBSTONE_RETENTION_DAYS``; returns how many."""
+        now = now or datetime.now(timezone.utc)
+        cutoff = now - timedelta(days=settings.sync_tombstone_retention_days)
+        purged = self.db.execute(delete(BookingTombstone).where(BookingTombstone.deleted_at < cutoff)).rowcount
+        self.db.commit()
+        return purged
+
+
+def _utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+def _micros(value: datetime) -> int:
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+def _from_micros(value: str) -> datetime:
+    return EPOCH + timedelta(microseconds=int(value))
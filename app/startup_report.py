@@ -0,0 +1,108 @@
+"""Cold-start import time report.
+
+    python -m app.startup_report                    # app.main, top 25 modules
+    python -m app.startup_report --module app.seed --top 10
+    python -m app.startup_report --json
+
+Imports the module in a fresh interpreter with ``python -X importtime`` and
+breaks the result down by top-level package (cumulative) and by individual
+module (self time), so regressions in the startup budget can be traced to the
+import that caused them.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, NamedTuple
+
+DEFAULT_MODULE = "app.main"
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """Parse ``-X importtime`` stderr lines into records, in import-finished order."""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        stripped = name.lstrip(" ")
+        depth = (len(name) - len(stripped) - 1) // 2
+        records.append(ImportRecord(stripped.strip(), int(self_us), int(cumulative_us), depth))
+    return records
+
+
+def measure_imports(module: str = DEFAULT_MODULE) -> List[ImportRecord]:
+    """Import ``module`` in a fresh interpreter and return its import-time records."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=os.environ.copy()
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def cumulative_ms(records: List[ImportRecord], module: str) -> float:
+    """Cumulative import time of ``module`` in milliseconds."""
+    for record in records:
+        if record.module == module:
+            return record.cumulative_us / 1000
+    raise KeyError(module)
+
+
+def summarize(records: List[ImportRecord], module: str = DEFAULT_MODULE, top: int = 25) -> dict:
+    by_package: Dict[str, int] = defaultdict(int)
+    for record in records:
+        by_package[record.module.split(".")[0]] += record.self_us
+    slowest = sorted(records, key=lambda r: r.self_us, reverse=True)[:top]
+    return {
+        "module": module,
+        "total_ms": round(cumulative_ms(records, module), 1),
+        "modules_imported": len(records),
+        "packages": [
+            {"package": name, "ms": round(us / 1000, 1)}
+            for name, us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]
+        ],
+        "slowest_modules": [
+            {"module": r.module, "self_ms": round(r.self_us / 1000, 1), "cumulative_ms": round(r.cumulative_us / 1000, 1)}
+            for r in slowest
+        ],
+    }
+
+
+def print_report(report: dict) -> None:
+    print(f"{report['module']}: {report['total_ms']} ms cumulative, {report['modules_imported']} modules")
+    print("\nBy package (self time)")
+    for row in report["packages"]:
+        print(f"  {row['ms']:>9.1f} ms  {row['package']}")
+    print("\nSlowest modules")
+    print(f"  {'self ms':>9}  {'cumul ms':>9}  module")
+    for row in report["slowest_modules"]:
+        print(f"  {row['self_ms']:>9.1f}  {row['cumulative_ms']:>9.1f}  {row['module']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Break down cold-start import time.")
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    report = summarize(measure_imports(args.module), args.module, args.top)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
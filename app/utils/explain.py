@@ -0,0 +1,64 @@
+import re
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Set, Tuple
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection, Engine
+
+_SQLITE_INDEX = re.compile(r"USING (?:COVERING )?INDEX (\w+)")
+
+
+@contextmanager
+def capture_statements(engine: Engine) -> Iterator[List[Tuple[str, Any]]]:
+    """Record the SQL and DBAPI parameters of every statement run on ``engine``."""
+    captured: List[Tuple[str, Any]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield captured
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def explain_index_names(connection: Connection, statement: str, parameters: Any) -> Set[str]:
+    """Return the names of the indexes the planner would use for ``statement``.
+
+    Supports PostgreSQL (``EXPLAIN (FORMAT JSON)``) and SQLite (``EXPLAIN QUERY PLAN``).
+    On partitioned PostgreSQL tables the plan names each partition's own index;
+    those are reported as the partitioned index they belong to.
+    """
+    if connection.dialect.name == "postgresql":
+        plan = connection.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters).scalar()
+        names: Set[str] = set()
+        _collect_index_names(plan, names)
+        return {_root_index(connection, name) for name in names}
+
+    rows = connection.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).fetchall()
+    return {match for row in rows for match in _SQLITE_INDEX.findall(row[-1])}
+
+
+def _root_index(connection: Connection, name: str) -> str:
+    while True:
+        parent = connection.execute(text(
+            "SELECT parent.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "WHERE child.relname = :name AND child.relkind = 'i'"
+        ), {"name": name}).scalar()
+        if parent is None:
+            return name
+        name = parent
+
+
+def _collect_index_names(node: Any, names: Set[str]) -> None:
+    if isinstance(node, dict):
+        if "Index Name" in node:
+            names.add(node["Index Name"])
+        for value in node.values():
+            _collect_index_names(value, names)
+    elif isinstance(node, list):
+        for value in node:
+            _collect_index_names(value, names)
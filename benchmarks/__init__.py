@@ -0,0 +1 @@
+"""Micro-benchmarks and load tests for the BookIt API."""
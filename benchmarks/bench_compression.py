@@ -0,0 +1,52 @@
+"""Compare response size and CPU cost of the available compression codecs.
+
+Usage:
+    python -m benchmarks.bench_compression --rows 1000
+
+The payload is a ``GET /bookings``-shaped JSON list rendered with the same
+encoder as the API. Levels come from the COMPRESSION_* settings.
+"""
+import argparse
+import json
+import time
+
+from app.config.settings import settings
+from app.core.compression import _Compressor, available_encodings
+from app.core.serialization import ORJSONResponse, dump_rows
+from app.schemas.booking import BookingResponse
+from benchmarks.bench_serialization import make_bookings
+
+LEVELS = {
+    "gzip": settings.compression_gzip_level,
+    "br": settings.compression_brotli_quality,
+    "zstd": settings.compression_zstd_level,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    body = ORJSONResponse(content=dump_rows(BookingResponse, make_bookings(args.rows))).body
+    results = {"identity": {"bytes": len(body), "ratio": 1.0, "cpu_ms_per_request": 0.0}}
+
+    for encoding in available_encodings():
+        level = LEVELS[encoding]
+        compressed = _Compressor(encoding, level).compress_all(body)
+        started = time.process_time()
+        for _ in range(args.repeat):
+            _Compressor(encoding, level).compress_all(body)
+        cpu = (time.process_time() - started) / args.repeat
+        results[encoding] = {
+            "level": level,
+            "bytes": len(compressed),
+            "ratio": round(len(body) / len(compressed), 2),
+            "cpu_ms_per_request": round(cpu * 1000, 3),
+        }
+    print(json.dumps({"rows": args.rows, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
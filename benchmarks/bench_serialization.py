@@ -0,0 +1,107 @@
+"""Compare per-row serialization cost of list endpoints.
+
+Usage:
+    python -m benchmarks.bench_serialization --rows 10000
+
+"default" mirrors what FastAPI does for ``response_model=List[...]``: validate the
+ORM objects, dump them in JSON mode and encode with the stdlib ``json`` module.
+"fast" is the ``app.core.serialization`` pipeline (single validation + orjson).
+"""
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import List
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.core.serialization import ORJSONResponse, dump_rows
+from app.models.booking import Booking, BookingStatus
+from app.models.service import Service
+from app.schemas.booking import BookingResponse
+from app.schemas.service import ServiceResponse
+
+
+def make_bookings(n: int) -> List[Booking]:
+    now = datetime.now(timezone.utc)
+    user_id = uuid.uuid4()
+    service_id = uuid.uuid4()
+    return [
+        Booking(
+            id=uuid.uuid4(),
+            user_id=user_id,
+            service_id=service_id,
+            start_time=now + timedelta(hours=i),
+            end_time=now + timedelta(hours=i + 1),
+            status=BookingStatus.PENDING,
+            created_at=now,
+        )
+        for i in range(n)
+    ]
+
+
+def make_services(n: int) -> List[Service]:
+    now = datetime.now(timezone.utc)
+    return [
+        Service(
+            id=uuid.uuid4(),
+            title=f"Service {i}",
+            description="A bookable service " * 5,
+            price=Decimal("49.99"),
+            duration_minutes=60,
+            is_active=True,
+            created_at=now,
+        )
+        for i in range(n)
+    ]
+
+
+def default_pipeline(schema, rows) -> bytes:
+    adapter = TypeAdapter(List[schema])
+    value = adapter.validate_python(rows, from_attributes=True)
+    return JSONResponse(content=adapter.dump_python(value, mode="json")).body
+
+
+def fast_pipeline(schema, rows) -> bytes:
+    return ORJSONResponse(content=dump_rows(schema, rows)).body
+
+
+def measure(fn, schema, rows, repeat: int) -> float:
+    fn(schema, rows)  # warm caches
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(schema, rows)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cases = [
+        ("bookings", BookingResponse, make_bookings(args.rows)),
+        ("services", ServiceResponse, make_services(args.rows)),
+    ]
+    results = {}
+    for name, schema, rows in cases:
+        assert json.loads(default_pipeline(schema, rows)) == json.loads(fast_pipeline(schema, rows))
+        default_s = measure(default_pipeline, schema, rows, args.repeat)
+        fast_s = measure(fast_pipeline, schema, rows, args.repeat)
+        results[name] = {
+            "rows": args.rows,
+            "default_us_per_row": round(default_s / args.rows * 1e6, 3),
+            "fast_us_per_row": round(fast_s / args.rows * 1e6, 3),
+            "speedup": round(default_s / fast_s, 2),
+        }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Compare Python-side per-query overhead of legacy ``db.query(...)`` calls and
+the prebuilt statements in ``app.services.statements``.
+
+Usage:
+    python -m benchmarks.bench_statements --iterations 20000
+
+Queries run against empty tables in an in-memory SQLite database, so database
+time is negligible and the difference is statement construction, cache-key
+generation and result handling. The compiled-cache hit ratio for each run is
+reported too.
+"""
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.config.database import Base, StatementCacheStats
+from app.models.booking import Booking, BookingStatus
+from app.models.service import Service
+from app.models.user import User
+from app.services.statements import (
+    BOOKING_CONFLICT, get_booking_by_id, get_service_by_id, get_user_by_email
+)
+
+
+@compiles(UUID, "sqlite")
+def _compile_uuid(element, compiler, **kw):
+    return "CHAR(32)"
+
+
+def legacy_cases(db: Session, ids: dict) -> dict:
+    start = ids["start"]
+    return {
+        "user_by_email": lambda: db.query(User).filter(User.email == "bench@example.com").first(),
+        "service_by_id": lambda: db.query(Service).filter(Service.id == ids["service"]).first(),
+        "booking_by_id_and_owner": lambda: db.query(Booking).filter(
+            Booking.id == ids["booking"], Booking.user_id == ids["user"]
+        ).first(),
+        "booking_conflict": lambda: db.query(Booking).filter(
+            Booking.service_id == ids["service"],
+            Booking.status.in_([BookingStatus.PENDING, BookingStatus.CONFIRMED]),
+            Booking.start_time < start + timedelta(hours=1),
+            Booking.start_time > start - timedelta(hours=24),
+            Booking.end_time > start
+        ).first(),
+    }
+
+
+def cached_cases(db: Session, ids: dict) -> dict:
+    start = ids["start"]
+    return {
+        "user_by_email": lambda: get_user_by_email(db, "bench@example.com"),
+        "service_by_id": lambda: get_service_by_id(db, ids["service"]),
+        "booking_by_id_and_owner": lambda: get_booking_by_id(db, ids["booking"], ids["user"]),
+        "booking_conflict": lambda: db.execute(BOOKING_CONFLICT, {
+            "service_id": ids["service"],
+            "start_time": start,
+            "end_time": start + timedelta(hours=1),
+            "window_start": start - timedelta(hours=24),
+        }).first(),
+    }
+
+
+def measure(fn, iterations: int, repeat: int) -> float:
+    for _ in range(100):  # warm caches
+        fn()
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        best = min(best, time.perf_counter() - started)
+    return best / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    ids = {
+        "user": uuid.uuid4(), "service": uuid.uuid4(), "booking": uuid.uuid4(),
+        "start": datetime.now(timezone.utc) + timedelta(days=1),
+    }
+
+    counter = StatementCacheStats(engine)
+    results = {}
+    with Session(engine) as db:
+        legacy, cached = legacy_cases(db, ids), cached_cases(db, ids)
+        for name in legacy:
+            legacy_s = measure(legacy[name], args.iterations, args.repeat)
+            hits, misses = counter.hits, counter.misses
+            cached_s = measure(cached[name], args.iterations, args.repeat)
+            hits, misses = counter.hits - hits, counter.misses - misses
+            results[name] = {
+                "legacy_us": round(legacy_s * 1e6, 2),
+                "cached_us": round(cached_s * 1e6, 2),
+                "speedup": round(legacy_s / cached_s, 2),
+                "cached_hit_ratio": round(hits / (hits + misses), 4),
+            }
+    results["compiled_cache"] = counter.snapshot()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
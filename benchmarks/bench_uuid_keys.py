@@ -0,0 +1,114 @@
+"""Compare insert throughput and primary-key index size for uuid4 and UUIDv7 keys.
+
+Usage:
+    python -m benchmarks.bench_uuid_keys --rows 10000000
+
+Needs PostgreSQL (``DATABASE_URL``). Creates two scratch tables shaped like a
+narrow ``bookings`` row, one keyed by ``uuid4`` and one by ``app.utils.ids.uuid7``,
+and fills them batch by batch (one transaction per batch, alternating tables so
+both see the same cache conditions). Reports rows/s, table and primary-key index
+size, and whether ``ORDER BY id`` returns rows in insertion order. The tables are
+dropped afterwards unless ``--keep`` is given.
+"""
+import argparse
+import json
+import sys
+import time
+import uuid
+
+from sqlalchemy import text
+
+from app.config.database import engine
+from app.utils.ids import uuid7
+
+GENERATORS = {"uuid4": uuid.uuid4, "uuid7": uuid7}
+
+INSERT = (
+    "INSERT INTO {table} (id, seq) "
+    "SELECT * FROM unnest(CAST(:ids AS uuid[]), CAST(:seqs AS bigint[]))"
+)
+
+
+def table_name(kind: str) -> str:
+    return f"bench_keys_{kind}"
+
+
+def create_tables(connection) -> None:
+    for kind in GENERATORS:
+        table = table_name(kind)
+        connection.execute(text(f"DROP TABLE IF EXISTS {table}"))
+        connection.execute(text(
+            f"CREATE TABLE {table} ("
+            "id uuid PRIMARY KEY, seq bigint NOT NULL, "
+            "created_at timestamptz NOT NULL DEFAULT now())"
+        ))
+
+
+def insert_batch(kind: str, start: int, size: int) -> float:
+    generate = GENERATORS[kind]
+    ids = [str(generate()) for _ in range(size)]
+    seqs = list(range(start, start + size))
+    stmt = text(INSERT.format(table=table_name(kind)))
+    started = time.perf_counter()
+    with engine.begin() as connection:
+        connection.execute(stmt, {"ids": ids, "seqs": seqs})
+    return time.perf_counter() - started
+
+
+def sizes(connection, kind: str) -> dict:
+    table = table_name(kind)
+    row = connection.execute(text(
+        "SELECT pg_relation_size(CAST(:table AS regclass)), "
+        "pg_relation_size(CAST(:index AS regclass))"
+    ), {"table": table, "index": f"{table}_pkey"}).one()
+    return {"table_mb": round(row[0] / 2**20, 1), "pk_index_mb": round(row[1] / 2**20, 1)}
+
+
+def id_order_matches_insert_order(connection, kind: str, sample: int) -> bool:
+    """Keyset pagination on id returns rows in creation order only if this holds."""
+    seqs = connection.execute(text(
+        f"SELECT seq FROM {table_name(kind)} ORDER BY id LIMIT :limit"
+    ), {"limit": sample}).scalars().all()
+    return seqs == sorted(seqs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=1_000, help="rows per insert transaction")
+    parser.add_argument("--keep", action="store_true", help="keep the scratch tables")
+    args = parser.parse_args()
+
+    if engine.dialect.name != "postgresql":
+        sys.exit("bench_uuid_keys needs PostgreSQL (DATABASE_URL)")
+
+    with engine.begin() as connection:
+        create_tables(connection)
+
+    elapsed = dict.fromkeys(GENERATORS, 0.0)
+    for start in range(0, args.rows, args.batch):
+        size = min(args.batch, args.rows - start)
+        for kind in GENERATORS:
+            elapsed[kind] += insert_batch(kind, start, size)
+
+    results = {"rows": args.rows, "batch": args.batch}
+    with engine.begin() as connection:
+        for kind in GENERATORS:
+            connection.execute(text(f"ANALYZE {table_name(kind)}"))
+            results[kind] = {
+                "rows_per_second": round(args.rows / elapsed[kind]),
+                **sizes(connection, kind),
+                "id_order_is_insert_order": id_order_matches_insert_order(connection, kind, 100_000),
+            }
+        if not args.keep:
+            for kind in GENERATORS:
+                connection.execute(text(f"DROP TABLE {table_name(kind)}"))
+
+    results["pk_index_ratio"] = round(
+        results["uuid4"]["pk_index_mb"] / max(results["uuid7"]["pk_index_mb"], 0.1), 2
+    )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Confirm the hot queries are served by the indexes added in c3f8a9e61d25 and a9d3f17b6c42.
+
+Usage:
+    python -m benchmarks.check_indexes
+
+Runs the real service methods inside a transaction that is rolled back, captures
+the SQL they emit and EXPLAINs it. Sequential scans are disabled on PostgreSQL so
+the check does not depend on table size. Exits non-zero if an expected index is
+not used.
+"""
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config.database import engine
+from app.models.user import User, UserRole
+from app.services.booking_service import BookingService
+from app.services.statements import get_user_by_email
+from app.utils.explain import capture_statements, explain_index_names
+
+
+# Either leads with user_id; an unbounded, unordered list is served equally well by both
+PER_USER_BOOKING_INDEXES = {"ix_bookings_user_id_start_time", "ix_bookings_user_id_updated_at"}
+
+
+def hot_queries(db: Session):
+    """(name, expected indexes, callable) for each hot query path."""
+    user = User(id=uuid.uuid4(), email="explain@example.com", role=UserRole.USER)
+    service_id = uuid.uuid4()
+    start = datetime.now(timezone.utc) + timedelta(days=1)
+    bookings = BookingService(db)
+    return [
+        (
+            "BookingService._has_conflict",
+            {"ix_bookings_active_service_slot", "ix_bookings_service_id_start_time"},
+            lambda: bookings._has_conflict(service_id, start, start + timedelta(hours=1)),
+        ),
+        (
+            "BookingService.get_bookings (user)",
+            PER_USER_BOOKING_INDEXES,
+            lambda: bookings.get_bookings(user=user),
+        ),
+        (
+            "BookingService.get_bookings (user, range)",
+            {"ix_bookings_user_id_start_time"},
+            lambda: bookings.get_bookings(user=user, start_from=start, start_to=start + timedelta(days=30)),
+        ),
+        (
+            "get_current_user (email lookup)",
+            {"ix_users_email"},
+            lambda: get_user_by_email(db, user.email),
+        ),
+    ]
+
+
+def check(connection) -> list:
+    """Return (name, used indexes, ok) for each hot query."""
+    results = []
+    db = Session(bind=connection)
+    for name, expected, run in hot_queries(db):
+        with capture_statements(connection.engine) as statements:
+            run()
+        used = set()
+        for statement, parameters in statements:
+            used |= explain_index_names(connection, statement, parameters)
+        results.append((name, used, bool(used & expected)))
+    db.close()
+    return results
+
+
+def main():
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        if connection.dialect.name == "postgresql":
+            connection.execute(text("SET LOCAL enable_seqscan = off"))
+        try:
+            results = check(connection)
+        finally:
+            transaction.rollback()
+
+    for name, used, ok in results:
+        print(f"{'OK  ' if ok else 'FAIL'} {name}: {', '.join(sorted(used)) or 'no index'}")
+    sys.exit(0 if all(ok for _, _, ok in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
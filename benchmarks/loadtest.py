@@ -0,0 +1,229 @@
+"""Mixed-workload load test for the whole API.
+
+Usage:
+    python -m app.seed --users 100000 --services 5000 --bookings 10000000   # once
+    python -m benchmarks.loadtest --mode asgi --duration 30 --concurrency 50
+    python -m benchmarks.loadtest --mode uvicorn --workers 4 --output results.json
+
+``asgi`` drives the app in-process through httpx's ASGI transport; ``uvicorn``
+starts the production server (``app.serve``) and drives its workers over HTTP.
+Each virtual user logs in once, then loops over a weighted mix of catalog
+browsing, logins, contended booking creation and booking listing. The JSON report has throughput and
+p50/p95/p99 latency per endpoint plus the git commit, so runs can be compared.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+import httpx
+from sqlalchemy import text
+
+# Every virtual user connects from the same address; measure the API, not the limiter
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
+from app.config.database import engine
+from app.seed import SEED_PASSWORD, SLOT_MINUTES, user_email
+
+API = "/api/v1"
+
+# (workload, weight)
+WORKLOAD_MIX = [
+    ("browse_catalog", 50),
+    ("list_bookings", 25),
+    ("create_booking", 15),
+    ("login", 10),
+]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    async def request(self, client: httpx.AsyncClient, label: str, method: str, url: str, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.errors[label] += 1
+            return None
+        self.latencies[label].append(time.perf_counter() - started)
+        self.statuses[label][response.status_code] += 1
+        if response.status_code >= 500:
+            self.errors[label] += 1
+        return response
+
+    def summary(self, elapsed: float) -> dict:
+        endpoints = {}
+        for label in sorted(set(self.latencies) | set(self.errors)):
+            values = sorted(self.latencies[label])
+            endpoints[label] = {
+                "requests": len(values),
+                "errors": self.errors[label],
+                "throughput_rps": round(len(values) / elapsed, 2),
+                "p50_ms": round(percentile(values, 50) * 1000, 2),
+                "p95_ms": round(percentile(values, 95) * 1000, 2),
+                "p99_ms": round(percentile(values, 99) * 1000, 2),
+                "status_codes": {str(code): n for code, n in sorted(self.statuses[label].items())},
+            }
+        total = sum(e["requests"] for e in endpoints.values())
+        return {"total_requests": total, "throughput_rps": round(total / elapsed, 2), "endpoints": endpoints}
+
+
+def load_fixtures(sample: int, hot_services: int) -> dict:
+    """Sample ids from the seeded database for the workloads to use."""
+    with engine.connect() as connection:
+        service_ids = [str(i) for i in connection.execute(
+            text("SELECT id FROM services WHERE is_active ORDER BY title LIMIT :n"), {"n": sample}
+        ).scalars()]
+        user_count = connection.execute(
+            text("SELECT count(*) FROM users WHERE email LIKE '%@bookit.example'")
+        ).scalar()
+    if not service_ids or not user_count:
+        raise SystemExit("No seeded data found; run `python -m app.seed` first")
+    return {"service_ids": service_ids, "hot_service_ids": service_ids[:hot_services], "user_count": user_count}
+
+
+async def virtual_user(client: httpx.AsyncClient, recorder: Recorder, fixtures: dict, deadline: float, rng: random.Random):
+    email = user_email(rng.randrange(fixtures["user_count"]))
+    login = {"email": email, "password": SEED_PASSWORD}
+    response = await recorder.request(client, "POST /auth/login", "POST", f"{API}/auth/login", json=login)
+    if response is None or response.status_code != 200:
+        return
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    workloads = [name for name, _ in WORKLOAD_MIX]
+    weights = [weight for _, weight in WORKLOAD_MIX]
+    # Contended slots: a handful of hot services over the next few days
+    base = (datetime.now(timezone.utc) + timedelta(days=1)).replace(minute=0, second=0, microsecond=0)
+
+    while time.perf_counter() < deadline:
+        workload = rng.choices(workloads, weights)[0]
+        if workload == "browse_catalog":
+            await recorder.request(client, "GET /services", "GET", f"{API}/services/")
+            service_id = rng.choice(fixtures["service_ids"])
+            await recorder.request(client, "GET /services/{id}", "GET", f"{API}/services/{service_id}")
+        elif workload == "list_bookings":
+            await recorder.request(client, "GET /bookings", "GET", f"{API}/bookings/", headers=headers)
+        elif workload == "create_booking":
+            start = base + timedelta(hours=rng.randrange(72))
+            body = {
+                "service_id": rng.choice(fixtures["hot_service_ids"]),
+                "start_time": start.isoformat(),
+                "end_time": (start + timedelta(minutes=SLOT_MINUTES)).isoformat(),
+            }
+            await recorder.request(client, "POST /bookings", "POST", f"{API}/bookings/", json=body, headers=headers)
+        else:
+            await recorder.request(client, "POST /auth/login", "POST", f"{API}/auth/login", json=login)
+
+
+async def run_load(base_url: str, transport: Optional[httpx.AsyncBaseTransport], args, fixtures: dict) -> dict:
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, transport=transport, limits=limits, timeout=30) as client:
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(
+            virtual_user(client, recorder, fixtures, deadline, random.Random(args.seed + i))
+            for i in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+    return recorder.summary(elapsed)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until_up(base_url: str, timeout: float = 30) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise SystemExit("uvicorn did not come up in time")
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mixed-workload load test for the BookIt API.")
+    parser.add_argument("--mode", choices=["asgi", "uvicorn"], default="asgi")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="uvicorn mode only")
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--hot-services", type=int, default=5, help="services shared by booking writers")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(sample=1000, hot_services=args.hot_services)
+    server = None
+    if args.mode == "asgi":
+        from app.main import app
+        base_url, transport = "http://loadtest", httpx.ASGITransport(app=app)
+    else:
+        port = _free_port()
+        base_url, transport = f"http://127.0.0.1:{port}", None
+        server = subprocess.Popen([
+            sys.executable, "-m", "app.serve",
+            "--host", "127.0.0.1", "--port", str(port), "--workers", str(args.workers),
+        ])
+        _wait_until_up(base_url)
+
+    try:
+        summary = asyncio.run(run_load(base_url, transport, args, fixtures))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "mode": args.mode,
+        "workers": args.workers if args.mode == "uvicorn" else 1,
+        "duration_s": args.duration,
+        "concurrency": args.concurrency,
+        **summary,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,48 +1,22 @@
 import sys
 import os
-from uuid import uuid4
 
 # Add the app directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from app.config.database import SessionLocal
 from app.config.settings import settings
-from app.models.user import User, UserRole
-from app.core.security import get_password_hash
+from app.seed import create_admin_user
 
-def create_admin_user():
-    """Create admin user from environment variables"""
-    
-    # Database connection
-    engine = create_engine(settings.database_url)
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    
+def main():
+    """Create admin user from environment variables (same as `python -m app.seed --admin`)"""
     db = SessionLocal()
     
     try:
-        # Check if admin already exists
-        existing_admin = db.query(User).filter(
-            User.email == settings.admin_email,
-            User.role == UserRole.ADMIN
-        ).first()
-        
-        if existing_admin:
+        if not create_admin_user(db):
             print(f"✅ Admin user already exists: {settings.admin_email}")
             return
         
-        # Create admin user from environment variables
-        admin_user = User(
-            id=uuid4(),
-            name=settings.admin_name,
-            email=settings.admin_email,
-            password_hash=get_password_hash(settings.admin_password),
-            role=UserRole.ADMIN
-        )
-        
-        db.add(admin_user)
-        db.commit()
-        
         print("🎉 Admin user created successfully!")
         print(f"📧 Email: {settings.admin_email}")
         print(f"👤 Name: {settings.admin_name}")
@@ -57,4 +31,4 @@ def create_admin_user():
 
 if __name__ == "__main__":
     print("🚀 Creating admin user...")
-    create_admin_user()
\ No newline at end of file
+    main()
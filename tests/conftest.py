@@ -18,6 +18,8 @@ from app.models.service import Service
 from app.models.booking import Booking, BookingStatus
 from app.models.review import Review
 from app.core.security import get_password_hash
+from app.services.service_service import catalog_cache
+from app.core.login_guard import get_login_guard
 
 
 class GUID(TypeDecorator):
@@ -104,6 +106,10 @@ def client(db_session):
             pass
     
     app.dependency_overrides[get_db] = override_get_db
+    # Tests write services straight to the database, bypassing cache invalidation
+    catalog_cache.clear()
+    # Every test client logs in from the same address
+    get_login_guard().clear()
     
     # Use context manager for proper cleanup
     with TestClient(app) as test_client:
@@ -2,7 +2,10 @@ import pytest
 from datetime import datetime, timedelta
 from fastapi import status
 from uuid import uuid4
+from sqlalchemy import event
 from app.models.booking import Booking, BookingStatus
+from app.models.review import Review
+from app.models.outbox import OutboxEvent
 
 class TestBookingConflicts:
     """Test booking conflict detection and prevention"""
@@ -141,4 +144,170 @@ class TestBookingConflicts:
         )
         
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-        assert "duration" in response.json()["detail"].lower()
\ No newline at end of file
+        assert "duration" in response.json()["detail"].lower()
+
+class TestBookingListFilters:
+    """Test start_time range filters on the bookings list"""
+    
+    def test_bookings_filtered_by_start_range(self, client, db_session, test_user, test_service, user_token):
+        """Test from/to only return bookings starting inside the range"""
+        base = datetime.now() + timedelta(days=30)
+        inside = Booking(
+            id=uuid4(),
+            user_id=test_user.id,
+            service_id=test_service.id,
+            start_time=base,
+            end_time=base + timedelta(hours=1),
+            status=BookingStatus.CONFIRMED
+        )
+        outside = Booking(
+            id=uuid4(),
+            user_id=test_user.id,
+            service_id=test_service.id,
+            start_time=base + timedelta(days=5),
+            end_time=base + timedelta(days=5, hours=1),
+            status=BookingStatus.CONFIRMED
+        )
+        db_session.add_all([inside, outside])
+        db_session.commit()
+        
+        response = client.get(
+            "/api/v1/bookings/",
+            headers={"Authorization": f"Bearer {user_token}"},
+            params={
+                "from": (base - timedelta(days=1)).isoformat(),
+                "to": (base + timedelta(days=1)).isoformat()
+            }
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        ids = [booking["id"] for booking in response.json()]
+        assert str(inside.id) in ids
+        assert str(outside.id) not in ids
+
+class TestBookingDeletion:
+    """Test deleting bookings and what hangs off them"""
+    
+    def test_delete_reviewed_booking(self, client, db_session, test_user, test_service, user_token):
+        """Test deleting a booking removes its review, which has no foreign key to cascade from"""
+        start_time = datetime.now() - timedelta(days=3)
+        booking = Booking(
+            user_id=test_user.id,
+            service_id=test_service.id,
+            start_time=start_time,
+            end_time=start_time + timedelta(hours=1),
+            status=BookingStatus.COMPLETED
+        )
+        db_session.add(booking)
+        db_session.flush()
+        review = Review(booking_id=booking.id, rating=5, comment="Great")
+        db_session.add(review)
+        db_session.commit()
+        booking_id, review_id = booking.id, review.id
+        
+        response = client.delete(
+            f"/api/v1/bookings/{booking_id}",
+            headers={"Authorization": f"Bearer {user_token}"}
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        db_session.expire_all()
+        assert db_session.get(Review, review_id) is None
+        events = db_session.query(OutboxEvent).filter(OutboxEvent.aggregate_id == review_id).all()
+        assert [event.event_type for event in events] == ["review.deleted"]
+    
+    def test_client_supplied_id_is_ignored(self, client, user_token, test_service):
+        """Test booking ids are always minted by the server"""
+        start_time = datetime.now() + timedelta(days=2)
+        chosen = str(uuid4())
+        
+        response = client.post(
+            "/api/v1/bookings/",
+            headers={"Authorization": f"Bearer {user_token}"},
+            json={
+                "id": chosen,
+                "service_id": str(test_service.id),
+                "start_time": start_time.isoformat(),
+                "end_time": (start_time + timedelta(hours=1)).isoformat()
+            }
+        )
+        
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["id"] != chosen
+
+
+
+class TestBookingIncludes:
+    """Test embedding the service and review with ?include="""
+    
+    @pytest.fixture
+    def bookings(self, db_session, test_user, test_service):
+        base = datetime.now() - timedelta(days=40)
+        bookings = [
+            Booking(
+                id=uuid4(),
+                user_id=test_user.id,
+                service_id=test_service.id,
+                start_time=base + timedelta(days=n),
+                end_time=base + timedelta(days=n, hours=1),
+                status=BookingStatus.COMPLETED
+            )
+            for n in range(3)
+        ]
+        db_session.add_all(bookings)
+        review = Review(id=uuid4(), booking_id=bookings[0].id, rating=4, comment="Good")
+        db_session.add(review)
+        db_session.commit()
+        ids = [booking.id for booking in bookings]
+        # Start from an empty identity map so every relation has to be queried
+        for obj in [*bookings, review, test_service]:
+            db_session.expunge(obj)
+        return ids
+    
+    def test_include_service_and_review(self, client, test_db, bookings, user_token):
+        """Test relations are embedded with one query each, not one per booking"""
+        statements = []
+        
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if "FROM users" not in statement:
+                statements.append(statement)
+        
+        event.listen(test_db, "before_cursor_execute", record)
+        try:
+            response = client.get(
+                "/api/v1/bookings/",
+                headers={"Authorization": f"Bearer {user_token}"},
+                params={"include": "service,review"}
+            )
+        finally:
+            event.remove(test_db, "before_cursor_execute", record)
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = {item["id"]: item for item in response.json()}
+        assert data[str(bookings[0])]["review"]["rating"] == 4
+        assert data[str(bookings[1])]["review"] is None
+        assert all(item["service"]["title"] == "Test Service" for item in data.values())
+        assert len(statements) == 3
+    
+    def test_include_with_fields(self, client, bookings, user_token):
+        """Test included relations extend a sparse fieldset"""
+        response = client.get(
+            f"/api/v1/bookings/{bookings[0]}",
+            headers={"Authorization": f"Bearer {user_token}"},
+            params={"fields": "status", "include": "service"}
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        assert set(body) == {"id", "status", "service"}
+        assert body["service"]["price"] == 100.0
+    
+    def test_unknown_relation(self, client, user_token):
+        """Test unknown relations are rejected"""
+        response = client.get(
+            "/api/v1/bookings/",
+            headers={"Authorization": f"Bearer {user_token}"},
+            params={"include": "user"}
+        )
+        
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
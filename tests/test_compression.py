@@ -0,0 +1,116 @@
+import gzip
+
+import anyio
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, negotiate_encoding
+
+
+@pytest.fixture
+def compressed_client():
+    """Minimal app wrapped in the compression middleware"""
+    app = FastAPI()
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=1024,
+        offload_size=4096,
+        content_types=["application/json", "application/x-ndjson"],
+        encodings=["gzip"],
+    )
+
+    @app.get("/large")
+    def large():
+        return [{"id": i, "title": "Service"} for i in range(500)]
+
+    @app.get("/small")
+    def small():
+        return {"status": "ok"}
+
+    @app.get("/text")
+    def text():
+        return PlainTextResponse("x" * 5000)
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(
+            (b'{"row": %d}\n' % i for i in range(1000)), media_type="application/x-ndjson"
+        )
+
+    with TestClient(app) as client:
+        yield client
+
+
+class TestCompressionMiddleware:
+    """Test response compression negotiation and thresholds"""
+
+    def test_negotiate_prefers_server_order(self):
+        """Test the first supported encoding the client accepts is chosen"""
+        assert negotiate_encoding("gzip, br", ["br", "zstd", "gzip"]) == "br"
+        assert negotiate_encoding("gzip;q=0, br;q=0.5", ["gzip", "br"]) == "br"
+        assert negotiate_encoding("identity", ["gzip"]) is None
+        assert negotiate_encoding("*", ["gzip"]) == "gzip"
+
+    def test_large_json_is_compressed(self, compressed_client):
+        """Test JSON above the threshold is gzipped and still decodes"""
+        response = compressed_client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert len(response.json()) == 500
+
+    def test_small_json_is_not_compressed(self, compressed_client):
+        """Test bodies below the threshold are sent as-is"""
+        response = compressed_client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"status": "ok"}
+
+    def test_content_type_not_allowed(self, compressed_client):
+        """Test content types outside the allow-list are not compressed"""
+        response = compressed_client.get("/text", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+
+    def test_streaming_response_is_compressed(self, compressed_client):
+        """Test streaming NDJSON is compressed chunk by chunk"""
+        response = compressed_client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.text.splitlines()) == 1000
+
+    def test_identity_requested(self, compressed_client):
+        """Test clients that don't accept gzip get plain bodies"""
+        response = compressed_client.get("/large", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
+
+    def test_streaming_flushes_at_threshold(self):
+        """Test small streamed chunks are buffered and flushed every flush_size bytes"""
+        rows = [b'{"row": %d}\n' % i for i in range(1000)]
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200,
+                        "headers": [(b"content-type", b"application/x-ndjson")]})
+            for row in rows:
+                await send({"type": "http.response.body", "body": row, "more_body": True})
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        middleware = CompressionMiddleware(
+            app, content_types=["application/x-ndjson"], encodings=["gzip"], flush_size=4096
+        )
+        scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", b"gzip")]}
+        anyio.run(middleware, scope, None, send)
+
+        bodies = [message["body"] for message in sent if message["type"] == "http.response.body"]
+        # gzip header, one message per flush, then the trailer
+        assert len(bodies) <= sum(map(len, rows)) // 4096 + 2
+        assert not sent[-1]["more_body"]
+        assert gzip.decompress(b"".join(bodies)) == b"".join(rows)
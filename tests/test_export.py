@@ -0,0 +1,88 @@
+import csv
+import io
+import json
+import pytest
+from datetime import datetime, timedelta
+from fastapi import status
+from uuid import uuid4
+from app.models.booking import Booking, BookingStatus
+
+
+@pytest.fixture
+def export_bookings(db_session, test_user, test_service):
+    """Create three bookings on consecutive days in a window no other test uses"""
+    base = datetime(2031, 1, 1, 9, 0)
+    bookings = []
+    for day in range(3):
+        booking = Booking(
+            id=uuid4(),
+            user_id=test_user.id,
+            service_id=test_service.id,
+            start_time=base + timedelta(days=day),
+            end_time=base + timedelta(days=day, hours=1),
+            status=BookingStatus.CONFIRMED
+        )
+        db_session.add(booking)
+        bookings.append(booking)
+    db_session.commit()
+    midnight = base.replace(hour=0)
+    window = {
+        "from": midnight.isoformat(),
+        "to": (midnight + timedelta(days=2)).isoformat()
+    }
+    yield bookings, window
+    # Committed rows outlive the test; the next one reuses the same window
+    for booking in bookings:
+        db_session.delete(booking)
+    db_session.commit()
+
+
+class TestBookingExport:
+    """Test the streaming admin booking export"""
+
+    def test_export_ndjson(self, client, admin_token, export_bookings):
+        """Test NDJSON export only includes rows in [from, to)"""
+        response = client.get(
+            "/api/v1/bookings/export",
+            headers={"Authorization": f"Bearer {admin_token}"},
+            params=export_bookings[1]
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["id"] for row in rows] == [str(b.id) for b in export_bookings[0][:2]]
+        assert rows[0]["status"] == "confirmed"
+
+    def test_export_csv(self, client, admin_token, export_bookings):
+        """Test CSV export has a header and one line per booking"""
+        response = client.get(
+            "/api/v1/bookings/export",
+            headers={"Authorization": f"Bearer {admin_token}"},
+            params={**export_bookings[1], "format": "csv"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 2
+        assert rows[0]["status"] == "confirmed"
+
+    def test_export_user_forbidden(self, client, user_token):
+        """Test regular users cannot export bookings"""
+        response = client.get(
+            "/api/v1/bookings/export",
+            headers={"Authorization": f"Bearer {user_token}"},
+            params={"from": "2031-03-01T00:00:00", "to": "2031-03-03T00:00:00"}
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_export_invalid_range(self, client, admin_token):
+        """Test from >= to is rejected before streaming starts"""
+        response = client.get(
+            "/api/v1/bookings/export",
+            headers={"Authorization": f"Bearer {admin_token}"},
+            params={"from": "2031-03-03T00:00:00", "to": "2031-03-01T00:00:00"}
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
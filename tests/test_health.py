@@ -0,0 +1,102 @@
+import time
+import pytest
+from fastapi import status
+from sqlalchemy import create_engine
+
+from app.core.heartbeat import Heartbeat, get_heartbeat
+from app.main import app
+
+
+@pytest.fixture
+def heartbeat(client, test_db):
+    """Heartbeat against the test database, served to /ready"""
+    heartbeat = Heartbeat(test_db, interval=2)
+    app.dependency_overrides[get_heartbeat] = lambda: heartbeat
+    return heartbeat
+
+
+class TestProbes:
+    """Test liveness and heartbeat-backed readiness"""
+
+    def test_live(self, client):
+        """Test liveness answers without touching the database"""
+        response = client.get("/api/v1/live")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"status": "ok"}
+
+    def test_not_ready_before_first_heartbeat(self, client, heartbeat):
+        """Test readiness is 503 until the heartbeat has run"""
+        response = client.get("/api/v1/ready")
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.json()["status"] == "starting"
+
+    def test_ready_after_heartbeat(self, client, heartbeat):
+        """Test readiness reports the last heartbeat result"""
+        heartbeat.beat()
+
+        response = client.get("/api/v1/ready")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["status"] == "ready"
+        assert data["database"] == "ok"
+        assert data["pool"]["checked_out"] == 0
+
+    def test_stale_heartbeat_not_ready(self, client, heartbeat):
+        """Test a heartbeat that stopped refreshing makes the instance not ready"""
+        heartbeat.beat()
+        heartbeat.snapshot["checked_at"] = time.monotonic() - 60
+
+        response = client.get("/api/v1/ready")
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.json()["reason"] == "stale"
+
+    def test_exhausted_pool_not_ready(self, client):
+        """Test a fully checked-out pool is reported without queueing for a connection"""
+        engine = create_engine("sqlite:///./test.db", pool_size=1, max_overflow=0)
+        heartbeat = Heartbeat(engine, interval=2)
+        app.dependency_overrides[get_heartbeat] = lambda: heartbeat
+
+        with engine.connect():
+            heartbeat.beat()
+        response = client.get("/api/v1/ready")
+        engine.dispose()
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.json()["reason"] == "pool_exhausted"
+        assert response.json()["pool"]["usage"] == 1.0
+
+    def test_busy_pool_within_size_is_ready(self, client):
+        """Test connections held within the pool size do not count as saturation"""
+        engine = create_engine("sqlite:///./test.db", pool_size=3, max_overflow=4)
+        heartbeat = Heartbeat(engine, interval=2)
+        app.dependency_overrides[get_heartbeat] = lambda: heartbeat
+
+        held = [engine.connect() for _ in range(2)]
+        heartbeat.beat()
+        assert client.get("/api/v1/ready").status_code == status.HTTP_200_OK
+
+        held += [engine.connect() for _ in range(4)]
+        heartbeat.beat()
+        response = client.get("/api/v1/ready")
+        for connection in held:
+            connection.close()
+        engine.dispose()
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.json()["reason"] == "pool_busy"
+        assert response.json()["pool"]["overflow_usage"] == 0.75
+
+    def test_zero_thresholds_are_kept(self, client, heartbeat):
+        """Test a configured 0 is used rather than replaced by the default"""
+        strict = Heartbeat(heartbeat.engine, interval=2, max_latency_ms=0)
+        app.dependency_overrides[get_heartbeat] = lambda: strict
+        strict.beat()
+
+        response = client.get("/api/v1/ready")
+
+        assert strict.max_latency_ms == 0
+        assert response.json()["reason"] == "slow_database"
@@ -0,0 +1,49 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.booking import Booking
+from app.seed import entity_id
+from app.utils.ids import uuid7, uuid7_time
+
+
+class TestUuid7:
+    """Test time-ordered primary keys"""
+
+    def test_layout(self):
+        """Test version and variant bits"""
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_strictly_increasing(self):
+        """Test ids generated in one process sort in creation order"""
+        ids = [uuid7() for _ in range(20000)]
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+
+    def test_embedded_time(self):
+        """Test the timestamp prefix is the creation time"""
+        created = uuid7_time(uuid7())
+        assert abs(datetime.now(timezone.utc) - created) < timedelta(seconds=5)
+        with pytest.raises(ValueError):
+            uuid7_time(uuid.uuid4())
+
+    def test_model_default(self, db_session, test_user, test_service):
+        """Test new rows get UUIDv7 keys"""
+        start = datetime.now(timezone.utc) + timedelta(days=500)
+        booking = Booking(
+            user_id=test_user.id, service_id=test_service.id,
+            start_time=start, end_time=start + timedelta(hours=1)
+        )
+        db_session.add(booking)
+        db_session.commit()
+        assert booking.id.version == 7
+
+    def test_seeded_ids(self):
+        """Test seeded ids are deterministic UUIDv7s ordered by row index"""
+        ids = [entity_id(42, "booking", i) for i in range(1000)]
+        assert all(value.version == 7 for value in ids)
+        assert ids == sorted(ids)
+        assert entity_id(42, "booking", 7) == ids[7]
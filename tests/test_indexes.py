@@ -0,0 +1,13 @@
+from benchmarks.check_indexes import check
+
+
+class TestHotQueryIndexes:
+    """Test the hot booking queries are served by dedicated indexes"""
+
+    def test_hot_queries_use_indexes(self, test_db):
+        """Test EXPLAIN shows an expected index for every hot query"""
+        with test_db.connect() as connection:
+            results = check(connection)
+
+        failures = [(name, used) for name, used, ok in results if not ok]
+        assert failures == []
@@ -0,0 +1,100 @@
+import os
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.cache import TTLCache
+from app.core.invalidation import InvalidationBus
+from app.models.cache_generation import CacheGeneration
+
+
+def worker_cache(bus: InvalidationBus, name: str = "catalog") -> TTLCache:
+    cache = TTLCache(name, ttl=60)
+    cache.set("services", ["cached"])
+    bus.register(name, cache)
+    return cache
+
+
+class TestInvalidationBus:
+    """Test cache invalidation across workers"""
+
+    def test_evicts_after_commit_only(self, test_db, db_session):
+        """Test the publishing worker evicts on commit and keeps its cache on rollback"""
+        bus = InvalidationBus(test_db)
+        cache = worker_cache(bus)
+
+        bus.publish(db_session, "catalog", "services")
+        assert len(cache) == 1
+        db_session.rollback()
+        assert len(cache) == 1
+
+        bus.publish(db_session, "catalog", "services")
+        db_session.commit()
+        assert cache.get("services") is None
+
+    def test_generation_fallback(self, test_db, db_session):
+        """Test another worker clears its cache when the generation moved"""
+        publisher, other = InvalidationBus(test_db), InvalidationBus(test_db)
+        worker_cache(publisher)
+        cache = worker_cache(other)
+        other.check_generations()
+
+        publisher.publish(db_session, "catalog")
+        db_session.commit()
+        assert len(cache) == 1  # no LISTEN on SQLite
+
+        other.check_generations()
+        assert len(cache) == 0
+        assert other.stats["generation_resets"] == 1
+
+
+@pytest.mark.skipif(
+    not os.getenv("TEST_POSTGRES_URL"), reason="set TEST_POSTGRES_URL to a migrated PostgreSQL database"
+)
+class TestInvalidationBusPostgres:
+    """Test LISTEN/NOTIFY convergence against a real PostgreSQL"""
+
+    def test_workers_converge_within_milliseconds(self):
+        engine = create_engine(os.environ["TEST_POSTGRES_URL"])
+        CacheGeneration.__table__.create(engine, checkfirst=True)
+        publisher = InvalidationBus(engine, check_interval=3600)
+        workers = [InvalidationBus(engine, check_interval=3600) for _ in range(3)]
+        caches = [worker_cache(bus) for bus in workers]
+        stop = threading.Event()
+
+        def listen(bus):
+            while not stop.is_set():
+                bus.poll(0.05)
+
+        threads = [threading.Thread(target=listen, args=(bus,), daemon=True) for bus in workers]
+        for thread in threads:
+            thread.start()
+        try:
+            deadline = time.monotonic() + 5
+            while any(bus._connection is None for bus in workers) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            for cache in caches:
+                cache.set("services", ["cached"])
+
+            with sessionmaker(bind=engine)() as db:
+                publisher.publish(db, "catalog", "services")
+                time.sleep(0.1)
+                assert all(len(cache) == 1 for cache in caches)  # not before commit
+                db.commit()
+                committed = time.monotonic()
+
+            while any(len(cache) for cache in caches) and time.monotonic() - committed < 1:
+                time.sleep(0.001)
+            elapsed_ms = (time.monotonic() - committed) * 1000
+            assert all(len(cache) == 0 for cache in caches)
+            assert elapsed_ms < 100
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+            for bus in workers:
+                bus._disconnect()
+            engine.dispose()
@@ -0,0 +1,54 @@
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from app.models.booking import Booking, BookingStatus
+from app.services.lifecycle_service import BookingLifecycleService
+
+
+def make_booking(db_session, user, service, start_time, status):
+    booking = Booking(
+        id=uuid4(),
+        user_id=user.id,
+        service_id=service.id,
+        start_time=start_time,
+        end_time=start_time + timedelta(hours=1),
+        status=status
+    )
+    db_session.add(booking)
+    db_session.commit()
+    return booking
+
+
+class TestBookingLifecycle:
+    """Test automatic completion and expiry of past bookings"""
+
+    def test_past_confirmed_booking_completed(self, db_session, test_user, test_service):
+        """Test confirmed bookings that have ended become completed"""
+        past = make_booking(db_session, test_user, test_service, datetime.now() - timedelta(days=2), BookingStatus.CONFIRMED)
+        future = make_booking(db_session, test_user, test_service, datetime.now() + timedelta(days=2), BookingStatus.CONFIRMED)
+
+        totals = BookingLifecycleService(db_session).run(batch_size=1)
+        db_session.expire_all()
+
+        assert totals["completed"] >= 1
+        assert past.status == BookingStatus.COMPLETED
+        assert future.status == BookingStatus.CONFIRMED
+
+    def test_past_pending_booking_expired(self, db_session, test_user, test_service):
+        """Test pending bookings never confirmed before start are cancelled"""
+        stale = make_booking(db_session, test_user, test_service, datetime.now() - timedelta(days=3), BookingStatus.PENDING)
+        upcoming = make_booking(db_session, test_user, test_service, datetime.now() + timedelta(days=3), BookingStatus.PENDING)
+
+        totals = BookingLifecycleService(db_session).run(batch_size=10)
+        db_session.expire_all()
+
+        assert totals["expired"] >= 1
+        assert stale.status == BookingStatus.CANCELLED
+        assert upcoming.status == BookingStatus.PENDING
+
+    def test_batches_are_bounded(self, db_session, test_user, test_service):
+        """Test a single batch never touches more than batch_size rows"""
+        for days in range(3):
+            make_booking(db_session, test_user, test_service, datetime.now() - timedelta(days=10 + days), BookingStatus.CONFIRMED)
+
+        assert BookingLifecycleService(db_session).complete_past_bookings(batch_size=2) == 2
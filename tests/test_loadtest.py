@@ -0,0 +1,41 @@
+import asyncio
+import httpx
+import pytest
+from fastapi import FastAPI
+from benchmarks.loadtest import Recorder, percentile
+
+
+class TestLoadTestReport:
+    """Test the load test latency summary"""
+
+    def test_percentile_nearest_rank(self):
+        """Test nearest-rank percentiles on a sorted sample"""
+        values = [float(i) for i in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 99) == 0.0
+
+    def test_recorder_summary(self):
+        """Test requests are grouped per endpoint with status codes"""
+        app = FastAPI()
+
+        @app.get("/ping")
+        def ping():
+            return {"ok": True}
+
+        async def drive():
+            recorder = Recorder()
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(base_url="http://test", transport=transport) as client:
+                for _ in range(3):
+                    await recorder.request(client, "GET /ping", "GET", "/ping")
+                await recorder.request(client, "GET /missing", "GET", "/missing")
+            return recorder.summary(elapsed=1.0)
+
+        summary = asyncio.run(drive())
+
+        assert summary["total_requests"] == 4
+        assert summary["endpoints"]["GET /ping"]["status_codes"] == {"200": 3}
+        assert summary["endpoints"]["GET /missing"]["status_codes"] == {"404": 1}
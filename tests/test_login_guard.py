@@ -0,0 +1,81 @@
+from fastapi import status
+
+from app.core.login_guard import LoginGuard, get_login_guard
+from app.services import auth_service
+
+
+class TestLoginGuard:
+    """Test login admission control"""
+
+    def test_scores_decay(self):
+        """Test an email is blocked at the limit and released as its score halves"""
+        guard = LoginGuard(max_email_failures=3, max_ip_failures=100, half_life=60, max_entries=10)
+        for _ in range(3):
+            guard.record_failure("A@example.com", "10.0.0.1", now=0.0)
+
+        # 3 * 0.5 ** (t / 60) falls to 2 after 35.1 seconds
+        assert guard.retry_after("a@example.com", "10.0.0.2", now=0.0) == 36
+        assert guard.retry_after("a@example.com", None, now=30.0) > 0
+        assert guard.retry_after("a@example.com", None, now=40.0) == 0
+        assert guard.retry_after("b@example.com", "10.0.0.1", now=0.0) == 0
+
+    def test_ip_limit_and_success_reset(self):
+        """Test many emails from one address trip the IP limit; success clears the email only"""
+        guard = LoginGuard(max_email_failures=2, max_ip_failures=3, half_life=60, max_entries=10)
+        for index in range(3):
+            guard.record_failure(f"user{index}@example.com", "10.0.0.1", now=0.0)
+        assert guard.retry_after("new@example.com", "10.0.0.1", now=0.0) > 0
+
+        guard.record_failure("user0@example.com", "10.0.0.2", now=0.0)
+        guard.record_success("user0@example.com")
+        assert guard.retry_after("user0@example.com", "10.0.0.2", now=0.0) == 0
+        assert guard.snapshot()["rejected"] == 1
+
+    def test_repeat_offender_skips_bcrypt(self, client, test_user, admin_token, monkeypatch):
+        """Test blocked attempts return 429 without verifying the password"""
+        verifies = []
+        real_verify = auth_service.verify_password
+        monkeypatch.setattr(
+            auth_service, "verify_password", lambda *args: verifies.append(args) or real_verify(*args)
+        )
+        wrong = {"email": test_user.email, "password": "wrong-password"}
+        for _ in range(5):
+            assert client.post("/api/v1/auth/login", json=wrong).status_code == status.HTTP_401_UNAUTHORIZED
+        assert len(verifies) == 5
+
+        blocked = client.post(
+            "/api/v1/auth/login", json={"email": test_user.email, "password": "testpassword123"}
+        )
+        assert blocked.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert int(blocked.headers["Retry-After"]) > 0
+        assert len(verifies) == 5
+
+        stats = client.get("/api/v1/admin/stats/login", headers={"Authorization": f"Bearer {admin_token}"})
+        assert stats.json()["bcrypt_avoided"] == 1
+
+    def test_unknown_email_runs_dummy_verify(self, client, monkeypatch):
+        """Test unknown emails still pay one bcrypt verify"""
+        verifies = []
+        real_verify = auth_service.verify_password
+        monkeypatch.setattr(
+            auth_service, "verify_password", lambda *args: verifies.append(args) or real_verify(*args)
+        )
+        response = client.post("/api/v1/auth/login", json={"email": "nobody@example.com", "password": "x"})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert len(verifies) == 1
+        assert get_login_guard().snapshot()["dummy_verifies"] == 1
+
+    def test_ip_score_needs_trusted_addresses(self, client, monkeypatch):
+        """Test failures from many emails only hold off an address when addresses are trusted"""
+        monkeypatch.setattr(get_login_guard(), "max_ip_failures", 2)
+
+        def fail(n):
+            return client.post("/api/v1/auth/login", json={"email": f"nobody{n}@example.com", "password": "x"})
+
+        assert [fail(n).status_code for n in range(3)] == [status.HTTP_401_UNAUTHORIZED] * 3
+
+        monkeypatch.setattr("app.config.settings.settings.forwarded_allow_ips", "127.0.0.1")
+        assert [fail(n).status_code for n in range(3, 6)] == [
+            status.HTTP_401_UNAUTHORIZED, status.HTTP_401_UNAUTHORIZED, status.HTTP_429_TOO_MANY_REQUESTS
+        ]
@@ -0,0 +1,93 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import event
+
+from app.core.security import get_password_hash
+from app.models.booking import Booking, BookingStatus
+from app.models.service import Service
+from app.models.user import User, UserRole
+
+
+def make_bookings(db_session, user, service, count, days=500):
+    start = datetime.now(timezone.utc) + timedelta(days=days)
+    bookings = [
+        Booking(
+            id=uuid.uuid4(), user_id=user.id, service_id=service.id,
+            start_time=start + timedelta(hours=2 * n), end_time=start + timedelta(hours=2 * n + 1),
+            status=BookingStatus.PENDING
+        )
+        for n in range(count)
+    ]
+    db_session.add_all(bookings)
+    db_session.commit()
+    return bookings
+
+
+def other_user(db_session):
+    user = User(
+        id=uuid.uuid4(), name="Other User", email=f"other_{uuid.uuid4().hex[:8]}@example.com",
+        password_hash=get_password_hash("otherpassword123"), role=UserRole.USER
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+class TestMultiGet:
+    """Test fetching several services or bookings by id in one request"""
+
+    def test_services_by_ids(self, client, db_session, test_service):
+        """Test services come back in the order asked, skipping unknown ids"""
+        second = Service(id=uuid.uuid4(), title="Second", price=50, duration_minutes=30, is_active=True)
+        db_session.add(second)
+        db_session.commit()
+
+        ids = [second.id, uuid.uuid4(), test_service.id]
+        response = client.get("/api/v1/services/", params={"ids": ",".join(map(str, ids))})
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()] == [str(second.id), str(test_service.id)]
+
+    def test_bookings_filtered_by_owner(self, client, db_session, test_user, test_service, user_token, admin_token):
+        """Test users only get their own bookings back, admins get all of them"""
+        own = make_bookings(db_session, test_user, test_service, 2)
+        foreign = make_bookings(db_session, other_user(db_session), test_service, 1, days=510)
+        ids = ",".join(str(booking.id) for booking in own + foreign)
+
+        response = client.get("/api/v1/bookings/", params={"ids": ids}, headers={"Authorization": f"Bearer {user_token}"})
+        assert [item["id"] for item in response.json()] == [str(booking.id) for booking in own]
+
+        response = client.get("/api/v1/bookings/", params={"ids": ids}, headers={"Authorization": f"Bearer {admin_token}"})
+        assert len(response.json()) == 3
+
+    def test_bookings_in_one_query(self, client, test_db, db_session, test_user, test_service, user_token):
+        """Test the bookings are resolved with a single query however many ids are asked for"""
+        bookings = make_bookings(db_session, test_user, test_service, 5, days=520)
+        ids = ",".join(str(booking.id) for booking in bookings)
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if "FROM bookings" in statement:
+                statements.append(statement)
+
+        event.listen(test_db, "before_cursor_execute", record)
+        try:
+            response = client.get(
+                "/api/v1/bookings/",
+                params={"ids": ids},
+                headers={"Authorization": f"Bearer {user_token}"}
+            )
+        finally:
+            event.remove(test_db, "before_cursor_execute", record)
+
+        assert len(response.json()) == 5
+        assert len(statements) == 1
+
+    def test_invalid_ids(self, client, monkeypatch):
+        """Test malformed ids and oversized lists are rejected"""
+        monkeypatch.setattr("app.config.settings.settings.multi_get_max_ids", 2)
+
+        assert client.get("/api/v1/services/", params={"ids": "not-a-uuid"}).status_code == 422
+        too_many = ",".join(str(uuid.uuid4()) for _ in range(3))
+        assert client.get("/api/v1/services/", params={"ids": too_many}).status_code == 422
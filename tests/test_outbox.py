@@ -0,0 +1,189 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request, Response
+from sqlalchemy.orm import sessionmaker
+
+from app.models.booking import Booking, BookingStatus
+from app.models.outbox import OutboxEvent
+from app.outbox_worker import OutboxDispatcher
+from app.services.lifecycle_service import BookingLifecycleService
+from app.services.outbox_service import OutboxService
+from app.utils.ids import uuid7
+
+
+def book(client, token, service, days_ahead=1):
+    start_time = datetime.now() + timedelta(days=days_ahead)
+    return client.post(
+        "/api/v1/bookings/",
+        headers={"Authorization": f"Bearer {token}"},
+        json={
+            "service_id": str(service.id),
+            "start_time": start_time.isoformat(),
+            "end_time": (start_time + timedelta(hours=1)).isoformat()
+        }
+    )
+
+
+def events_for(db_session, aggregate_id):
+    db_session.expire_all()
+    return db_session.query(OutboxEvent).filter(OutboxEvent.aggregate_id == aggregate_id).order_by(OutboxEvent.id).all()
+
+
+class StandIn:
+    """Local webhook receiver that fails the first ``failures`` calls and tracks concurrency."""
+
+    def __init__(self, failures: int = 0, delay: float = 0.0):
+        self.failures = failures
+        self.delay = delay
+        self.received = []
+        self.in_flight = self.max_in_flight = 0
+        self.app = FastAPI()
+        self.app.post("/hook")(self.hook)
+
+    async def hook(self, request: Request):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures:
+                self.failures -= 1
+                return Response(status_code=503)
+            self.received.append(await request.json())
+            return Response(status_code=204)
+        finally:
+            self.in_flight -= 1
+
+    def dispatcher(self, test_db, **kwargs) -> OutboxDispatcher:
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=self.app), base_url="http://stand-in")
+        return OutboxDispatcher(
+            webhook_urls=["http://stand-in/hook"], client=client,
+            session_factory=sessionmaker(bind=test_db), **kwargs
+        )
+
+
+async def dispatch(dispatcher: OutboxDispatcher):
+    try:
+        return await dispatcher.dispatch_batch()
+    finally:
+        await dispatcher.client.aclose()
+
+
+@pytest.fixture
+def empty_outbox(db_session):
+    db_session.query(OutboxEvent).delete()
+    db_session.commit()
+
+
+class TestOutboxWrites:
+    """Test events are written in the same transaction as the change"""
+
+    def test_booking_lifecycle_events(self, client, db_session, user_token, test_service):
+        """Test create and cancel each add one event"""
+        response = book(client, user_token, test_service)
+        booking_id = response.json()["id"]
+        client.patch(
+            f"/api/v1/bookings/{booking_id}",
+            headers={"Authorization": f"Bearer {user_token}"},
+            json={"status": "cancelled"}
+        )
+
+        events = events_for(db_session, UUID(booking_id))
+        assert [event.event_type for event in events] == ["booking.created", "booking.cancelled"]
+        assert events[0].payload["id"] == booking_id
+        assert events[1].payload["status"] == "cancelled"
+
+    def test_rejected_write_adds_no_event(self, client, db_session, user_token, test_service):
+        """Test a conflicting booking leaves no event behind"""
+        first = book(client, user_token, test_service, days_ahead=5)
+        assert book(client, user_token, test_service, days_ahead=5).status_code == 409
+
+        db_session.expire_all()
+        count = db_session.query(OutboxEvent).filter(
+            OutboxEvent.event_type == "booking.created",
+            OutboxEvent.payload["service_id"].as_string() == str(test_service.id)
+        ).count()
+        assert first.status_code == 201
+        assert count == 1
+
+    def test_lifecycle_worker_events(self, db_session, test_user, test_service):
+        """Test bulk transitions add one event per booking"""
+        booking = Booking(
+            user_id=test_user.id,
+            service_id=test_service.id,
+            start_time=datetime.now() - timedelta(days=2),
+            end_time=datetime.now() - timedelta(days=2) + timedelta(hours=1),
+            status=BookingStatus.CONFIRMED
+        )
+        db_session.add(booking)
+        db_session.commit()
+
+        BookingLifecycleService(db_session).run(batch_size=100)
+
+        assert [event.event_type for event in events_for(db_session, booking.id)] == ["booking.completed"]
+
+
+class TestOutboxDispatcher:
+    """Test batched delivery to a local webhook stand-in"""
+
+    def add_events(self, db_session, count):
+        outbox = OutboxService(db_session)
+        events = [outbox.add("booking.created", uuid7(), {"n": n}) for n in range(count)]
+        db_session.commit()
+        return events
+
+    def test_delivers_batch(self, db_session, test_db, empty_outbox):
+        """Test every claimed event is posted and marked delivered"""
+        events = self.add_events(db_session, 5)
+        stand_in = StandIn()
+
+        totals = asyncio.run(dispatch(stand_in.dispatcher(test_db)))
+
+        assert totals == {"claimed": 5, "delivered": 5, "failed": 0}
+        assert [body["data"]["n"] for body in stand_in.received] == list(range(5))
+        assert stand_in.received[0]["id"] == str(events[0].id)
+        db_session.expire_all()
+        assert all(event.delivered_at is not None for event in events)
+
+    def test_concurrency_is_bounded(self, db_session, test_db, empty_outbox):
+        """Test no more than ``concurrency`` deliveries are in flight"""
+        self.add_events(db_session, 12)
+        stand_in = StandIn(delay=0.02)
+
+        totals = asyncio.run(dispatch(stand_in.dispatcher(test_db, concurrency=3)))
+
+        assert totals["delivered"] == 12
+        assert stand_in.max_in_flight == 3
+
+    def test_failures_retry_with_backoff(self, db_session, test_db, empty_outbox, monkeypatch):
+        """Test failed events are rescheduled, then delivered on a later attempt"""
+        monkeypatch.setattr("app.config.settings.settings.outbox_backoff_base_seconds", 30)
+        (event,) = self.add_events(db_session, 1)
+        stand_in = StandIn(failures=1)
+
+        assert asyncio.run(dispatch(stand_in.dispatcher(test_db)))["failed"] == 1
+        db_session.expire_all()
+        assert event.attempts == 1 and event.delivered_at is None
+        assert "503" in event.last_error
+        # Not due again until the backoff has passed
+        assert asyncio.run(dispatch(stand_in.dispatcher(test_db)))["claimed"] == 0
+
+        event.available_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        db_session.commit()
+        assert asyncio.run(dispatch(stand_in.dispatcher(test_db)))["delivered"] == 1
+        db_session.expire_all()
+        assert event.attempts == 2 and event.delivered_at is not None
+
+    def test_gives_up_after_max_attempts(self, db_session, test_db, empty_outbox, monkeypatch):
+        """Test events that exhausted their attempts are no longer claimed"""
+        monkeypatch.setattr("app.config.settings.settings.outbox_max_attempts", 1)
+        self.add_events(db_session, 1)
+        stand_in = StandIn(failures=5)
+
+        assert asyncio.run(dispatch(stand_in.dispatcher(test_db)))["failed"] == 1
+        later = datetime.now(timezone.utc) + timedelta(days=1)
+        assert OutboxService(db_session).claim(10, now=later) == []
+
@@ -0,0 +1,25 @@
+import pytest
+from datetime import date
+from app.services.partition_service import BookingPartitionService
+
+
+class TestBookingPartitions:
+    """Test partition maintenance helpers"""
+
+    def test_partition_month_parsing(self):
+        """Test monthly partition names map to their first day"""
+        assert BookingPartitionService._partition_month("bookings_p2025_03") == date(2025, 3, 1)
+        assert BookingPartitionService._partition_month("bookings_default") is None
+
+    def test_months_before(self):
+        """Test month arithmetic across year boundaries"""
+        assert BookingPartitionService._months_before(date(2026, 2, 14), 3) == date(2025, 11, 1)
+        assert BookingPartitionService._months_before(date(2025, 12, 1), -1) == date(2026, 1, 1)
+
+    def test_noop_without_postgres(self, db_session):
+        """Test maintenance is skipped when bookings is not partitioned"""
+        service = BookingPartitionService(db_session)
+
+        assert service.is_partitioned() is False
+        assert service.ensure_partitions() == 0
+        assert service.archive_partitions() == []
@@ -0,0 +1,127 @@
+import os
+import signal
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.ratelimit import RateLimitMiddleware, TokenBucketStore, parse_budgets
+from app.core.security import create_access_token
+
+
+def limited_app(budgets: dict, store: TokenBucketStore = None) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/services/")
+    def catalog():
+        return []
+
+    @app.post("/api/v1/bookings/")
+    def create_booking():
+        return {}
+
+    @app.get("/api/v1/health")
+    def health():
+        return {"status": "healthy"}
+
+    app.add_middleware(RateLimitMiddleware, budgets=budgets, store=store)
+    return app
+
+
+@pytest.fixture(autouse=True)
+def trusted_addresses(monkeypatch):
+    monkeypatch.setattr("app.config.settings.settings.forwarded_allow_ips", "127.0.0.1")
+
+
+class TestTokenBucketStore:
+    """Test the sharded token bucket table"""
+
+    def test_burst_then_refill(self):
+        """Test a bucket allows its burst, then refills at the configured rate"""
+        store = TokenBucketStore(slots=64, shards=4)
+        assert [store.take("k", rate=2, burst=3, now=100.0)[0] for _ in range(4)] == [True, True, True, False]
+        assert store.take("k", rate=2, burst=3, now=100.5)[0]
+        assert not store.take("k", rate=2, burst=3, now=100.5)[0]
+
+    def test_shared_across_fork(self):
+        """Test a forked worker draws from the same buckets"""
+        store = TokenBucketStore(slots=64, shards=4, shared=True)
+        pid = os.fork()
+        if pid == 0:
+            for _ in range(5):
+                store.take("shared", rate=0.001, burst=5)
+            os._exit(0)
+        os.waitpid(pid, 0)
+        assert not store.take("shared", rate=0.001, burst=5)[0]
+
+    def test_fails_open_when_holder_is_killed(self):
+        """Test a shard locked by a killed worker lets requests through instead of blocking"""
+        store = TokenBucketStore(slots=64, shards=1, shared=True, lock_timeout=0.01)
+        pid = os.fork()
+        if pid == 0:
+            store._locks[0].acquire()
+            os.kill(os.getpid(), signal.SIGKILL)
+        os.waitpid(pid, 0)
+
+        started = time.monotonic()
+        assert [store.take("k", rate=0.001, burst=1)[0] for _ in range(3)] == [True, True, True]
+        assert time.monotonic() - started < 1
+        assert store.lock_timeouts == 3
+
+
+class TestRateLimitMiddleware:
+    """Test route-class budgets and RateLimit headers"""
+
+    def test_headers_and_429(self):
+        """Test headers count down and the exhausted bucket answers 429 with Retry-After"""
+        client = TestClient(limited_app({"catalog": (0.5, 2)}))
+
+        first = client.get("/api/v1/services/")
+        assert first.headers["RateLimit-Limit"] == "2"
+        assert first.headers["RateLimit-Remaining"] == "1"
+        assert client.get("/api/v1/services/").status_code == 200
+
+        blocked = client.get("/api/v1/services/")
+        assert blocked.status_code == 429
+        assert blocked.json() == {"detail": "Rate limit exceeded"}
+        assert blocked.headers["Retry-After"] == "2"
+
+    def test_route_classes_are_separate(self):
+        """Test writes have their own budget and health checks are never limited"""
+        client = TestClient(limited_app(parse_budgets('{"catalog": [0.01, 1], "writes": [0.01, 1]}')))
+
+        assert client.get("/api/v1/services/").status_code == 200
+        assert client.get("/api/v1/services/").status_code == 429
+        assert client.post("/api/v1/bookings/").status_code == 200
+        for _ in range(5):
+            response = client.get("/api/v1/health")
+            assert response.status_code == 200
+            assert "RateLimit-Limit" not in response.headers
+
+    def test_keyed_by_token_subject(self):
+        """Test each token subject gets its own bucket from the same address"""
+        client = TestClient(limited_app({"catalog": (0.01, 1)}))
+        first, second = (
+            {"Authorization": f"Bearer {create_access_token({'sub': email})}"}
+            for email in ("a@example.com", "b@example.com")
+        )
+
+        assert client.get("/api/v1/services/", headers=first).status_code == 200
+        assert client.get("/api/v1/services/", headers=first).status_code == 429
+        assert client.get("/api/v1/services/", headers=second).status_code == 200
+        # Anonymous requests share the address bucket, independent of both users
+        assert client.get("/api/v1/services/").status_code == 200
+
+    def test_untrusted_addresses_not_limited(self, monkeypatch):
+        """Test anonymous requests are let through while client addresses are unknown"""
+        monkeypatch.setattr("app.config.settings.settings.forwarded_allow_ips", None)
+        client = TestClient(limited_app({"catalog": (0.01, 1)}))
+        user = {"Authorization": f"Bearer {create_access_token({'sub': 'a@example.com'})}"}
+
+        for _ in range(3):
+            response = client.get("/api/v1/services/")
+            assert response.status_code == 200
+            assert "RateLimit-Limit" not in response.headers
+        assert client.get("/api/v1/services/", headers=user).status_code == 200
+        assert client.get("/api/v1/services/", headers=user).status_code == 429
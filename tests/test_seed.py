@@ -0,0 +1,58 @@
+import pytest
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from sqlalchemy import func
+from app.models.booking import Booking
+from app.models.review import Review
+from app.seed import generate_bookings, seed_data, SEED_PASSWORD
+
+CTX = {
+    "now": datetime(2030, 6, 1, tzinfo=timezone.utc),
+    "first_day": datetime(2030, 5, 1, tzinfo=timezone.utc),
+    "users": 50,
+    "services": 4,
+    "password_hash": "x",
+}
+
+
+class TestSeeder:
+    """Test the synthetic data generator and loader"""
+
+    def test_generation_is_deterministic(self):
+        """Test the same seed and range always produce the same rows"""
+        assert generate_bookings(7, 0, 100, CTX) == generate_bookings(7, 0, 100, CTX)
+        assert generate_bookings(7, 0, 100, CTX) != generate_bookings(8, 0, 100, CTX)
+
+    def test_bookings_do_not_overlap_per_service(self):
+        """Test no two generated bookings of a service overlap"""
+        slots = defaultdict(list)
+        for row in generate_bookings(7, 0, 400, CTX)["bookings"]:
+            slots[row[2]].append((row[3], row[4]))
+
+        for intervals in slots.values():
+            intervals.sort()
+            for (_, previous_end), (next_start, _) in zip(intervals, intervals[1:]):
+                assert previous_end <= next_start
+
+    def test_reviews_only_for_completed(self):
+        """Test reviews are generated only for completed bookings"""
+        chunk = generate_bookings(7, 0, 400, CTX)
+        statuses = {row[0]: row[5].value for row in chunk["bookings"]}
+
+        assert chunk["reviews"]
+        assert all(statuses[review[1]] == "completed" for review in chunk["reviews"])
+
+    def test_seed_sqlite_with_workers(self, test_db, db_session, client):
+        """Test seeding loads all rows through worker processes and seeded users can log in"""
+        report = seed_data(
+            test_db, users=20, services=3, bookings=60,
+            seed=99, workers=2, chunk_size=25, anchor=date(2030, 1, 15)
+        )
+
+        assert report["users"] == 20
+        assert report["bookings"] == 60
+        assert db_session.query(func.count(Booking.id)).filter(Booking.start_time >= datetime(2029, 1, 1)).scalar() >= 60
+        assert db_session.query(func.count(Review.id)).scalar() >= report["reviews"]
+
+        response = client.post("/api/v1/auth/login", json={"email": "user3@bookit.example", "password": SEED_PASSWORD})
+        assert response.status_code == 200
@@ -0,0 +1,127 @@
+import json
+import pytest
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from fastapi import status
+from uuid import uuid4
+from sqlalchemy import event
+
+from app.config.settings import settings
+from app.core.serialization import ORJSONResponse, dump_rows, partial_schema
+from app.models.booking import Booking, BookingStatus
+from app.models.service import Service
+from app.schemas.booking import BookingResponse
+from app.schemas.service import ServiceResponse
+
+
+class TestFastJSONSerialization:
+    """Test the orjson list serialization path matches the default output"""
+
+    def test_booking_rows_match_pydantic_json(self):
+        """Test UUIDs, UTC datetimes and enum status encode like Pydantic"""
+        now = datetime(2030, 1, 1, 9, 30, tzinfo=timezone.utc)
+        booking = Booking(
+            id=uuid4(),
+            user_id=uuid4(),
+            service_id=uuid4(),
+            start_time=now,
+            end_time=now + timedelta(hours=1),
+            status=BookingStatus.CONFIRMED,
+            created_at=now,
+        )
+
+        body = json.loads(ORJSONResponse(content=dump_rows(BookingResponse, [booking])).body)
+        expected = BookingResponse.model_validate(booking).model_dump(mode="json")
+
+        assert body == [expected]
+        assert body[0]["start_time"] == "2030-01-01T09:30:00Z"
+        assert body[0]["status"] == "confirmed"
+
+    def test_service_decimal_price(self):
+        """Test Numeric price is emitted as a JSON number"""
+        service = Service(
+            id=uuid4(),
+            title="Haircut",
+            price=Decimal("49.99"),
+            duration_minutes=30,
+            is_active=True,
+            created_at=datetime.now(timezone.utc),
+        )
+
+        body = json.loads(ORJSONResponse(content=dump_rows(ServiceResponse, [service])).body)
+
+        assert body[0]["price"] == 49.99
+        assert body[0]["id"] == str(service.id)
+
+    def test_list_endpoint_with_fast_json(self, client, test_service, monkeypatch):
+        """Test GET /services returns the same payload through the fast path"""
+        default_response = client.get("/api/v1/services/")
+
+        monkeypatch.setattr(settings, "fast_json_responses", True)
+        fast_response = client.get("/api/v1/services/")
+
+        assert fast_response.status_code == status.HTTP_200_OK
+        assert fast_response.json() == default_response.json()
+
+
+class TestSparseFieldsets:
+    """Test ?fields= trims responses and the columns loaded"""
+
+    def test_partial_schema_is_cached(self):
+        """Test one trimmed model (and serializer) is built per field set"""
+        first = partial_schema(BookingResponse, ("id", "status"))
+        assert partial_schema(BookingResponse, ("id", "status")) is first
+        assert set(first.model_fields) == {"id", "status"}
+
+    def test_booking_list_fields(self, client, db_session, test_user, test_service, user_token, test_db):
+        """Test only the requested fields (plus id) are returned and selected"""
+        start = datetime.now(timezone.utc) + timedelta(days=600)
+        booking = Booking(
+            id=uuid4(), user_id=test_user.id, service_id=test_service.id,
+            start_time=start, end_time=start + timedelta(hours=1), status=BookingStatus.PENDING
+        )
+        db_session.add(booking)
+        db_session.commit()
+        db_session.expunge_all()
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if "FROM bookings" in statement:
+                statements.append(statement)
+
+        event.listen(test_db, "before_cursor_execute", record)
+        try:
+            response = client.get(
+                "/api/v1/bookings/",
+                params={"fields": "start_time,status"},
+                headers={"Authorization": f"Bearer {user_token}"}
+            )
+        finally:
+            event.remove(test_db, "before_cursor_execute", record)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert all(set(item) == {"id", "start_time", "status"} for item in response.json())
+        assert len(statements) == 1
+        assert "created_at" not in statements[0] and "end_time" not in statements[0]
+
+    def test_service_detail_fields(self, client, db_session, test_service):
+        """Test a detail endpoint with a field set skips unrequested columns"""
+        service_id = test_service.id
+        db_session.expunge_all()
+
+        response = client.get(f"/api/v1/services/{service_id}", params={"fields": "title,price"})
+
+        assert response.json() == {"id": str(service_id), "title": "Test Service", "price": 100.0}
+
+    def test_catalog_fields(self, client, test_service):
+        """Test the cached catalog is trimmed to the field set"""
+        response = client.get("/api/v1/services/", params={"fields": "title"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert all(set(item) == {"id", "title"} for item in response.json())
+
+    def test_unknown_field(self, client, test_service):
+        """Test fields outside the response schema are rejected"""
+        response = client.get(f"/api/v1/services/{test_service.id}", params={"fields": "title,password_hash"})
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
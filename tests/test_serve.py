@@ -0,0 +1,22 @@
+from app.config.settings import settings
+from app.serve import connections_per_worker, plan_workers
+
+
+class TestWorkerPlanning:
+    """Test the production server's worker auto-sizing"""
+
+    def test_defaults_to_one_worker_per_cpu(self):
+        """Test workers default to the CPU count when the DB budget is unknown"""
+        assert plan_workers(None, cpus=8, max_connections=None) == 8
+        assert plan_workers(3, cpus=8, max_connections=None) == 3
+
+    def test_capped_by_connection_budget(self):
+        """Test workers are capped so their pools fit in max_connections"""
+        max_connections = settings.db_reserved_connections + 4 * connections_per_worker()
+
+        assert plan_workers(None, cpus=16, max_connections=max_connections) == 4
+        assert plan_workers(2, cpus=16, max_connections=max_connections) == 2
+
+    def test_at_least_one_worker(self):
+        """Test a tiny max_connections still runs one worker"""
+        assert plan_workers(None, cpus=4, max_connections=1) == 1
@@ -163,4 +163,23 @@ class TestServiceManagement:
             json=service_data
         )
         
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
\ No newline at end of file
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    
+    def test_service_duration_must_be_bookable(self, client, admin_token, test_service):
+        """Test services cannot be longer than the longest allowed booking"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        too_long = 24 * 60 + 1
+
+        response = client.post(
+            "/api/v1/services/",
+            headers=headers,
+            json={"title": "Retreat", "price": 500, "duration_minutes": too_long}
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+        response = client.patch(
+            f"/api/v1/services/{test_service.id}",
+            headers=headers,
+            json={"duration_minutes": too_long}
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,219 @@
+import uuid
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, status
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config import database
+from app.config.database import LazySession, get_db
+from app.core.routing import SessionReleasingRoute
+from app.core.security import create_access_token
+from app.main import app
+from app.models.service import Service
+from app.schemas.service import ServiceResponse
+
+
+class PoolSnapshot(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    checked_out: int
+
+
+class PoolProbe:
+    """Reports pool occupancy when the response is validated and serialized"""
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    @property
+    def checked_out(self):
+        return self.engine.pool.checkedout()
+
+
+@pytest.fixture
+def probe_engine(monkeypatch):
+    engine = create_engine("sqlite:///./test.db")
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(bind=engine))
+    yield engine
+    engine.dispose()
+
+
+def probe_app(engine, route_class):
+    router = APIRouter(route_class=route_class)
+    # Keeps objects alive in the identity map past the endpoint, like current_user
+    held = []
+
+    @router.get("/probe", response_model=PoolSnapshot)
+    def probe(db: Session = Depends(get_db)):
+        db.execute(text("SELECT 1"))
+        return PoolProbe(engine)
+
+    @router.get("/unused", response_model=PoolSnapshot)
+    def unused(db: Session = Depends(get_db)):
+        return PoolProbe(engine)
+
+    @router.post("/services", response_model=ServiceResponse)
+    def create_two(db: Session = Depends(get_db)):
+        first, second = (
+            Service(id=uuid.uuid4(), title=title, price=10, duration_minutes=30, is_active=True)
+            for title in ("Kept", "Other")
+        )
+        db.add_all([first, second])
+        db.commit()
+        held.append(second)
+        return first
+
+    @router.post("/duplicate")
+    def duplicate(db: Session = Depends(get_db)):
+        service = Service(id=uuid.uuid4(), title="Original", price=10, duration_minutes=30, is_active=True)
+        db.add(service)
+        db.commit()
+        db.add(Service(id=service.id, title="Copy", price=10, duration_minutes=30, is_active=True))
+        db.commit()
+
+    probe_app = FastAPI()
+    probe_app.include_router(router)
+    return probe_app
+
+
+def count_selects(engine, table):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT") and f"FROM {table}" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    return statements
+
+
+class TestLazySession:
+    """Test lazy sessions are released before response serialization"""
+
+    def test_connection_released_before_serialization(self, probe_engine):
+        """Test the connection is back in the pool while the response is serialized"""
+        client = TestClient(probe_app(probe_engine, SessionReleasingRoute))
+
+        assert client.get("/probe").json() == {"checked_out": 0}
+
+    def test_default_route_holds_connection(self, probe_engine):
+        """Test the plain route keeps the connection through serialization"""
+        client = TestClient(probe_app(probe_engine, APIRoute))
+
+        assert client.get("/probe").json() == {"checked_out": 1}
+
+    def test_unused_session_never_checks_out(self, probe_engine, monkeypatch):
+        """Test a declared but unused session never creates a Session"""
+        created = []
+        factory = sessionmaker(bind=probe_engine)
+        monkeypatch.setattr(database, "SessionLocal", lambda: created.append(1) or factory())
+        client = TestClient(probe_app(probe_engine, SessionReleasingRoute))
+
+        assert client.get("/unused").status_code == status.HTTP_200_OK
+        assert created == []
+
+    def test_released_objects_stay_readable(self, test_db):
+        """Test attributes expired by commit are loaded before the session is closed"""
+        db = LazySession(sessionmaker(bind=test_db))
+        service = Service(id=uuid.uuid4(), title="Lazy", price=10, duration_minutes=30, is_active=True)
+        db.add(service)
+        db.commit()
+
+        db.release(keep=[service])
+
+        assert service.title == "Lazy"
+        assert service.created_at is not None
+        assert test_db.pool.checkedout() == 0
+
+    def test_api_with_real_dependency(self, probe_engine, test_service):
+        """Test API routes work end to end with the lazy session"""
+        with TestClient(app) as client:
+            response = client.get(f"/api/v1/services/{test_service.id}")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["id"] == str(test_service.id)
+        assert probe_engine.pool.checkedout() == 0
+
+
+    def test_only_returned_objects_reloaded(self, test_db, probe_engine):
+        """Test release refreshes what the endpoint returns and nothing else"""
+        client = TestClient(probe_app(probe_engine, SessionReleasingRoute))
+        selects = count_selects(probe_engine, "services")
+
+        response = client.post("/services")
+
+        assert response.json()["title"] == "Kept"
+        assert len(selects) == 1
+
+    def test_failed_flush_surfaces_real_error(self, test_db, probe_engine):
+        """Test a failed commit raises its own error and still returns the connection"""
+        client = TestClient(probe_app(probe_engine, SessionReleasingRoute))
+
+        with pytest.raises(IntegrityError):
+            client.post("/duplicate")
+        assert probe_engine.pool.checkedout() == 0
+
+    def test_api_write_with_real_dependency(self, probe_engine, test_admin, test_service):
+        """Test a write through the API returns the committed object with the lazy session"""
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': test_admin.email})}"}
+        with TestClient(app) as client:
+            response = client.patch(
+                f"/api/v1/services/{test_service.id}", headers=headers, json={"title": "Renamed"}
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["title"] == "Renamed"
+        assert probe_engine.pool.checkedout() == 0
+
+    def test_export_streams_on_its_own_session(self, probe_engine, test_admin):
+        """Test the export does not reopen the released request session while streaming"""
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': test_admin.email})}"}
+        begun = []
+
+        def record(session, transaction, connection):
+            begun.append(session)
+
+        event.listen(Session, "after_begin", record)
+        try:
+            with TestClient(app) as client:
+                response = client.get(
+                    "/api/v1/bookings/export", headers=headers,
+                    params={"from": "2031-01-01T00:00:00", "to": "2031-01-02T00:00:00"}
+                )
+        finally:
+            event.remove(Session, "after_begin", record)
+
+        assert response.status_code == status.HTTP_200_OK
+        # One transaction for the admin lookup, one for the rows, each on its own session
+        assert len(begun) == len(set(begun)) == 2
+        assert probe_engine.pool.checkedout() == 0
+
+
+class TestDatabaseUrl:
+    """Test DATABASE_URL normalization and DB_DRIVER selection"""
+
+    def test_postgres_scheme(self, monkeypatch):
+        """Test the postgres:// scheme handed out by some hosts is accepted"""
+        monkeypatch.setattr(database.settings, "database_url", "postgres://app:s3cret@db/bookit")
+        monkeypatch.setattr(database.settings, "db_driver", None)
+        assert database.database_url() == "postgresql://app:s3cret@db/bookit"
+
+    def test_driver_selection(self, monkeypatch):
+        """Test DB_DRIVER picks the PostgreSQL driver and leaves SQLite alone"""
+        monkeypatch.setattr(database.settings, "database_url", "postgresql+psycopg2://app@db/bookit")
+        monkeypatch.setattr(database.settings, "db_driver", "psycopg")
+        assert database.database_url() == "postgresql+psycopg://app@db/bookit"
+
+        monkeypatch.setattr(database.settings, "database_url", "sqlite:///./test.db")
+        assert database.database_url() == "sqlite:///./test.db"
+
+    def test_unknown_driver(self, monkeypatch):
+        """Test an unsupported DB_DRIVER is rejected"""
+        monkeypatch.setattr(database.settings, "database_url", "postgresql://app@db/bookit")
+        monkeypatch.setattr(database.settings, "db_driver", "asyncpg")
+        with pytest.raises(ValueError):
+            database.database_url()
@@ -0,0 +1,43 @@
+import json
+import os
+import subprocess
+import sys
+
+from app.startup_report import cumulative_ms, measure_imports, parse_importtime, summarize
+
+# Cold-start budget for `import app.main`; override with STARTUP_BUDGET_MS on slow machines
+STARTUP_BUDGET_MS = float(os.environ.get("STARTUP_BUDGET_MS", 3000))
+
+
+class TestStartupBudget:
+    """Test cold-start import time stays within budget"""
+
+    def test_parse_importtime(self):
+        """Test -X importtime output is parsed with nesting depth"""
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   app.config.settings\n"
+            "import time:       300 |        420 | app.config\n"
+        )
+
+        records = parse_importtime(output)
+
+        assert [(r.module, r.depth) for r in records] == [("app.config.settings", 1), ("app.config", 0)]
+        assert cumulative_ms(records, "app.config") == 0.42
+        assert summarize(records, "app.config")["packages"] == [{"package": "app", "ms": 0.4}]
+
+    def test_crypto_libraries_loaded_lazily(self):
+        """Test importing the app does not import passlib or jose"""
+        code = (
+            "import json, sys, app.main; "
+            "print(json.dumps([m for m in ('passlib', 'jose', 'cryptography') if m in sys.modules]))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert json.loads(result.stdout) == []
+
+    def test_cold_start_import_time(self):
+        """Test importing app.main in a fresh interpreter stays under the budget"""
+        total_ms = cumulative_ms(measure_imports("app.main"), "app.main")
+
+        assert total_ms < STARTUP_BUDGET_MS, f"import app.main took {total_ms:.0f} ms"
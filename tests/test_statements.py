@@ -0,0 +1,93 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from app.config.database import StatementCacheStats
+from app.models.booking import Booking, BookingStatus
+from app.models.review import Review
+from app.services.statements import (
+    BOOKING_WITH_REVIEW, SERVICE_WITH_CONFLICT, get_booking_by_id, get_service_by_id, get_user_by_email
+)
+
+
+class TestCachedStatements:
+    """Test the prebuilt hot-query statements"""
+
+    def test_user_by_email(self, db_session, test_user):
+        """Test looking up a user by email"""
+        assert get_user_by_email(db_session, test_user.email).id == test_user.id
+        assert get_user_by_email(db_session, "missing@example.com") is None
+
+    def test_active_service_by_id(self, db_session, test_service):
+        """Test inactive services are only returned without active_only"""
+        test_service.is_active = False
+        db_session.commit()
+
+        assert get_service_by_id(db_session, test_service.id).id == test_service.id
+        assert get_service_by_id(db_session, test_service.id, active_only=True) is None
+
+    def test_booking_by_id_and_owner(self, db_session, test_user, test_service):
+        """Test the owner filter hides other users' bookings"""
+        start = datetime.now(timezone.utc) + timedelta(days=400)
+        booking = Booking(
+            id=uuid.uuid4(), user_id=test_user.id, service_id=test_service.id,
+            start_time=start, end_time=start + timedelta(hours=1), status=BookingStatus.PENDING
+        )
+        db_session.add(booking)
+        db_session.commit()
+
+        assert get_booking_by_id(db_session, booking.id).id == booking.id
+        assert get_booking_by_id(db_session, booking.id, test_user.id).id == booking.id
+        assert get_booking_by_id(db_session, booking.id, uuid.uuid4()) is None
+
+    def test_compiled_cache_hits(self, test_db, db_session, test_user):
+        """Test repeated executions are served from the compiled cache"""
+        stats = StatementCacheStats(test_db)
+
+        for _ in range(5):
+            get_user_by_email(db_session, test_user.email)
+
+        snapshot = stats.snapshot()
+        assert snapshot["hits"] >= 4
+        assert snapshot["capacity"] > 0
+        assert snapshot["hit_ratio"] >= 0.8
+
+
+class TestCombinedLookups:
+    """Test the single-round-trip lookups used on booking and review writes"""
+
+    def test_service_with_conflict(self, db_session, test_user, test_service):
+        """Test the conflict flag follows existing bookings for the slot"""
+        start = datetime.now(timezone.utc) + timedelta(days=300)
+        params = {
+            "service_id": test_service.id, "start_time": start,
+            "end_time": start + timedelta(hours=1), "window_start": start - timedelta(hours=24)
+        }
+        service, conflict = db_session.execute(SERVICE_WITH_CONFLICT, params).first()
+        assert service.id == test_service.id
+        assert not conflict
+
+        db_session.add(Booking(
+            user_id=test_user.id, service_id=test_service.id, start_time=start + timedelta(minutes=30),
+            end_time=start + timedelta(minutes=90), status=BookingStatus.CONFIRMED
+        ))
+        db_session.commit()
+        assert db_session.execute(SERVICE_WITH_CONFLICT, params).first().conflict
+
+    def test_booking_with_review(self, db_session, test_user, test_service):
+        """Test the reviewed flag and the owner filter"""
+        start = datetime.now(timezone.utc) - timedelta(days=300)
+        booking = Booking(
+            user_id=test_user.id, service_id=test_service.id, start_time=start,
+            end_time=start + timedelta(hours=1), status=BookingStatus.COMPLETED
+        )
+        db_session.add(booking)
+        db_session.commit()
+        params = {"booking_id": booking.id, "user_id": test_user.id}
+
+        assert db_session.execute(BOOKING_WITH_REVIEW, params).first().reviewed is False
+        db_session.add(Review(booking_id=booking.id, rating=5))
+        db_session.commit()
+        assert db_session.execute(BOOKING_WITH_REVIEW, params).first().reviewed is True
+        assert db_session.execute(
+            BOOKING_WITH_REVIEW, {"booking_id": booking.id, "user_id": uuid.uuid4()}
+        ).first() is None
@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta, timezone
+from fastapi import status
+
+from app.models.booking import Booking, BookingStatus
+from app.models.booking_stats import BookingDailyStats
+from app.services.lifecycle_service import BookingLifecycleService
+from app.services.stats_service import BookingStatsService
+
+
+def _slot(days: int) -> datetime:
+    return (datetime.now(timezone.utc) + timedelta(days=days)).replace(hour=10, minute=0, second=0, microsecond=0)
+
+
+class TestBookingStats:
+    """Test the incrementally maintained daily booking summary"""
+
+    def _daily(self, client, admin_token, service, day):
+        response = client.get(
+            "/api/v1/admin/stats/daily",
+            params={"from": day.isoformat(), "to": day.isoformat(), "service_id": str(service.id)},
+            headers={"Authorization": f"Bearer {admin_token}"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        return response.json()
+
+    def test_booking_changes_update_summary(self, client, user_token, admin_token, test_service):
+        """Test create, cancel and delete adjust the day's counters"""
+        start = _slot(3)
+        headers = {"Authorization": f"Bearer {user_token}"}
+        created = client.post("/api/v1/bookings/", headers=headers, json={
+            "service_id": str(test_service.id),
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(hours=1)).isoformat()
+        })
+        assert created.status_code == status.HTTP_201_CREATED
+
+        [row] = self._daily(client, admin_token, test_service, start.date())
+        assert row["bookings"] == 1
+        assert row["booked_minutes"] == 60
+        assert row["utilisation"] == round(60 / 480, 4)
+
+        booking_id = created.json()["id"]
+        client.patch(f"/api/v1/bookings/{booking_id}", headers=headers, json={"status": "cancelled"})
+        [row] = self._daily(client, admin_token, test_service, start.date())
+        assert row["cancelled"] == 1
+        assert row["booked_minutes"] == 0
+        assert row["cancellation_rate"] == 1.0
+
+        client.delete(f"/api/v1/bookings/{booking_id}", headers=headers)
+        [row] = self._daily(client, admin_token, test_service, start.date())
+        assert row["bookings"] == 0
+
+    def test_lifecycle_completion_adds_revenue(self, client, db_session, admin_token, test_user, test_service):
+        """Test bulk completion is reflected and matches a full rebuild"""
+        start = _slot(-2)
+        db_session.add(Booking(
+            user_id=test_user.id, service_id=test_service.id, start_time=start,
+            end_time=start + timedelta(hours=1), status=BookingStatus.CONFIRMED
+        ))
+        db_session.commit()
+        stats = BookingStatsService(db_session)
+        written = stats.rebuild(start.date(), start.date() + timedelta(days=1))
+        assert written == db_session.query(BookingDailyStats).filter(BookingDailyStats.day == start.date()).count()
+
+        BookingLifecycleService(db_session).complete_past_bookings(batch_size=1000)
+        [row] = self._daily(client, admin_token, test_service, start.date())
+        assert row["completed"] == 1
+        assert row["revenue"] == 100.0
+
+        stats.rebuild(start.date(), start.date() + timedelta(days=1))
+        assert self._daily(client, admin_token, test_service, start.date()) == [row]
+
+    def test_service_totals(self, client, db_session, admin_token, test_service):
+        """Test per-service totals sum the daily rows"""
+        for offset, bookings in ((10, 2), (11, 3)):
+            db_session.add(BookingDailyStats(
+                day=_slot(offset).date(), service_id=test_service.id, bookings=bookings,
+                cancelled=1, completed=0, booked_minutes=120, revenue=0
+            ))
+        db_session.commit()
+
+        response = client.get(
+            "/api/v1/admin/stats/services",
+            params={"from": _slot(10).date().isoformat(), "to": _slot(11).date().isoformat()},
+            headers={"Authorization": f"Bearer {admin_token}"}
+        )
+        [row] = [row for row in response.json() if row["service_id"] == str(test_service.id)]
+        assert row["bookings"] == 5
+        assert row["cancellation_rate"] == 0.4
+        assert row["utilisation"] == round(240 / 960, 4)
+
+    def test_admin_only_and_range_checks(self, client, user_token, admin_token):
+        """Test regular users are rejected and inverted ranges are 422"""
+        response = client.get("/api/v1/admin/stats/daily", headers={"Authorization": f"Bearer {user_token}"})
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+        response = client.get(
+            "/api/v1/admin/stats/daily", params={"from": "2026-02-01", "to": "2026-01-01"},
+            headers={"Authorization": f"Bearer {admin_token}"}
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,172 @@
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import pytest
+from sqlalchemy import inspect
+
+from app.models.booking import Booking, BookingStatus
+from app.models.booking_tombstone import BookingTombstone
+from app.services.lifecycle_service import BookingLifecycleService
+from app.services.sync_service import NO_ID, SyncToken, encode_token
+
+
+def book(client, token, service, days_ahead):
+    start_time = datetime.now() + timedelta(days=days_ahead)
+    response = client.post(
+        "/api/v1/bookings/",
+        headers={"Authorization": f"Bearer {token}"},
+        json={
+            "service_id": str(service.id),
+            "start_time": start_time.isoformat(),
+            "end_time": (start_time + timedelta(hours=1)).isoformat()
+        }
+    )
+    return response.json()["id"]
+
+
+def old_bookings(db_session, user, service, count, days_ago=200):
+    """Bookings last touched ``days_ago`` days ago, past tombstone retention."""
+    touched = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    start = datetime.now(timezone.utc) + timedelta(days=700)
+    bookings = [
+        Booking(
+            user_id=user.id, service_id=service.id, updated_at=touched + timedelta(seconds=n),
+            start_time=start + timedelta(hours=2 * n), end_time=start + timedelta(hours=2 * n + 1),
+            status=BookingStatus.PENDING
+        )
+        for n in range(count)
+    ]
+    db_session.add_all(bookings)
+    db_session.commit()
+    return [str(booking.id) for booking in bookings]
+
+
+def changes(client, token, since=None, **params):
+    if since is not None:
+        params["since"] = since
+    response = client.get("/api/v1/bookings/changes", params=params, headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@pytest.fixture
+def settled(monkeypatch):
+    monkeypatch.setattr("app.config.settings.settings.sync_settle_seconds", 0)
+
+
+class TestBookingChanges:
+    """Test delta sync of bookings with GET /bookings/changes"""
+
+    def test_full_then_delta(self, client, user_token, test_service, settled):
+        """Test a first sync returns everything, then only what changed since"""
+        first = book(client, user_token, test_service, 600)
+        second = book(client, user_token, test_service, 601)
+
+        page = changes(client, user_token)
+        assert [item["id"] for item in page["changed"]] == [first, second]
+        assert page["deleted"] == [] and page["has_more"] is False
+        assert changes(client, user_token, page["next_token"])["changed"] == []
+
+        client.patch(
+            f"/api/v1/bookings/{first}",
+            headers={"Authorization": f"Bearer {user_token}"},
+            json={"status": "cancelled"}
+        )
+        delta = changes(client, user_token, page["next_token"])
+        assert [(item["id"], item["status"]) for item in delta["changed"]] == [(first, "cancelled")]
+
+    def test_deletions_are_reported(self, client, db_session, user_token, test_service, settled):
+        """Test deleted bookings show up once in ``deleted``"""
+        booking_id = book(client, user_token, test_service, 610)
+        token = changes(client, user_token)["next_token"]
+
+        client.delete(f"/api/v1/bookings/{booking_id}", headers={"Authorization": f"Bearer {user_token}"})
+
+        delta = changes(client, user_token, token)
+        assert delta["changed"] == [] and delta["deleted"] == [booking_id]
+        assert db_session.get(BookingTombstone, UUID(booking_id)) is not None
+        assert changes(client, user_token, delta["next_token"])["deleted"] == []
+
+    def test_paging(self, client, user_token, test_service, settled):
+        """Test pages follow each other without gaps or repeats"""
+        created = [book(client, user_token, test_service, 620 + n) for n in range(5)]
+
+        seen, token = [], None
+        while True:
+            page = changes(client, user_token, token, limit=2)
+            seen += [item["id"] for item in page["changed"]]
+            token = page["next_token"]
+            if not page["has_more"]:
+                break
+        assert seen == created
+
+    def test_idle_user_keeps_syncing(self, client, db_session, test_user, user_token, test_service):
+        """Test a caught-up token stays valid when the newest change is older than retention"""
+        old_bookings(db_session, test_user, test_service, 1)
+
+        token = changes(client, user_token)["next_token"]
+        for _ in range(2):
+            page = changes(client, user_token, token)
+            assert page["changed"] == [] and page["deleted"] == []
+            token = page["next_token"]
+
+    def test_full_sync_over_old_rows(self, client, db_session, test_user, user_token, test_service):
+        """Test paging through rows untouched for longer than retention reaches the end"""
+        created = old_bookings(db_session, test_user, test_service, 5)
+
+        seen, token = [], None
+        while True:
+            page = changes(client, user_token, token, limit=2)
+            seen += [item["id"] for item in page["changed"]]
+            token = page["next_token"]
+            if not page["has_more"]:
+                break
+        assert seen == created
+
+    def test_recent_changes_are_sent_again(self, client, user_token, test_service):
+        """Test a caught-up token stays behind changes that may still be settling"""
+        booking_id = book(client, user_token, test_service, 630)
+
+        page = changes(client, user_token)
+        assert [item["id"] for item in changes(client, user_token, page["next_token"])["changed"]] == [booking_id]
+
+    def test_other_users_changes_are_hidden(self, client, user_token, admin_token, test_service):
+        """Test only the caller's own bookings are synced"""
+        book(client, admin_token, test_service, 640)
+
+        assert changes(client, user_token)["changed"] == []
+
+    def test_lifecycle_transitions_bump_updated_at(self, db_session, test_user, test_service):
+        """Test bulk status updates move updated_at too"""
+        past = datetime.now(timezone.utc) - timedelta(days=2)
+        booking = Booking(
+            user_id=test_user.id, service_id=test_service.id,
+            start_time=past, end_time=past + timedelta(hours=1), status=BookingStatus.CONFIRMED
+        )
+        db_session.add(booking)
+        db_session.commit()
+        before = booking.updated_at
+
+        BookingLifecycleService(db_session).run(batch_size=100)
+        db_session.expire_all()
+
+        assert booking.status == BookingStatus.COMPLETED
+        assert booking.updated_at > before
+
+    def test_bad_tokens(self, client, user_token):
+        """Test malformed tokens are rejected and expired ones ask for a full sync"""
+        headers = {"Authorization": f"Bearer {user_token}"}
+        assert client.get("/api/v1/bookings/changes", params={"since": "garbage"}, headers=headers).status_code == 422
+
+        long_ago = datetime.now(timezone.utc) - timedelta(days=1000)
+        stale = encode_token(SyncToken(long_ago, NO_ID, long_ago))
+        assert client.get("/api/v1/bookings/changes", params={"since": stale}, headers=headers).status_code == 410
+
+    def test_indexed_per_user(self, test_db):
+        """Test changes are looked up through per-user indexes"""
+        inspector = inspect(test_db)
+        booking_indexes = {index["name"]: index["column_names"] for index in inspector.get_indexes("bookings")}
+        tombstone_indexes = {index["name"]: index["column_names"] for index in inspector.get_indexes("booking_tombstones")}
+
+        assert booking_indexes["ix_bookings_user_id_updated_at"] == ["user_id", "updated_at"]
+        assert tombstone_indexes["ix_booking_tombstones_user_id_deleted_at"] == ["user_id", "deleted_at"]
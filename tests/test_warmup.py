@@ -0,0 +1,86 @@
+from fastapi import status
+from sqlalchemy.orm import sessionmaker
+
+from app.core import cache as cache_module, warmup
+from app.core.cache import TTLCache
+from app.main import app
+from app.services.service_service import CATALOG_KEY, catalog_cache
+
+
+class TestWarmUp:
+    """Test startup warm-up and readiness"""
+
+    def test_health_not_ready_until_warm(self, client, monkeypatch):
+        """Test the health check reports 503 while warm-up is running"""
+        monkeypatch.setattr(warmup.state, "ready", False)
+
+        response = client.get("/api/v1/health")
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.json()["status"] == "warming_up"
+
+    def test_warm_up_primes_catalog(self, client, test_db, test_service, monkeypatch):
+        """Test warm-up runs every step, fills the catalog cache and marks ready"""
+        monkeypatch.setattr(warmup.state, "ready", False)
+        monkeypatch.setattr(warmup.state, "process_warmed", False)
+        catalog_cache.clear()
+
+        timings = warmup.warm_up(app, engine=test_db, session_factory=sessionmaker(bind=test_db))
+
+        assert warmup.state.ready is True
+        assert set(timings) >= {
+            "configure_mappers", "build_serializers", "password_hasher", "prefill_pool", "prime_catalog"
+        }
+        cached = catalog_cache.get(CATALOG_KEY)
+        assert any(service["id"] == test_service.id for service in cached)
+
+    def test_workers_skip_steps_done_before_fork(self, test_db, monkeypatch):
+        """Test warm-up after a pre-fork warm_up_process does not repeat its steps"""
+        monkeypatch.setattr(warmup.state, "ready", False)
+        monkeypatch.setattr(warmup.state, "process_warmed", False)
+        calls = []
+        monkeypatch.setattr(warmup, "load_password_hasher", lambda: calls.append("bcrypt"))
+
+        warmup.warm_up_process(app)
+        warmup.warm_up(app, engine=test_db, session_factory=sessionmaker(bind=test_db))
+
+        assert calls == ["bcrypt"]
+        assert warmup.state.ready is True
+
+    def test_catalog_cache_invalidated_on_write(self, client, admin_token):
+        """Test creating a service is visible in the cached listing straight away"""
+        client.get("/api/v1/services/")
+        response = client.post(
+            "/api/v1/services/",
+            headers={"Authorization": f"Bearer {admin_token}"},
+            json={"title": "Fresh Service", "price": 20.0, "duration_minutes": 30}
+        )
+
+        listing = client.get("/api/v1/services/").json()
+
+        assert any(service["id"] == response.json()["id"] for service in listing)
+
+
+class TestTTLCache:
+    """Test the in-process TTL cache"""
+
+    def test_entries_expire(self, monkeypatch):
+        """Test entries are dropped once their TTL has passed"""
+        now = [100.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        cache = TTLCache("test", ttl=10)
+
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+        now[0] += 11
+        assert cache.get("key") is None
+
+    def test_zero_ttl_disables_caching(self):
+        """Test a TTL of 0 always calls the loader"""
+        cache = TTLCache("test", ttl=0)
+        calls = []
+
+        cache.get_or_load("key", lambda: calls.append(1))
+        cache.get_or_load("key", lambda: calls.append(1))
+
+        assert len(calls) == 2